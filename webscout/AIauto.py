@@ -4,15 +4,17 @@ an available LLM provider from the webscout library that doesn't require
 API keys or cookies.
 """
 
-import difflib
 import importlib
 import inspect
 import pkgutil
 import random
+import time
 from typing import Any, Dict, Generator, List, Optional, Tuple, Type, Union
 
 from webscout.AIbase import Provider, Response
 from webscout.exceptions import AllProvidersFailure
+from webscout.model_registry import SharedModelRegistry
+from webscout.routing import HealthRouter, get_health_router
 
 
 def load_providers() -> Tuple[Dict[str, Type[Provider]], set]:
@@ -92,6 +94,9 @@ def _get_models_safely(provider_cls: type) -> List[str]:
 
 provider_map, api_key_providers = load_providers()
 
+# Model lists of every provider, discovered once and shared by all AUTO instances
+MODEL_REGISTRY = SharedModelRegistry("auto", lambda: provider_map, _get_models_safely)
+
 class AUTO(Provider):
     """
     An automatic provider that intelligently selects and utilizes an available
@@ -116,6 +121,7 @@ class AUTO(Provider):
         act: Optional[str] = None,
         exclude: Optional[List[str]] = None,
         print_provider_info: bool = False,
+        router: Optional[HealthRouter] = None,
         **kwargs: Any,
     ):
         """
@@ -138,6 +144,8 @@ class AUTO(Provider):
             act (str, optional): Awesome prompt key. Defaults to None.
             exclude (Optional[list[str]]): List of provider names (uppercase) to exclude. Defaults to None.
             print_provider_info (bool): Whether to print the name of the successful provider. Defaults to False.
+            router (HealthRouter, optional): Health router that orders the fallback queue. Defaults to the
+                process-wide router shared with ``Client`` and the API server.
             **kwargs: Additional keyword arguments for providers.
         """
         self.provider: Provider = None
@@ -155,6 +163,7 @@ class AUTO(Provider):
         self.act: str = act
         self.exclude: list[str] = [e.upper() for e in exclude] if exclude else []
         self.print_provider_info: bool = print_provider_info
+        self.router: HealthRouter = router or get_health_router()
         self.kwargs: dict = kwargs
 
 
@@ -196,42 +205,33 @@ class AUTO(Provider):
             Optional[Tuple[Type[Provider], str]]: A tuple containing the provider class
                                                   and the resolved model name, or None if no match is found.
         """
-        available = [
-            (name, cls) for name, cls in provider_map.items()
-            if name not in self.exclude
-        ]
-
-        if not self.api_key:
-             available = [p for p in available if p[0] not in api_key_providers]
+        registry = MODEL_REGISTRY.current()
+        allowed = self._allowed_providers()
 
-        model_to_provider = {}
-        for p_name, p_cls in available:
-            p_models = _get_models_safely(p_cls)
-            for m in p_models:
-                if m not in model_to_provider:
-                    model_to_provider[m] = p_cls
+        found = registry.find_lower(model, allowed)
+        if found:
+            return provider_map[found[0]], found[1]
 
-        if not model_to_provider:
-            return None
-
-        for m_name in model_to_provider:
-            if m_name.lower() == model.lower():
-                return model_to_provider[m_name], m_name
-
-        for m_name in model_to_provider:
-            if model.lower() in m_name.lower() or m_name.lower() in model.lower():
-                if self.print_provider_info:
-                    print(f"\033[1;33mSubstring match: '{model}' -> '{m_name}'\033[0m")
-                return model_to_provider[m_name], m_name
+        found = registry.find_substring(model, allowed)
+        if found:
+            if self.print_provider_info:
+                print(f"\033[1;33mSubstring match: '{model}' -> '{found[1]}'\033[0m")
+            return provider_map[found[0]], found[1]
 
-        matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
-        if matches:
-            matched_model = matches[0]
+        found = registry.find_fuzzy(model, allowed)
+        if found:
             if self.print_provider_info:
-                print(f"\033[1;33mFuzzy match: '{model}' -> '{matched_model}'\033[0m")
-            return model_to_provider[matched_model], matched_model
+                print(f"\033[1;33mFuzzy match: '{model}' -> '{found[1]}'\033[0m")
+            return provider_map[found[0]], found[1]
         return None
 
+    def _allowed_providers(self) -> set:
+        """Returns the names of providers this instance may use."""
+        return {
+            name for name in provider_map
+            if name not in self.exclude and (self.api_key or name not in api_key_providers)
+        }
+
     def _resolve_provider_and_model(
         self, model: str
     ) -> Tuple[Optional[Type[Provider]], str]:
@@ -262,18 +262,9 @@ class AUTO(Provider):
         if model == "auto":
             return None, "auto"
 
-        available = [
-            (name, cls) for name, cls in provider_map.items()
-            if name not in self.exclude
-        ]
-
-        if not self.api_key:
-             available = [p for p in available if p[0] not in api_key_providers]
-
-        for p_name, p_cls in available:
-            p_models = _get_models_safely(p_cls)
-            if model in p_models:
-                return p_cls, model
+        found = MODEL_REGISTRY.current().find_exact(model, self._allowed_providers())
+        if found:
+            return provider_map[found[0]], model
 
         fuzzy_result = self._fuzzy_resolve_provider_and_model(model)
         if fuzzy_result:
@@ -318,8 +309,9 @@ class AUTO(Provider):
 
         resolved_provider, resolved_model = self._resolve_provider_and_model(self.model)
 
+        # An explicit "Provider/model" is always tried first, even with an open circuit
         queue = []
-        if resolved_provider:
+        if resolved_provider and ("/" in self.model or self.router.allow(resolved_provider.__name__, resolved_model)):
             queue.append((resolved_provider.__name__.upper(), resolved_provider, resolved_model))
 
         all_available = [
@@ -334,10 +326,11 @@ class AUTO(Provider):
 
         model_prio = []
         others = []
+        registry = MODEL_REGISTRY.current()
 
         for name, cls in all_available:
-            p_models = _get_models_safely(cls)
-            if resolved_model != "auto" and resolved_model in p_models:
+            p_models = registry.models(name)
+            if resolved_model != "auto" and registry.has_model(name, resolved_model):
                 model_prio.append((name, cls, resolved_model))
             else:
                 m = resolved_model
@@ -348,10 +341,15 @@ class AUTO(Provider):
                 queue_model = m if m else "auto"
                 others.append((name, cls, queue_model))
 
-        queue.extend(model_prio)
-        queue.extend(others)
+        # Healthy and fast providers first; open circuits are skipped
+        def health_key(candidate):
+            return candidate[1].__name__, candidate[2]
+
+        queue.extend(self.router.order(model_prio, health_key))
+        queue.extend(self.router.order(others, health_key))
 
         for provider_name, provider_class, model_to_use in queue:
+            started = time.perf_counter()
             try:
                 sig = inspect.signature(provider_class.__init__).parameters
                 init_kwargs = {
@@ -386,9 +384,12 @@ class AUTO(Provider):
                     try:
                         first_chunk = next(response)
                     except StopIteration:
+                        self.router.record_failure(provider_class.__name__, model_to_use, time.perf_counter() - started)
                         continue
                     except Exception:
+                        self.router.record_failure(provider_class.__name__, model_to_use, time.perf_counter() - started)
                         continue
+                    self.router.record_success(provider_class.__name__, model_to_use, time.perf_counter() - started)
 
                     def chained_gen() -> Any:
                         if self.print_provider_info:
@@ -409,8 +410,10 @@ class AUTO(Provider):
                     except StopIteration as e:
                         response = e.value
                     except Exception:
+                        self.router.record_failure(provider_class.__name__, model_to_use, time.perf_counter() - started)
                         continue
 
+                self.router.record_success(provider_class.__name__, model_to_use, time.perf_counter() - started)
                 if self.print_provider_info:
                     model = getattr(self.provider, "model", None)
                     provider_class_name = self.provider.__class__.__name__
@@ -420,6 +423,7 @@ class AUTO(Provider):
                         print(f"\033[1;34m{provider_class_name}\033[0m\n")
                 return response
             except Exception:
+                self.router.record_failure(provider_class.__name__, model_to_use, time.perf_counter() - started)
                 continue
 
         raise AllProvidersFailure("All providers failed to process the request")
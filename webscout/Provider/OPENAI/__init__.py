@@ -55,6 +55,9 @@ from webscout.Provider.OPENAI.utils import (
     Choice,
     ChoiceDelta,
     CompletionUsage,
+    FastChatCompletionChunk,
+    FastChoice,
+    FastChoiceDelta,
     FunctionCall,
     ModelData,
     ModelList,
@@ -65,6 +68,7 @@ from webscout.Provider.OPENAI.utils import (
     format_prompt,
     get_last_user_message,
     get_system_prompt,
+    use_fast_chunks,
 )
 from webscout.Provider.OPENAI.venice import Venice
 from webscout.Provider.OPENAI.wisecat import WiseCat
@@ -95,6 +99,10 @@ __all__ = [
     "ToolCallType",
     "ModelData",
     "ModelList",
+    "FastChatCompletionChunk",
+    "FastChoice",
+    "FastChoiceDelta",
+    "use_fast_chunks",
     "format_prompt",
     "get_system_prompt",
     "get_last_user_message",
@@ -1,5 +1,4 @@
 import base64
-import hashlib
 import json
 import random
 import time
@@ -10,6 +9,7 @@ from typing import Any, Dict, Generator, List, Optional, Union
 import requests
 
 # Import base classes and utility structures
+from webscout.Provider.OPENAI import proofofwork
 from webscout.Provider.OPENAI.base import BaseChat, BaseCompletions, OpenAICompatibleProvider, Tool
 from webscout.Provider.OPENAI.utils import (
     ChatCompletion,
@@ -164,15 +164,10 @@ class ChatGPTReversed:
             random.choice(["alert", "ontransitionend", "onprogress"])
         ]
 
-        diff_len = len(difficulty)
-        for i in range(100000):
-            proof_token[3] = i
-            json_data = json.dumps(proof_token)
-            base = base64.b64encode(json_data.encode()).decode()
-            hash_value = hashlib.sha3_512((seed + base).encode()).digest()
-
-            if hash_value.hex()[:diff_len] <= difficulty:
-                return "gAAAAAB" + base
+        # Only the counter (index 3) changes; see proofofwork for the precomputed search
+        base = proofofwork.solve(seed, difficulty, proof_token, index=3, max_iterations=100000)
+        if base is not None:
+            return "gAAAAAB" + base
 
         # Fallback
         fallback_base = base64.b64encode(f'"{seed}"'.encode()).decode()
@@ -5,7 +5,7 @@ from typing import Any, Dict, Generator, List, Optional, Union
 
 from curl_cffi.requests import Session
 
-from webscout.AIutel import sanitize_stream
+from webscout.AIutel import StreamPipeline
 from webscout.Provider.OPENAI.base import BaseChat, BaseCompletions, OpenAICompatibleProvider
 from webscout.Provider.OPENAI.utils import (
     ChatCompletion,
@@ -36,6 +36,14 @@ class Completions(BaseCompletions):
                 return content.replace('\\\\', '\\').replace('\\"', '"')
         return None
 
+    # Built once for every request: the options never change between calls
+    _pipeline = StreamPipeline(
+        intro_value=None, # No simple prefix
+        to_json=False,    # Content is text after extraction
+        content_extractor=_elmo_extractor.__func__, # Use the specific extractor
+        yield_raw_on_error=True,
+    )
+
     def create(
         self,
         *,
@@ -108,15 +116,8 @@ class Completions(BaseCompletions):
             )
             response.raise_for_status()
 
-            # Use sanitize_stream to process the response
-            processed_stream = sanitize_stream(
-                data=response.iter_content(chunk_size=None), # Pass byte iterator
-                intro_value=None, # No simple prefix
-                to_json=False,    # Content is text after extraction
-                content_extractor=self._elmo_extractor, # Use the specific extractor
-                yield_raw_on_error=True,
-                raw=False
-            )
+            # Use the class-level pipeline to process the response
+            processed_stream = self._pipeline(response.iter_content(chunk_size=None)) # Pass byte iterator
 
             prompt_tokens = 0
             completion_tokens = 0
@@ -188,15 +189,8 @@ class Completions(BaseCompletions):
             )
             response.raise_for_status()
 
-            # Use sanitize_stream to process the response and aggregate content
-            processed_stream = sanitize_stream(
-                data=response.iter_content(chunk_size=None), # Pass byte iterator
-                intro_value=None, # No simple prefix
-                to_json=False,    # Content is text after extraction
-                content_extractor=self._elmo_extractor, # Use the specific extractor
-                yield_raw_on_error=True,
-                raw=False
-            )
+            # Use the class-level pipeline to process the response and aggregate content
+            processed_stream = self._pipeline(response.iter_content(chunk_size=None)) # Pass byte iterator
 
             # Aggregate all content
             content = ""
@@ -0,0 +1,249 @@
+"""
+Sentinel proof-of-work solver for the ChatGPT provider.
+
+The challenge asks for a counter such that
+``sha3_512(seed + base64(json.dumps(config)))`` starts with a hex prefix no
+greater than ``difficulty``, where the counter is one element of ``config``.
+Only the counter changes between attempts, so the solver serializes the
+config once: the JSON before the counter is base64-encoded up to its last
+whole 3-byte group and absorbed into a SHA3 state that every attempt copies,
+and the JSON after the counter is pre-encoded for each of the three possible
+alignments. An attempt then encodes only a few bytes around the counter and
+compares raw digest bytes against the difficulty without hex conversion.
+
+Searches can be spread over a shared process pool (``workers`` or
+``WEBSCOUT_POW_WORKERS``) so a server solving challenges does not hold its
+request threads or the GIL; the result is the same counter the serial loop
+would find.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import string
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+DEFAULT_WORKERS = int(os.getenv("WEBSCOUT_POW_WORKERS", "0"))
+DEFAULT_CHUNK = 2000
+
+_HEX = frozenset(string.hexdigits.lower())
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+# (seed, head base64, head remainder, tail base64 per alignment, tail bytes, threshold)
+_Job = Tuple[bytes, bytes, bytes, Tuple[bytes, bytes, bytes], bytes, Tuple[int, bytes, str]]
+
+
+def _threshold(difficulty: str) -> Tuple[int, bytes, str]:
+    """
+    Translate a hex difficulty into a digest byte-prefix bound.
+
+    ``hex(digest)[:n] <= difficulty`` holds exactly when the first
+    ``ceil(n / 2)`` digest bytes are ``<= bytes.fromhex(difficulty + "f")``
+    (the ``"f"`` only pads odd lengths). Difficulties that are not lowercase
+    hex keep the string comparison, returned with a byte length of 0.
+    """
+    if difficulty and set(difficulty) <= _HEX:
+        padded = difficulty + "f" * (len(difficulty) % 2)
+        return len(padded) // 2, bytes.fromhex(padded), difficulty
+    return 0, b"", difficulty
+
+
+def prepare(seed: str, difficulty: str, config: Sequence[Any], index: int = 3) -> _Job:
+    """
+    Precompute the invariant parts of a challenge.
+
+    Args:
+        seed (str): Challenge seed
+        difficulty (str): Hex difficulty
+        config (Sequence): Browser config; ``config[index]`` is the counter
+        index (int): Position of the counter in ``config``
+
+    Returns:
+        A picklable job for :func:`search`
+    """
+    config = list(config)
+    # json.dumps joins list items with ", ", so the config splits cleanly around the counter
+    head = (json.dumps(config[:index])[:-1] + (", " if index else "")).encode()
+    tail = ((", " if index + 1 < len(config) else "") + json.dumps(config[index + 1:])[1:]).encode()
+    cut = len(head) - len(head) % 3
+    tails = tuple(base64.b64encode(tail[k:]) for k in range(3))
+    return (seed.encode(), base64.b64encode(head[:cut]), head[cut:], tails, tail, _threshold(difficulty))
+
+
+def search(job: _Job, start: int, stop: int) -> Optional[Tuple[int, str]]:
+    """
+    Try counters in ``range(start, stop)``.
+
+    Returns:
+        Tuple of (counter, base64 answer) for the first solution, or None
+    """
+    seed, head_b64, rest, tails, tail, (size, bound, difficulty) = job
+    state = hashlib.sha3_512(seed + head_b64)
+    b64encode = base64.b64encode
+    for i in range(start, stop):
+        middle = rest + str(i).encode()
+        k = -len(middle) % 3
+        chunk = b64encode(middle + tail[:k])
+        h = state.copy()
+        h.update(chunk)
+        h.update(tails[k])
+        digest = h.digest()
+        if (digest[:size] <= bound) if size else (digest.hex()[:len(difficulty)] <= difficulty):
+            return i, (head_b64 + chunk + tails[k]).decode()
+    return None
+
+
+def get_pool(workers: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """
+    Return the shared solver pool, or None when solving in-process.
+
+    The pool is created on first use and grown if a larger ``workers`` is requested.
+    """
+    global _pool, _pool_workers
+    workers = DEFAULT_WORKERS if workers is None else workers
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None or _pool_workers < workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the shared solver pool."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool, _pool_workers = None, 0
+
+
+def _submit(pool: ProcessPoolExecutor, job: _Job, max_iterations: int, chunk: int) -> List[Future]:
+    return [pool.submit(search, job, start, min(start + chunk, max_iterations))
+            for start in range(0, max_iterations, chunk)]
+
+
+def solve(
+    seed: str,
+    difficulty: str,
+    config: Sequence[Any],
+    index: int = 3,
+    max_iterations: int = 100000,
+    workers: Optional[int] = None,
+    chunk: int = DEFAULT_CHUNK,
+) -> Optional[str]:
+    """
+    Find the base64 answer to a sentinel challenge.
+
+    Args:
+        seed (str): Challenge seed
+        difficulty (str): Hex difficulty
+        config (Sequence): Browser config; ``config[index]`` is the counter
+        index (int): Position of the counter in ``config``
+        max_iterations (int): Number of counters to try
+        workers (int, optional): Process pool size; 0 or 1 solves in the calling
+            thread. Defaults to ``WEBSCOUT_POW_WORKERS``.
+        chunk (int): Counters per pool task
+
+    Returns:
+        str or None: ``base64(json.dumps(config))`` for the lowest solving counter
+    """
+    job = prepare(seed, difficulty, config, index)
+    pool = get_pool(workers)
+    if pool is None:
+        found = search(job, 0, max_iterations)
+        return found[1] if found else None
+    futures = _submit(pool, job, max_iterations, chunk)
+    try:
+        # Chunks are checked in order, so the lowest counter wins as in the serial loop
+        for future in futures:
+            found = future.result()
+            if found:
+                return found[1]
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def asolve(
+    seed: str,
+    difficulty: str,
+    config: Sequence[Any],
+    index: int = 3,
+    max_iterations: int = 100000,
+    workers: Optional[int] = None,
+    chunk: int = DEFAULT_CHUNK,
+) -> Optional[str]:
+    """Async variant of :func:`solve` that never blocks the event loop."""
+    pool = get_pool(workers)
+    if pool is None:
+        return await asyncio.to_thread(solve, seed, difficulty, config, index, max_iterations, 0, chunk)
+    futures = _submit(pool, prepare(seed, difficulty, config, index), max_iterations, chunk)
+    try:
+        for future in futures:
+            found = await asyncio.wrap_future(future)
+            if found:
+                return found[1]
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _reference(seed: str, difficulty: str, config: Sequence[Any], index: int = 3,
+               max_iterations: int = 100000) -> Optional[str]:
+    """The straightforward loop, kept for the benchmark and as a correctness reference."""
+    config = list(config)
+    for i in range(max_iterations):
+        config[index] = i
+        base = base64.b64encode(json.dumps(config).encode()).decode()
+        if hashlib.sha3_512((seed + base).encode()).digest().hex()[:len(difficulty)] <= difficulty:
+            return base
+    return None
+
+
+if __name__ == "__main__":
+    # Benchmark: hashes/sec of the reference loop, the precomputed solver and
+    # the process pool on an unsolvable challenge, so every counter is tried.
+    import sys
+    import time
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    WORKERS = int(sys.argv[2]) if len(sys.argv) > 2 else max(2, os.cpu_count() or 1)
+    CONFIG = [
+        8020, "Sat, 18 Oct 2026 12:00:00 GMT", None, 0,
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
+        "https://tcr9i.chat.openai.com/v2/35536E1E-65B4-4D96-9D97-6ADB7EFF8147/api.js",
+        "dpl=1440a687921de39ff5ee56b92807faaadce73f13", "en", "en-US", None,
+        "plugins−[object PluginArray]", "_reactListeningcfilawjnerp", "alert",
+    ]
+    SEED = "0.8371942657391"
+
+    for difficulty in ("0fffff", "00ffff", "000fff", "00a"):
+        assert solve(SEED, difficulty, CONFIG, max_iterations=20000, workers=0) == \
+            _reference(SEED, difficulty, CONFIG, max_iterations=20000), difficulty
+        assert solve(SEED, difficulty, CONFIG, max_iterations=20000, workers=2) == \
+            _reference(SEED, difficulty, CONFIG, max_iterations=20000), difficulty
+
+    def bench(label, func):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<24} {N / elapsed / 1000:8.1f}k hashes/s  ({elapsed:.2f}s for {N} counters)")
+
+    HARD = "0" * 16  # practically unsolvable
+    get_pool(WORKERS)  # start the workers outside the timed run
+    bench("reference loop", lambda: _reference(SEED, HARD, CONFIG, max_iterations=N))
+    bench("precomputed solver", lambda: solve(SEED, HARD, CONFIG, max_iterations=N, workers=0))
+    bench(f"process pool ({WORKERS})", lambda: solve(SEED, HARD, CONFIG, max_iterations=N, workers=WORKERS))
+    shutdown_pool()
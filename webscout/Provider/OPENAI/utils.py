@@ -1,9 +1,19 @@
+import os
+import sys
 import time
 import uuid
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from webscout.Provider.OPENAI.pydantic_imports import BaseModel, Field, StrictInt, StrictStr
+import orjson
+
+from webscout.Provider.OPENAI.pydantic_imports import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictInt,
+    StrictStr,
+)
 
 # --- OpenAI Response Structure Mimics ---
 # Moved here for reusability across different OpenAI-compatible providers
@@ -37,6 +47,7 @@ class CompletionUsage(BaseModel):
 
 class ChoiceDelta(BaseModel):
     """Delta content in streaming response."""
+    model_config = ConfigDict(from_attributes=True)  # also accept FastChoiceDelta
     content: Optional[StrictStr] = None
     function_call: Optional[FunctionCall] = None
     role: Optional[StrictStr] = None
@@ -71,6 +82,7 @@ class ChatCompletionMessage(BaseModel):
 
 class Choice(BaseModel):
     """Choice in completion response."""
+    model_config = ConfigDict(from_attributes=True)  # also accept FastChoice
     index: StrictInt
     message: Optional[ChatCompletionMessage] = None
     delta: Optional[ChoiceDelta] = None
@@ -190,6 +202,169 @@ class ChatCompletionChunk(BaseModel):
     usage: Optional[Dict[str, Any]] = None  # Add usage field for streaming chunks
 
 
+# --- Validation-free streaming chunks ---
+# Streaming providers build a delta, a choice and a chunk for every token. The
+# pydantic models above validate each of them; the classes below are plain
+# __slots__ objects with the same attributes, defaults and dump methods. Enable
+# them for the whole OPENAI family with WEBSCOUT_FAST_CHUNKS=true or
+# use_fast_chunks(). Run ``python -m webscout.Provider.OPENAI.utils`` to
+# benchmark both.
+
+def _dump_value(value: Any, exclude_none: bool) -> Any:
+    if isinstance(value, list):
+        return [_dump_value(item, exclude_none) for item in value]
+    if hasattr(value, "model_dump"):
+        return value.model_dump(exclude_none=exclude_none)
+    return value
+
+
+class _FastModel:
+    """Attribute, dict-like and pydantic-style dump API over ``__slots__``."""
+    __slots__ = ()
+
+    def model_dump(self, exclude_none: bool = False, **kwargs: Any) -> Dict[str, Any]:
+        """Return the fields as a dict, like pydantic's ``model_dump``."""
+        out = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None:
+                if not exclude_none:
+                    out[name] = None
+                continue
+            out[name] = _dump_value(value, exclude_none)
+        return out
+
+    dict = model_dump  # pydantic v1 spelling
+
+    def to_bytes(self, exclude_none: bool = True) -> bytes:
+        """Serialize straight to JSON bytes with orjson."""
+        return orjson.dumps(self.model_dump(exclude_none=exclude_none))
+
+    def model_dump_json(self, exclude_none: bool = False, **kwargs: Any) -> str:
+        """Return the JSON text, like pydantic's ``model_dump_json``."""
+        return self.to_bytes(exclude_none).decode("utf-8")
+
+    json = model_dump_json  # pydantic v1 spelling
+
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-like access."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Allow dict-like assignment."""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return ``self[key]``, or ``default`` for unknown keys."""
+        return getattr(self, key, default) if key in self.__slots__ else default
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return dict-like keys."""
+        return self.__slots__
+
+    def values(self) -> List[Any]:
+        """Return dict-like values."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Return dict-like items."""
+        return [(name, getattr(self, name)) for name in self.__slots__]
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        # Same as iterating a pydantic model: (field, value) pairs
+        return iter(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.values() == other.values()
+
+    __hash__ = None  # mutable, like pydantic models
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+class FastChoiceDelta(_FastModel):
+    """Validation-free counterpart of ``ChoiceDelta``."""
+    __slots__ = ("content", "function_call", "role", "tool_calls")
+
+    def __init__(self, *, content: Optional[str] = None, function_call: Optional[FunctionCall] = None,
+                 role: Optional[str] = None, tool_calls: Optional[List[ToolCall]] = None):
+        self.content = content
+        self.function_call = function_call
+        self.role = role
+        self.tool_calls = tool_calls
+
+
+class FastChoice(_FastModel):
+    """Validation-free counterpart of ``Choice``."""
+    __slots__ = ("index", "message", "delta", "finish_reason", "logprobs")
+
+    def __init__(self, *, index: int, message: Optional[ChatCompletionMessage] = None,
+                 delta: Optional[ChoiceDelta] = None, finish_reason: Optional[str] = None,
+                 logprobs: Optional[Dict[str, Any]] = None):
+        self.index = index
+        self.message = message
+        self.delta = delta
+        self.finish_reason = finish_reason
+        self.logprobs = logprobs
+
+
+class FastChatCompletionChunk(_FastModel):
+    """Validation-free counterpart of ``ChatCompletionChunk``."""
+    __slots__ = ("model", "choices", "id", "created", "object", "system_fingerprint", "usage")
+
+    def __init__(self, *, model: str, choices: List[Choice], id: Optional[str] = None,
+                 created: Optional[int] = None, object: str = "chat.completion.chunk",
+                 system_fingerprint: Optional[str] = None, usage: Optional[Dict[str, Any]] = None):
+        self.model = model
+        self.choices = choices
+        self.id = f"chatcmpl-{str(uuid.uuid4())}" if id is None else id
+        self.created = int(time.time()) if created is None else created
+        self.object = object
+        self.system_fingerprint = system_fingerprint
+        self.usage = usage
+
+
+# Every chunk class the server's SSE encoder handles natively
+CHUNK_TYPES = (ChatCompletionChunk, FastChatCompletionChunk)
+
+_PYDANTIC_CHUNK_CLASSES = {"ChoiceDelta": ChoiceDelta, "Choice": Choice, "ChatCompletionChunk": ChatCompletionChunk}
+_FAST_CHUNK_CLASSES = {"ChoiceDelta": FastChoiceDelta, "Choice": FastChoice, "ChatCompletionChunk": FastChatCompletionChunk}
+_FAMILY_PACKAGE = "webscout.Provider.OPENAI"
+
+
+def use_fast_chunks(enabled: bool = True) -> None:
+    """Switch the OPENAI provider family between pydantic and fast chunk classes.
+
+    Rebinds ``ChoiceDelta``, ``Choice`` and ``ChatCompletionChunk`` in this
+    module and in every already imported ``webscout.Provider.OPENAI`` module;
+    provider modules imported later pick the names up from here. Non-streaming
+    ``ChatCompletion`` objects stay pydantic and accept fast choices.
+    """
+    current, target = (
+        (_PYDANTIC_CHUNK_CLASSES, _FAST_CHUNK_CLASSES) if enabled
+        else (_FAST_CHUNK_CLASSES, _PYDANTIC_CHUNK_CLASSES)
+    )
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == _FAMILY_PACKAGE or module_name.startswith(_FAMILY_PACKAGE + ".")):
+            continue
+        namespace = vars(module)
+        for name, cls in current.items():
+            if namespace.get(name) is cls:
+                namespace[name] = target[name]
+
+
+if os.getenv("WEBSCOUT_FAST_CHUNKS", "false").lower() == "true":
+    use_fast_chunks()
+
+
 # --- Helper Functions ---
 
 def format_prompt(messages: List[Dict[str, Any]], add_special_tokens: bool = False,
@@ -312,3 +487,44 @@ def count_tokens(text_or_messages: Any) -> int:
     else:
         return 0
 
+
+
+if __name__ == "__main__":
+    # Benchmark: per-chunk construction time, allocation and serialization of the
+    # pydantic chunk models vs the __slots__ fast chunks.
+    import tracemalloc
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    variants = (("pydantic", _PYDANTIC_CHUNK_CLASSES), ("fast", _FAST_CHUNK_CLASSES))
+
+    def build(classes: Dict[str, Any], count: int) -> List[Any]:
+        chunk_cls, choice_cls, delta_cls = classes["ChatCompletionChunk"], classes["Choice"], classes["ChoiceDelta"]
+        return [
+            chunk_cls(
+                id="chatcmpl-bench", created=1700000000, model="bench-model",
+                choices=[choice_cls(index=0, delta=delta_cls(content=f" token{i % 97}"))],
+            )
+            for i in range(count)
+        ]
+
+    for label, classes in variants:
+        start = time.perf_counter()
+        chunks = build(classes, N)
+        construct = (time.perf_counter() - start) / N
+        del chunks
+
+        tracemalloc.start()
+        chunks = build(classes, 10_000)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for chunk in chunks:
+            orjson.dumps(chunk.model_dump(exclude_none=True))
+        serialize = (time.perf_counter() - start) / len(chunks)
+        print(
+            f"{label:<9} construct {construct * 1e6:6.2f}us/chunk  "
+            f"retained {retained / len(chunks):6.0f}B/chunk  peak {peak / len(chunks):6.0f}B/chunk  "
+            f"dump+orjson {serialize * 1e6:6.2f}us/chunk"
+        )
+        del chunks
@@ -1,31 +1,47 @@
 # webscout/__init__.py
+"""
+Webscout top-level namespace.
 
-from .AIauto import *  # noqa: F403
-from .AIutel import *  # noqa: F403
-from .client import Client
-from .Extra import *  # noqa: F403
-from .litagent import LitAgent
-from .models import model
-from .optimizers import *
-from .Provider import *
-from .Provider.AISEARCH import *
-from .Provider.STT import *  # noqa: F403
-from .Provider.TTI import *
-from .Provider.TTS import *
-from .scout import *
-from .search import *
-from .swiftcli import *
-from .update_checker import check_for_updates
+Public names are resolved lazily (PEP 562): ``from webscout import DuckDuckGoSearch``
+imports ``webscout.search`` and nothing else. ``_exports.EXPORTS`` maps every
+public name to the module that provides it; regenerate it with
+``python -m webscout._exportgen generate`` after adding public names.
+"""
+
+import importlib
+from typing import Any, List
+
+from ._exports import EXPORTS
 from .version import __version__
-from .zeroart import *
 
-useragent = LitAgent()
+__all__ = sorted(EXPORTS) + ["useragent"]
+
+
+def __getattr__(name: str) -> Any:
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    target = EXPORTS.get(name)
+    if target is not None:
+        module_name, _, attr = target.partition(":")
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, attr) if attr else module
+    elif name == "useragent":
+        from .litagent import LitAgent
+
+        value = LitAgent()
+    else:
+        # Submodules such as ``webscout.AIauto`` were attributes of the eager namespace too
+        try:
+            value = importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
+    globals()[name] = value
+    return value
 
-try:
-    update_message = check_for_updates()
-    if update_message:
-        print(update_message)
-except Exception:
-    pass
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,160 @@
+"""
+Maintenance tool for the lazy top-level namespace in ``webscout/__init__.py``.
+
+``webscout/__init__.py`` used to star-import every subpackage. It now resolves
+names on first access through ``_exports.EXPORTS``, a name -> module map
+generated by this tool from the same sources, in the same order, so the
+last module to export a name still wins.
+
+Usage:
+    python -m webscout._exportgen generate      # rewrite webscout/_exports.py
+    python -m webscout._exportgen check         # exit 1 if _exports.py is stale
+    python -m webscout._exportgen importtime    # import-time benchmark with a budget
+"""
+
+import importlib
+import os
+import pkgutil
+import re
+import subprocess
+import sys
+import types
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PACKAGE = "webscout"
+EXPORTS_FILE = Path(__file__).with_name("_exports.py")
+
+# (module, name) pairs in the order the eager __init__ imported them; "*" is a star import
+SOURCES: Tuple[Tuple[str, str], ...] = (
+    (".AIauto", "*"),
+    (".AIutel", "*"),
+    (".client", "Client"),
+    (".Extra", "*"),
+    (".litagent", "LitAgent"),
+    (".models", "model"),
+    (".optimizers", "*"),
+    (".Provider", "*"),
+    (".Provider.AISEARCH", "*"),
+    (".Provider.STT", "*"),
+    (".Provider.TTI", "*"),
+    (".Provider.TTS", "*"),
+    (".scout", "*"),
+    (".search", "*"),
+    (".swiftcli", "*"),
+    (".update_checker", "check_for_updates"),
+    (".zeroart", "*"),
+)
+
+# Import-time budgets in milliseconds (cumulative time of the top-level import)
+BUDGETS: Dict[str, float] = {
+    "import webscout": 50.0,
+    "from webscout import LitAgent": 100.0,
+    "from webscout import DuckDuckGoSearch": 750.0,
+}
+
+
+def _star_names(module: types.ModuleType) -> List[str]:
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [n for n in vars(module) if not n.startswith("_")]
+    return list(names)
+
+
+def _is_webscout_name(name: str, value: object) -> bool:
+    """Keep names defined in webscout; drop re-exported stdlib/third-party names."""
+    if isinstance(value, types.ModuleType):
+        return value.__name__.startswith(PACKAGE + ".")
+    module = getattr(value, "__module__", None)
+    if not isinstance(module, str) or module.startswith(PACKAGE):
+        return True
+    # Same object under the same name in its home module: a plain re-export
+    return getattr(sys.modules.get(module), name, None) is not value
+
+
+def build_exports() -> Dict[str, str]:
+    """Import every source and map each exported name to ``module:attr`` or ``module``."""
+    exports: Dict[str, str] = {}
+    # Importing a submodule binds it on the package, so a same-named export could
+    # only win until then; the submodule (e.g. ``webscout.Provider``) always wins
+    package = importlib.import_module(PACKAGE)
+    submodules = {info.name for info in pkgutil.iter_modules(package.__path__)}
+    for module_name, name in SOURCES:
+        module = importlib.import_module(module_name, PACKAGE)
+        names = _star_names(module) if name == "*" else [name]
+        for export in names:
+            value = getattr(module, export)
+            if export in submodules or not _is_webscout_name(export, value):
+                continue
+            if isinstance(value, types.ModuleType):
+                exports[export] = "." + value.__name__[len(PACKAGE) + 1:]
+            else:
+                exports[export] = f"{module_name}:{export}"
+    return exports
+
+
+def render(exports: Dict[str, str]) -> str:
+    lines = [
+        '"""Name -> module map for the lazy ``webscout`` namespace.',
+        "",
+        "Generated by ``python -m webscout._exportgen generate``; do not edit by hand.",
+        "Values are ``module:attribute``, or just ``module`` for submodules.",
+        '"""',
+        "",
+        "EXPORTS = {",
+    ]
+    lines.extend(f"    {name!r}: {target!r}," for name, target in sorted(exports.items()))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def importtime(statement: str) -> float:
+    """Run ``statement`` in a fresh interpreter with ``-X importtime``; return milliseconds.
+
+    Only the package's own top-level entries (``webscout`` and submodules
+    imported lazily afterwards) are summed; their cumulative times include
+    every dependency they pull in, but not interpreter startup.
+    """
+    env = dict(os.environ, WEBSCOUT_NO_UPDATE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | package"; top-level imports have no indent
+    total = 0
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s(\S.*)$", line)
+        if match and (match.group(2) == PACKAGE or match.group(2).startswith(PACKAGE + ".")):
+            total += int(match.group(1))
+    return total / 1000
+
+
+def main(argv: List[str]) -> int:
+    command = argv[0] if argv else "check"
+    if command in ("generate", "check"):
+        rendered = render(build_exports())
+        if command == "generate":
+            EXPORTS_FILE.write_text(rendered, encoding="utf-8")
+            print(f"wrote {EXPORTS_FILE}")
+            return 0
+        current = EXPORTS_FILE.read_text(encoding="utf-8") if EXPORTS_FILE.exists() else ""
+        if current != rendered:
+            print(f"{EXPORTS_FILE} is out of date; run: python -m webscout._exportgen generate")
+            return 1
+        print("exports map is up to date")
+        return 0
+    if command == "importtime":
+        failed = False
+        for statement, budget in BUDGETS.items():
+            # Best of three runs to keep filesystem and cache noise out of the result
+            elapsed = min(importtime(statement) for _ in range(3))
+            status = "ok" if elapsed <= budget else "OVER BUDGET"
+            failed |= elapsed > budget
+            print(f"{statement:<42} {elapsed:8.1f}ms  (budget {budget:.0f}ms)  {status}")
+        return 1 if failed else 0
+    print(__doc__)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,282 @@
+"""Name -> module map for the lazy ``webscout`` namespace.
+
+Generated by ``python -m webscout._exportgen generate``; do not edit by hand.
+Values are ``module:attribute``, or just ``module`` for submodules.
+"""
+
+EXPORTS = {
+    'AI4Chat': '.Provider:AI4Chat',
+    'AUTO': '.AIauto:AUTO',
+    'AkashGPT': '.Provider:AkashGPT',
+    'Algion': '.Provider:Algion',
+    'AllProvidersFailure': '.AIauto:AllProvidersFailure',
+    'AndiSearch': '.Provider:AndiSearch',
+    'Apriel': '.Provider:Apriel',
+    'AsyncBaseTTSProvider': '.Provider.TTS:AsyncBaseTTSProvider',
+    'AsyncTempMailProvider': '.Extra:AsyncTempMailProvider',
+    'AwesomePrompts': '.AIutel:AwesomePrompts',
+    'Ayle': '.Provider:Ayle',
+    'BadParameter': '.swiftcli:BadParameter',
+    'BaseImages': '.Provider.TTI:BaseImages',
+    'BaseSTTAudio': '.Provider.STT:BaseSTTAudio',
+    'BaseSTTChat': '.Provider.STT:BaseSTTChat',
+    'BaseSTTTranscriptions': '.Provider.STT:BaseSTTTranscriptions',
+    'BaseSearch': '.search:BaseSearch',
+    'BaseSearchEngine': '.search:BaseSearchEngine',
+    'BaseTTSProvider': '.Provider.TTS:BaseTTSProvider',
+    'BingSearch': '.search:BingSearch',
+    'BlockFont': '.zeroart:BlockFont',
+    'BooksResult': '.search:BooksResult',
+    'Brave': '.search:Brave',
+    'CLI': '.swiftcli:CLI',
+    'CachedEngine': '.search:CachedEngine',
+    'Captions': '.Extra:Captions',
+    'Cerebras': '.Provider:Cerebras',
+    'Channel': '.Extra:Channel',
+    'ChatSandbox': '.Provider:ChatSandbox',
+    'ClaudeOnline': '.Provider:ClaudeOnline',
+    'ClaudeOnlineTTI': '.Provider.TTI:ClaudeOnlineTTI',
+    'Cleeai': '.Provider:Cleeai',
+    'Client': '.client:Client',
+    'Cohere': '.Provider:Cohere',
+    'ConfigError': '.swiftcli:ConfigError',
+    'Context': '.swiftcli:Context',
+    'Conversation': '.AIutel:Conversation',
+    'ConversionError': '.Extra:ConversionError',
+    'CookiePathInvalidError': '.Extra:CookiePathInvalidError',
+    'CurrentCondition': '.Extra:CurrentCondition',
+    'CyberFont': '.zeroart:CyberFont',
+    'DayForecast': '.Extra:DayForecast',
+    'DeepAI': '.Provider:DeepAI',
+    'DeepgramTTS': '.Provider.TTS:DeepgramTTS',
+    'Deepinfra': '.Provider.Deepinfra',
+    'DottedFont': '.zeroart:DottedFont',
+    'DuckDuckGoSearch': '.search:DuckDuckGoSearch',
+    'ElectronicFont': '.zeroart:ElectronicFont',
+    'ElevenLabsSTT': '.Provider.STT:ElevenLabsSTT',
+    'ElevenlabsTTS': '.Provider.TTS:ElevenlabsTTS',
+    'Elmo': '.Provider:Elmo',
+    'EmailnatorProvider': '.Extra:EmailnatorProvider',
+    'EncodingType': '.AIutel:EncodingType',
+    'EssentialAI': '.Provider:EssentialAI',
+    'ExaAI': '.Provider:ExaAI',
+    'Extras': '.Extra:Extras',
+    'FailedToCreateConsentCookieError': '.Extra:FailedToCreateConsentCookieError',
+    'FontType': '.zeroart:FontType',
+    'FreeTTS': '.Provider.TTS:FreeTTS',
+    'GEMINI': '.Provider:GEMINI',
+    'GEMINIAPI': '.Provider:GEMINIAPI',
+    'GROQ': '.Provider:GROQ',
+    'Genspark': '.Provider.AISEARCH:Genspark',
+    'GitError': '.Extra:GitError',
+    'GitToolkit': '.Extra.GitToolkit',
+    'GithubChat': '.Provider:GithubChat',
+    'Gradient': '.Provider:Gradient',
+    'Group': '.swiftcli:Group',
+    'HadadXYZ': '.Provider:HadadXYZ',
+    'Handler': '.Extra:Handler',
+    'Hashtag': '.Extra:Hashtag',
+    'HealthRouter': '.AIauto:HealthRouter',
+    'HeckAI': '.Provider:HeckAI',
+    'HourlyForecast': '.Extra:HourlyForecast',
+    'HuggingFace': '.Provider:HuggingFace',
+    'IAsk': '.Provider.AISEARCH:IAsk',
+    'IBM': '.Provider:IBM',
+    'INNERTUBE_API_URL': '.Extra:INNERTUBE_API_URL',
+    'INNERTUBE_CONTEXT': '.Extra:INNERTUBE_CONTEXT',
+    'ImageData': '.Provider.TTI:ImageData',
+    'ImageResponse': '.Provider.TTI:ImageResponse',
+    'ImagesResult': '.search:ImagesResult',
+    'InvalidVideoIdError': '.Extra:InvalidVideoIdError',
+    'IsometricFont': '.zeroart:IsometricFont',
+    'JadveOpenAI': '.Provider:JadveOpenAI',
+    'Julius': '.Provider:Julius',
+    'K2Think': '.Provider:K2Think',
+    'KOBOLDAI': '.Provider:KOBOLDAI',
+    'LITSTREAM': '.AIutel:LITSTREAM',
+    'LLMChat': '.Provider:LLMChat',
+    'LLMChatCo': '.Provider:LLMChatCo',
+    'LearnFast': '.Provider:LearnFast',
+    'LitAgent': '.litagent:LitAgent',
+    'Llama3Mitril': '.Provider:Llama3Mitril',
+    'Location': '.Extra:Location',
+    'MAX_WORKERS': '.Extra:MAX_WORKERS',
+    'MODEL_REGISTRY': '.AIauto:MODEL_REGISTRY',
+    'MagicStudioAI': '.Provider.TTI:MagicStudioAI',
+    'MailTM': '.Extra:MailTM',
+    'MailTMAsync': '.Extra:MailTMAsync',
+    'Meta': '.Provider:Meta',
+    'MetaSearch': '.search:MetaSearch',
+    'MiragicAI': '.Provider.TTI:MiragicAI',
+    'ModelConverter': '.Extra:ModelConverter',
+    'Mojeek': '.search:Mojeek',
+    'Monica': '.Provider.AISEARCH:Monica',
+    'MurfAITTS': '.Provider.TTS:MurfAITTS',
+    'NavigableString': '.scout:NavigableString',
+    'NeonFont': '.zeroart:NeonFont',
+    'Netwrck': '.Provider:Netwrck',
+    'NewsResult': '.search:NewsResult',
+    'NoTranscriptFoundError': '.Extra:NoTranscriptFoundError',
+    'NotFoundError': '.Extra:NotFoundError',
+    'NotTranslatableError': '.Extra:NotTranslatableError',
+    'Nvidia': '.Provider:Nvidia',
+    'OPENAI': '.Provider.OPENAI',
+    'OpenAIFMTTS': '.Provider.TTS:OpenAIFMTTS',
+    'Optimizers': '.optimizers:Optimizers',
+    'PERPLEXED': '.Provider.AISEARCH:PERPLEXED',
+    'ParlerTTS': '.Provider.TTS:ParlerTTS',
+    'Perplexity': '.Provider.AISEARCH:Perplexity',
+    'PiAI': '.Provider:PiAI',
+    'Playlist': '.Extra:Playlist',
+    'Plugin': '.swiftcli:Plugin',
+    'PluginError': '.swiftcli:PluginError',
+    'PollinationsAI': '.Provider.TTI:PollinationsAI',
+    'QuantizationMethod': '.Extra:QuantizationMethod',
+    'QwenLM': '.Provider:QwenLM',
+    'QwenTTS': '.Provider.TTS:QwenTTS',
+    'RateLimitError': '.Extra:RateLimitError',
+    'Repository': '.Extra:Repository',
+    'RequestError': '.Extra:RequestError',
+    'Response': '.AIauto:Response',
+    'STTCompatibleProvider': '.Provider.STT:STTCompatibleProvider',
+    'STTModels': '.Provider.STT:STTModels',
+    'Sambanova': '.Provider:Sambanova',
+    'Scout': '.scout:Scout',
+    'ScoutCrawler': '.scout:ScoutCrawler',
+    'ScoutSearchResult': '.scout:ScoutSearchResult',
+    'ScoutTextAnalyzer': '.scout:ScoutTextAnalyzer',
+    'ScoutWebAnalyzer': '.scout:ScoutWebAnalyzer',
+    'Search': '.Extra:Search',
+    'SearchCache': '.search:SearchCache',
+    'SearchChatAI': '.Provider:SearchChatAI',
+    'SentenceTokenizer': '.Provider.TTS:SentenceTokenizer',
+    'ShadowFont': '.zeroart:ShadowFont',
+    'SharedModelRegistry': '.AIauto:SharedModelRegistry',
+    'SherpaTTS': '.Provider.TTS:SherpaTTS',
+    'Shorts': '.Extra:Shorts',
+    'SlantFont': '.zeroart:SlantFont',
+    'SonusAI': '.Provider:SonusAI',
+    'SpeechMaTTS': '.Provider.TTS:SpeechMaTTS',
+    'StreamElements': '.Provider.TTS:StreamElements',
+    'StreamPipeline': '.AIutel:StreamPipeline',
+    'Suggestions': '.Extra:Suggestions',
+    'SwiftCLIException': '.swiftcli:SwiftCLIException',
+    'TTICompatibleProvider': '.Provider.TTI:TTICompatibleProvider',
+    'Tag': '.scout:Tag',
+    'TempMailIO': '.Extra:TempMailIO',
+    'TempMailIOAsync': '.Extra:TempMailIOAsync',
+    'TempMailProvider': '.Extra:TempMailProvider',
+    'TextPollinationsAI': '.Provider:TextPollinationsAI',
+    'TextResult': '.search:TextResult',
+    'ThreeDFont': '.zeroart:ThreeDFont',
+    'TogetherAI': '.Provider:TogetherAI',
+    'TogetherImage': '.Provider.TTI:TogetherImage',
+    'TooManyRequestsError': '.Extra:TooManyRequestsError',
+    'Toolbaz': '.Provider:Toolbaz',
+    'Transcript': '.Extra:Transcript',
+    'TranscriptList': '.Extra:TranscriptList',
+    'TranscriptListFetcher': '.Extra:TranscriptListFetcher',
+    'TranscriptParser': '.Extra:TranscriptParser',
+    'TranscriptRetrievalError': '.Extra:TranscriptRetrievalError',
+    'TranscriptionResponse': '.Provider.STT:TranscriptionResponse',
+    'TranscriptsDisabledError': '.Extra:TranscriptsDisabledError',
+    'TranslationLanguageNotAvailableError': '.Extra:TranslationLanguageNotAvailableError',
+    'TurboSeek': '.Provider:TurboSeek',
+    'TwoAI': '.Provider:TwoAI',
+    'TypefullyAI': '.Provider:TypefullyAI',
+    'TypliAI': '.Provider:TypliAI',
+    'UsageError': '.swiftcli:UsageError',
+    'User': '.Extra:User',
+    'Venice': '.Provider:Venice',
+    'VeniceAI': '.Provider.TTI:VeniceAI',
+    'VercelAI': '.Provider:VercelAI',
+    'Video': '.Extra:Video',
+    'VideoUnavailableError': '.Extra:VideoUnavailableError',
+    'VideosResult': '.search:VideosResult',
+    'WATCH_URL': '.Extra:WATCH_URL',
+    'Weather': '.Extra:Weather',
+    'WeatherAscii': '.Extra:WeatherAscii',
+    'WeatherAsciiClient': '.Extra:WeatherAsciiClient',
+    'WeatherClient': '.Extra:WeatherClient',
+    'Wikipedia': '.search:Wikipedia',
+    'WiseCat': '.Provider:WiseCat',
+    'WrDoChat': '.Provider:WrDoChat',
+    'X0GPT': '.Provider:X0GPT',
+    'YTToolkit': '.Extra.YTToolkit',
+    'YTTranscriber': '.Extra:YTTranscriber',
+    'YTdownloader': '.Extra.YTToolkit.YTdownloader',
+    'YahooSearch': '.search:YahooSearch',
+    'Yandex': '.search:Yandex',
+    'YepSearch': '.search:YepSearch',
+    'YouTubeRequestFailedError': '.Extra:YouTubeRequestFailedError',
+    'ZeroArtFont': '.zeroart:ZeroArtFont',
+    'api_key_providers': '.AIauto:api_key_providers',
+    'app': '.Extra:app',
+    'appdir': '.Extra:appdir',
+    'argument': '.swiftcli:argument',
+    'bounce': '.zeroart:bounce',
+    'cached_engines': '.search:cached_engines',
+    'check_for_updates': '.update_checker:check_for_updates',
+    'command': '.swiftcli:command',
+    'config_file': '.swiftcli:config_file',
+    'confirm_from_user': '.Extra:confirm_from_user',
+    'console': '.Extra:console',
+    'convert_command': '.Extra:convert_command',
+    'download': '.Extra:download',
+    'envvar': '.swiftcli:envvar',
+    'figlet_format': '.zeroart:figlet_format',
+    'first_query': '.Extra:first_query',
+    'flag': '.swiftcli:flag',
+    'format_output': '.swiftcli:format_output',
+    'get': '.Extra:get',
+    'get_disposable_email': '.Extra:get_disposable_email',
+    'get_excep': '.Extra:get_excep',
+    'get_health_router': '.AIauto:get_health_router',
+    'get_provider': '.Extra:get_provider',
+    'get_random_email': '.Extra:get_random_email',
+    'gguf': '.Extra.gguf',
+    'glitch': '.zeroart:glitch',
+    'gradient': '.zeroart:gradient',
+    'group': '.swiftcli:group',
+    'headers': '.Extra:headers',
+    'help_option': '.swiftcli:help_option',
+    'history_path': '.Extra:history_path',
+    'json_output': '.swiftcli:json_output',
+    'launch_media': '.Extra:launch_media',
+    'lit_streamer': '.AIutel:lit_streamer',
+    'load_providers': '.AIauto:load_providers',
+    'main': '.Extra:main',
+    'media_qualities': '.Extra:media_qualities',
+    'model': '.models:model',
+    'mp3_qualities': '.Extra:mp3_qualities',
+    'mp4_qualities': '.Extra:mp4_qualities',
+    'oivscode': '.Provider:oivscode',
+    'option': '.swiftcli:option',
+    'outline': '.zeroart:outline',
+    'pager_output': '.swiftcli:pager_output',
+    'panel_output': '.swiftcli:panel_output',
+    'pass_context': '.swiftcli:pass_context',
+    'print_figlet': '.zeroart:print_figlet',
+    'progress': '.swiftcli:progress',
+    'provider_map': '.AIauto:provider_map',
+    'rainbow': '.zeroart:rainbow',
+    'resolvers': '.Extra:resolvers',
+    'retry': '.AIutel:retry',
+    'sanitize_stream': '.AIutel:sanitize_stream',
+    'sanitize_stream_decorator': '.AIutel:sanitize_stream_decorator',
+    'second_query': '.Extra:second_query',
+    'session': '.Extra:session',
+    'table_output': '.swiftcli:table_output',
+    'tempmail': '.Extra.tempmail',
+    'third_query': '.Extra:third_query',
+    'timeIt': '.AIutel:timeIt',
+    'transcriber': '.Extra.YTToolkit.transcriber',
+    'user_cache_dir': '.Extra:user_cache_dir',
+    'version_option': '.swiftcli:version_option',
+    'weather': '.Extra.weather',
+    'weather_ascii': '.Extra.weather_ascii',
+    'webpilotai': '.Provider.AISEARCH:webpilotai',
+    'wrap_text': '.zeroart:wrap_text',
+    'yaml_output': '.swiftcli:yaml_output',
+    'ytapi': '.Extra.YTToolkit.ytapi',
+}
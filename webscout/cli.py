@@ -18,6 +18,7 @@ from .search import (
     YepSearch,
 )
 from .swiftcli import CLI, option
+from .update_checker import check_for_updates
 from .version import __version__
 
 console = Console()
@@ -279,6 +280,14 @@ def search(keywords: str, engine: str, max_results: int) -> None:
 
 def main():
     """Main entry point for the CLI."""
+    # Runs here rather than on `import webscout`, which must stay offline
+    try:
+        update_message = check_for_updates()
+        if update_message:
+            print(update_message)
+    except Exception:
+        pass
+
     try:
         app.run()
     except Exception as e:
@@ -17,8 +17,11 @@ import importlib
 import inspect
 import pkgutil
 import random
+import time
 from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Type, Union
 
+from webscout.hedging import race
+from webscout.model_registry import SharedModelRegistry
 from webscout.Provider.OPENAI.base import BaseChat, BaseCompletions, OpenAICompatibleProvider
 from webscout.Provider.OPENAI.utils import (
     ChatCompletion,
@@ -26,6 +29,7 @@ from webscout.Provider.OPENAI.utils import (
 )
 from webscout.Provider.TTI.base import BaseImages, TTICompatibleProvider
 from webscout.Provider.TTI.utils import ImageResponse
+from webscout.routing import HealthRouter, get_health_router
 
 
 def load_openai_providers() -> Tuple[Dict[str, Type[OpenAICompatibleProvider]], Set[str]]:
@@ -145,6 +149,10 @@ def _get_models_safely(provider_cls: type, client: Optional["Client"] = None) ->
     return models
 
 
+# Model lists of every chat provider, discovered once and shared by all clients
+CHAT_MODEL_REGISTRY = SharedModelRegistry("openai", lambda: OPENAI_PROVIDERS, _get_models_safely)
+
+
 class ClientCompletions(BaseCompletions):
     """
     Unified completions interface with automatic provider and model resolution.
@@ -192,37 +200,27 @@ class ClientCompletions(BaseCompletions):
         """
         Performs enhanced fuzzy search to find the closest model match across all providers.
         """
-        available = self._get_available_providers()
-        model_to_provider = {}
-
-        for p_name, p_cls in available:
-            p_models = _get_models_safely(p_cls, self._client)
-            for m in p_models:
-                if m not in model_to_provider:
-                    model_to_provider[m] = p_cls
-
-        if not model_to_provider:
-            return None
+        registry = CHAT_MODEL_REGISTRY.current()
+        allowed = {name for name, _ in self._get_available_providers()}
 
         # 1. Exact case-insensitive match
-        for m_name in model_to_provider:
-            if m_name.lower() == model.lower():
-                return model_to_provider[m_name], m_name
+        found = registry.find_lower(model, allowed)
+        if found:
+            return OPENAI_PROVIDERS[found[0]], found[1]
 
         # 2. Substring match
-        for m_name in model_to_provider:
-            if model.lower() in m_name.lower() or m_name.lower() in model.lower():
-                if self._client.print_provider_info:
-                    print(f"\033[1;33mSubstring match: '{model}' -> '{m_name}'\033[0m")
-                return model_to_provider[m_name], m_name
+        found = registry.find_substring(model, allowed)
+        if found:
+            if self._client.print_provider_info:
+                print(f"\033[1;33mSubstring match: '{model}' -> '{found[1]}'\033[0m")
+            return OPENAI_PROVIDERS[found[0]], found[1]
 
-        # 3. Fuzzy match with difflib
-        matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
-        if matches:
-            matched_model = matches[0]
+        # 3. Fuzzy match over the trigram index
+        found = registry.find_fuzzy(model, allowed)
+        if found:
             if self._client.print_provider_info:
-                print(f"\033[1;33mFuzzy match: '{model}' -> '{matched_model}'\033[0m")
-            return model_to_provider[matched_model], matched_model
+                print(f"\033[1;33mFuzzy match: '{model}' -> '{found[1]}'\033[0m")
+            return OPENAI_PROVIDERS[found[0]], found[1]
         return None
 
     def _resolve_provider_and_model(
@@ -240,10 +238,13 @@ class ClientCompletions(BaseCompletions):
             if found_p:
                 return found_p, m_name
 
+        registry = CHAT_MODEL_REGISTRY.current()
         if provider:
             resolved_model = model
             if model == "auto":
-                p_models = _get_models_safely(provider, self._client)
+                p_models = registry.models(provider.__name__) or _get_models_safely(
+                    provider, self._client
+                )
                 if p_models:
                     resolved_model = random.choice(p_models)
                 else:
@@ -257,7 +258,7 @@ class ClientCompletions(BaseCompletions):
 
             providers_with_models = []
             for name, cls in available:
-                p_models = _get_models_safely(cls, self._client)
+                p_models = registry.models(name)
                 if p_models:
                     providers_with_models.append((cls, p_models))
 
@@ -269,10 +270,9 @@ class ClientCompletions(BaseCompletions):
                 raise RuntimeError("No available chat providers with models found.")
 
         available = self._get_available_providers()
-        for p_name, p_cls in available:
-            p_models = _get_models_safely(p_cls, self._client)
-            if p_models and model in p_models:
-                return p_cls, model
+        found = registry.find_exact(model, {name for name, _ in available})
+        if found:
+            return OPENAI_PROVIDERS[found[0]], model
 
         fuzzy_result = self._fuzzy_resolve_provider_and_model(model)
         if fuzzy_result:
@@ -295,6 +295,62 @@ class ClientCompletions(BaseCompletions):
             if name not in OPENAI_AUTH_REQUIRED and name not in exclude
         ]
 
+    def _build_fallback_queue(
+        self,
+        model: str,
+        resolved_provider: Optional[Type[OpenAICompatibleProvider]],
+        resolved_model: Optional[str],
+    ) -> List[Tuple[str, Type[OpenAICompatibleProvider], str]]:
+        """Builds the (name, class, model) fallback candidates, best matches and healthiest first."""
+        router = self._client.router
+        registry = CHAT_MODEL_REGISTRY.current()
+        all_available = self._get_available_providers()
+        tier1, tier2, tier3 = [], [], []
+        base_model = model.split("/")[-1] if "/" in model else model
+        search_models = {base_model, resolved_model} if resolved_model else {base_model}
+        # Scored once against the whole registry; each provider takes its best match
+        close_matches = registry.close_matches(base_model) if base_model != "auto" else ()
+
+        for p_name, p_cls in all_available:
+            if p_cls == resolved_provider:
+                continue
+
+            p_models = registry.models(p_name)
+            if not p_models:
+                fallback_model = (
+                    base_model
+                    if base_model != "auto"
+                    else (p_models[0] if p_models else base_model)
+                )
+                tier3.append((p_name, p_cls, fallback_model))
+                continue
+
+            found_exact = False
+            for sm in search_models:
+                if sm != "auto" and registry.has_model(p_name, sm):
+                    tier1.append((p_name, p_cls, sm))
+                    found_exact = True
+                    break
+            if found_exact:
+                continue
+
+            match = next((m for m in close_matches if registry.has_model(p_name, m)), None)
+            if match:
+                tier2.append((p_name, p_cls, match))
+                continue
+
+            tier3.append((p_name, p_cls, random.choice(p_models)))
+
+        # Within each tier, healthy and fast providers go first; open circuits are skipped
+        def health_key(candidate):
+            return candidate[1].__name__, candidate[2]
+
+        return (
+            router.order(tier1, health_key)
+            + router.order(tier2, health_key)
+            + router.order(tier3, health_key)
+        )
+
     def create(
         self,
         *,
@@ -309,10 +365,16 @@ class ClientCompletions(BaseCompletions):
         timeout: Optional[int] = None,
         proxies: Optional[dict] = None,
         provider: Optional[Type[OpenAICompatibleProvider]] = None,
+        hedge_delay: Optional[float] = None,
+        max_fanout: Optional[int] = None,
         **kwargs: Any,
     ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
         """
         Creates a chat completion with automatic failover and intelligent resolution.
+
+        ``hedge_delay`` and ``max_fanout`` override the client's hedging settings
+        for this call. With a hedge delay set, candidates are raced instead of
+        tried one after another (see ``_create_hedged``).
         """
         try:
             resolved_provider, resolved_model = self._resolve_provider_and_model(model, provider)
@@ -340,7 +402,27 @@ class ClientCompletions(BaseCompletions):
             call_kwargs["proxies"] = proxies
         call_kwargs.update(kwargs)
 
-        if resolved_provider:
+        # An explicitly requested provider is always tried, even with an open circuit
+        router = self._client.router
+        explicit = provider is not None or "/" in model
+
+        if hedge_delay is None:
+            hedge_delay = self._client.hedge_delay
+        if hedge_delay is not None:
+            candidates = []
+            if resolved_provider and (explicit or router.allow(resolved_provider.__name__, resolved_model)):
+                candidates.append((resolved_provider.__name__, resolved_provider, resolved_model))
+            candidates.extend(self._build_fallback_queue(model, resolved_provider, resolved_model))
+            return self._create_hedged(
+                candidates,
+                call_kwargs,
+                stream,
+                hedge_delay,
+                max_fanout if max_fanout is not None else self._client.max_fanout,
+            )
+
+        if resolved_provider and (explicit or router.allow(resolved_provider.__name__, resolved_model)):
+            started = time.perf_counter()
             try:
                 provider_instance = self._get_provider_instance(resolved_provider)
                 response = provider_instance.chat.completions.create(**call_kwargs)
@@ -348,6 +430,9 @@ class ClientCompletions(BaseCompletions):
                 if stream and inspect.isgenerator(response):
                     try:
                         first_chunk = next(response)
+                        router.record_success(
+                            resolved_provider.__name__, resolved_model, time.perf_counter() - started
+                        )
                         self._last_provider = resolved_provider.__name__
 
                         def chained_gen(first, rest, pname) -> Any:
@@ -358,9 +443,13 @@ class ClientCompletions(BaseCompletions):
 
                         return chained_gen(first_chunk, response, resolved_provider.__name__)
                     except StopIteration:
-                        pass
+                        router.record_failure(
+                            resolved_provider.__name__, resolved_model, time.perf_counter() - started
+                        )
                     except Exception:
-                        pass
+                        router.record_failure(
+                            resolved_provider.__name__, resolved_model, time.perf_counter() - started
+                        )
                 else:
                     if (
                         response
@@ -370,6 +459,9 @@ class ClientCompletions(BaseCompletions):
                         and response.choices[0].message.content
                         and response.choices[0].message.content.strip()
                     ):
+                        router.record_success(
+                            resolved_provider.__name__, resolved_model, time.perf_counter() - started
+                        )
                         self._last_provider = resolved_provider.__name__
                         if self._client.print_provider_info:
                             print(
@@ -381,51 +473,15 @@ class ClientCompletions(BaseCompletions):
                             f"Provider {resolved_provider.__name__} returned empty content"
                         )
             except Exception:
-                pass
-
-        all_available = self._get_available_providers()
-        tier1, tier2, tier3 = [], [], []
-        base_model = model.split("/")[-1] if "/" in model else model
-        search_models = {base_model, resolved_model} if resolved_model else {base_model}
-
-        for p_name, p_cls in all_available:
-            if p_cls == resolved_provider:
-                continue
-
-            p_models = _get_models_safely(p_cls, self._client)
-            if not p_models:
-                fallback_model = (
-                    base_model
-                    if base_model != "auto"
-                    else (p_models[0] if p_models else base_model)
+                router.record_failure(
+                    resolved_provider.__name__, resolved_model, time.perf_counter() - started
                 )
-                tier3.append((p_name, p_cls, fallback_model))
-                continue
-
-            found_exact = False
-            for sm in search_models:
-                if sm != "auto" and sm in p_models:
-                    tier1.append((p_name, p_cls, sm))
-                    found_exact = True
-                    break
-            if found_exact:
-                continue
 
-            if base_model != "auto":
-                matches = difflib.get_close_matches(base_model, p_models, n=1, cutoff=0.5)
-                if matches:
-                    tier2.append((p_name, p_cls, matches[0]))
-                    continue
-
-            tier3.append((p_name, p_cls, random.choice(p_models)))
-
-        random.shuffle(tier1)
-        random.shuffle(tier2)
-        random.shuffle(tier3)
-        fallback_queue = tier1 + tier2 + tier3
+        fallback_queue = self._build_fallback_queue(model, resolved_provider, resolved_model)
 
         errors = []
         for p_name, p_cls, p_model in fallback_queue:
+            started = time.perf_counter()
             try:
                 provider_instance = self._get_provider_instance(p_cls)
                 response = provider_instance.chat.completions.create(
@@ -435,6 +491,7 @@ class ClientCompletions(BaseCompletions):
                 if stream and inspect.isgenerator(response):
                     try:
                         first_chunk = next(response)
+                        router.record_success(p_cls.__name__, p_model, time.perf_counter() - started)
                         self._last_provider = p_name
 
                         def chained_gen(first, rest, pname, mname):
@@ -445,6 +502,7 @@ class ClientCompletions(BaseCompletions):
 
                         return chained_gen(first_chunk, response, p_name, p_model)
                     except (StopIteration, Exception):
+                        router.record_failure(p_cls.__name__, p_model, time.perf_counter() - started)
                         continue
 
                 if (
@@ -455,19 +513,91 @@ class ClientCompletions(BaseCompletions):
                     and response.choices[0].message.content
                     and response.choices[0].message.content.strip()
                 ):
+                    router.record_success(p_cls.__name__, p_model, time.perf_counter() - started)
                     self._last_provider = p_name
                     if self._client.print_provider_info:
                         print(f"\033[1;34m{p_name}:{p_model} (Fallback)\033[0m\n")
                     return response
                 else:
+                    router.record_failure(p_cls.__name__, p_model, time.perf_counter() - started)
                     errors.append(f"{p_name}: Returned empty response.")
                     continue
             except Exception as e:
+                router.record_failure(p_cls.__name__, p_model, time.perf_counter() - started)
                 errors.append(f"{p_name}: {str(e)}")
                 continue
 
         raise RuntimeError(f"All chat providers failed. Errors: {'; '.join(errors[:3])}")
 
+    def _create_hedged(
+        self,
+        candidates: List[Tuple[str, Type[OpenAICompatibleProvider], str]],
+        call_kwargs: Dict[str, Any],
+        stream: bool,
+        hedge_delay: float,
+        max_fanout: int,
+    ) -> Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]]:
+        """
+        Races candidates: when no first chunk (or full response) has arrived
+        within ``hedge_delay`` seconds, the next candidate is started as well,
+        up to ``max_fanout`` concurrent attempts. The first one to answer wins;
+        streams of the losers are closed as soon as they produce a first chunk.
+        """
+        router = self._client.router
+
+        def attempt(candidate):
+            p_name, p_cls, p_model = candidate
+            provider_instance = self._get_provider_instance(p_cls)
+            response = provider_instance.chat.completions.create(**{**call_kwargs, "model": p_model})
+            if stream and inspect.isgenerator(response):
+                try:
+                    return next(response), response
+                except StopIteration:
+                    raise ValueError(f"Provider {p_name} returned an empty stream")
+            if (
+                response
+                and hasattr(response, "choices")
+                and response.choices
+                and response.choices[0].message
+                and response.choices[0].message.content
+                and response.choices[0].message.content.strip()
+            ):
+                return None, response
+            raise ValueError(f"Provider {p_name} returned empty content")
+
+        def discard(result):
+            # Closing the generator runs the provider's cleanup and releases its connection
+            rest = result[1]
+            if inspect.isgenerator(rest):
+                rest.close()
+
+        def on_result(candidate, succeeded, seconds):
+            if succeeded:
+                router.record_success(candidate[1].__name__, candidate[2], seconds)
+            else:
+                router.record_failure(candidate[1].__name__, candidate[2], seconds)
+
+        try:
+            (p_name, _, p_model), (first_chunk, response) = race(
+                candidates, attempt, hedge_delay, max_fanout, discard=discard, on_result=on_result
+            )
+        except RuntimeError as e:
+            raise RuntimeError(f"All chat providers failed. {e}")
+
+        self._last_provider = p_name
+        if not (stream and inspect.isgenerator(response)):
+            if self._client.print_provider_info:
+                print(f"\033[1;34m{p_name}:{p_model} (Hedged)\033[0m\n")
+            return response
+
+        def chained_gen(first, rest, pname, mname):
+            if self._client.print_provider_info:
+                print(f"\033[1;34m{pname}:{mname} (Hedged)\033[0m\n")
+            yield first
+            yield from rest
+
+        return chained_gen(first_chunk, response, p_name, p_model)
+
 
 class ClientChat(BaseChat):
     """
@@ -731,10 +861,19 @@ class Client:
         exclude: Optional[List[str]] = None,
         exclude_images: Optional[List[str]] = None,
         print_provider_info: bool = False,
+        router: Optional[HealthRouter] = None,
+        hedge_delay: Optional[float] = None,
+        max_fanout: int = 2,
         **kwargs: Any,
     ):
         """
         Initialize the Webscout client.
+
+        Chat fallback order is driven by ``router``, which defaults to the
+        process-wide health router shared with ``AUTO`` and the API server.
+        Setting ``hedge_delay`` (seconds) enables hedged requests: if a provider
+        has not produced its first chunk within the delay, the next candidate
+        is started in parallel, with at most ``max_fanout`` attempts in flight.
         """
         self.provider = provider
         self.image_provider = image_provider
@@ -743,6 +882,9 @@ class Client:
         self.exclude = [e.upper() if e else e for e in (exclude or [])]
         self.exclude_images = [e.upper() if e else e for e in (exclude_images or [])]
         self.print_provider_info = print_provider_info
+        self.router = router or get_health_router()
+        self.hedge_delay = hedge_delay
+        self.max_fanout = max_fanout
         self.kwargs = kwargs
 
         self._provider_cache = {}
@@ -0,0 +1,158 @@
+"""
+Hedged requests: race fallback candidates instead of trying them one by one.
+
+``race`` starts the first candidate and, whenever ``hedge_delay`` seconds pass
+without an answer, starts the next one, keeping at most ``max_fanout``
+attempts in flight. A failed attempt immediately makes room for the next
+candidate. The first successful attempt wins; results of attempts that finish
+later are handed to ``discard`` so their streams and connections get closed.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def race(
+    candidates: Sequence[T],
+    attempt: Callable[[T], R],
+    hedge_delay: float,
+    max_fanout: int = 2,
+    discard: Optional[Callable[[R], Any]] = None,
+    on_result: Optional[Callable[[T, bool, float], Any]] = None,
+) -> Tuple[T, R]:
+    """Run ``attempt`` over ``candidates`` with hedging and return the first success.
+
+    Args:
+        candidates: Candidates in preference order.
+        attempt: Called in a worker thread with one candidate; returns a result
+            or raises on failure.
+        hedge_delay: Seconds to wait for an answer before starting another candidate.
+        max_fanout: Maximum number of attempts running at the same time.
+        discard: Called with the result of every successful attempt that lost the race.
+        on_result: Called as ``on_result(candidate, succeeded, seconds)`` when any
+            attempt finishes, winners and losers alike.
+
+    Returns:
+        Tuple[T, R]: The winning candidate and its result.
+
+    Raises:
+        RuntimeError: If every candidate failed.
+    """
+    max_fanout = max(1, max_fanout)
+    results: "queue.Queue[Tuple[int, Any, Optional[BaseException]]]" = queue.Queue()
+    lock = threading.Lock()
+    decided = threading.Event()
+    errors: List[str] = []
+    next_index = 0
+    active = 0
+
+    def release(value: Any) -> None:
+        if discard is None:
+            return
+        try:
+            discard(value)
+        except Exception:
+            pass
+
+    def run(index: int, candidate: T) -> None:
+        started = time.perf_counter()
+        try:
+            value = attempt(candidate)
+        except Exception as e:
+            if on_result is not None:
+                on_result(candidate, False, time.perf_counter() - started)
+            results.put((index, None, e))
+            return
+        if on_result is not None:
+            on_result(candidate, True, time.perf_counter() - started)
+        with lock:
+            if decided.is_set():
+                release(value)
+                return
+            results.put((index, value, None))
+
+    def launch() -> bool:
+        nonlocal next_index, active
+        if next_index >= len(candidates):
+            return False
+        index = next_index
+        next_index += 1
+        active += 1
+        threading.Thread(
+            target=run, args=(index, candidates[index]), name=f"webscout-hedge-{index}", daemon=True
+        ).start()
+        return True
+
+    launch()
+    while active:
+        can_hedge = active < max_fanout and next_index < len(candidates)
+        try:
+            index, value, error = results.get(timeout=hedge_delay if can_hedge else None)
+        except queue.Empty:
+            launch()
+            continue
+        active -= 1
+        if error is not None:
+            errors.append(f"{candidates[index]}: {error}")
+            if active < max_fanout:
+                launch()
+            continue
+
+        with lock:
+            decided.set()
+        # Successes that were queued before the decision lost the race as well
+        while True:
+            try:
+                _, late_value, late_error = results.get_nowait()
+            except queue.Empty:
+                break
+            if late_error is None:
+                release(late_value)
+        return candidates[index], value
+
+    raise RuntimeError(f"All candidates failed. Errors: {'; '.join(errors[:3])}")
+
+
+if __name__ == "__main__":
+    # Benchmark: p50/p99 latency of sequential fallback vs hedging against
+    # simulated providers that are usually fast, sometimes slow, sometimes fail.
+    import random
+    import statistics
+    import sys
+
+    TRIALS = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    rng = random.Random(42)
+
+    def slow_provider(name: str) -> str:
+        roll = rng.random()
+        if roll < 0.05:
+            time.sleep(0.05)
+            raise RuntimeError("upstream error")
+        time.sleep(0.02 if roll < 0.90 else 0.5)
+        return name
+
+    def measure(label: str, hedge_delay: float, max_fanout: int) -> None:
+        samples = []
+        for _ in range(TRIALS):
+            started = time.perf_counter()
+            try:
+                race(["p1", "p2", "p3", "p4"], slow_provider, hedge_delay, max_fanout)
+            except RuntimeError:
+                pass
+            samples.append(time.perf_counter() - started)
+        samples.sort()
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        p90 = samples[int(len(samples) * 0.90)]
+        print(
+            f"{label:<28} p50={statistics.median(samples) * 1000:7.1f}ms  "
+            f"p90={p90 * 1000:7.1f}ms  p99={p99 * 1000:7.1f}ms"
+        )
+
+    measure("sequential", hedge_delay=3600, max_fanout=1)
+    measure("hedged (50ms, fan-out 2)", hedge_delay=0.05, max_fanout=2)
+    measure("hedged (50ms, fan-out 3)", hedge_delay=0.05, max_fanout=3)
@@ -0,0 +1,406 @@
+"""
+Precomputed model-to-provider registry.
+
+Discovering which models a provider serves can instantiate the provider or
+call ``get_models()`` over the network, so it is done once for every provider
+and frozen into an immutable ``ModelRegistry`` snapshot with three indexes:
+
+- exact: model name -> providers serving it
+- lowercase: lowercased model name -> canonical model names
+- trigram: character trigram -> models containing it, used to narrow
+  substring and fuzzy lookups down to a handful of candidates
+
+A ``SharedModelRegistry`` owns the current snapshot for one provider family.
+It persists the discovered model lists to a JSON cache file so cold starts
+can skip discovery, and it rebuilds the snapshot on a background schedule,
+swapping it in atomically. ``Client`` and ``AUTO`` each use one.
+"""
+
+import difflib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import orjson
+
+CACHE_VERSION = 1
+
+# Seconds between background rebuilds; 0 disables them
+DEFAULT_REFRESH_INTERVAL = float(os.getenv("WEBSCOUT_MODEL_REGISTRY_REFRESH", "3600"))
+# Directory for cache files, or "off" to disable persistence
+DEFAULT_CACHE_DIR = os.getenv("WEBSCOUT_MODEL_REGISTRY_CACHE", str(Path.home() / ".webscout"))
+
+_EMPTY: Tuple[str, ...] = ()
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    if len(text) < 3:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+class ModelRegistry:
+    """Immutable snapshot of the models served by a set of providers.
+
+    Args:
+        provider_models: Provider name -> models it serves, in preference order.
+            Provider order decides which provider wins when several serve a model.
+        built_at: Unix time the model lists were discovered.
+    """
+
+    def __init__(self, provider_models: Mapping[str, Iterable[str]], built_at: Optional[float] = None):
+        self.built_at = built_at if built_at is not None else time.time()
+
+        models_by_provider: Dict[str, Tuple[str, ...]] = {}
+        model_sets: Dict[str, FrozenSet[str]] = {}
+        exact: Dict[str, List[str]] = {}
+        for provider, models in provider_models.items():
+            unique = tuple(dict.fromkeys(m for m in models if isinstance(m, str) and m))
+            models_by_provider[provider] = unique
+            model_sets[provider] = frozenset(unique)
+            for model in unique:
+                exact.setdefault(model, []).append(provider)
+
+        # Model names in discovery order; the rank breaks ties like the old linear scans did
+        self._rank: Dict[str, int] = {model: i for i, model in enumerate(exact)}
+        lower: Dict[str, List[str]] = {}
+        ngrams: Dict[str, List[str]] = {}
+        for model in exact:
+            key = model.lower()
+            lower.setdefault(key, []).append(model)
+            for gram in _trigrams(key):
+                ngrams.setdefault(gram, []).append(model)
+
+        self._models = MappingProxyType(models_by_provider)
+        self._model_sets = MappingProxyType(model_sets)
+        self._exact = MappingProxyType({m: tuple(p) for m, p in exact.items()})
+        self._lower = MappingProxyType({k: tuple(v) for k, v in lower.items()})
+        self._ngrams = MappingProxyType({g: tuple(v) for g, v in ngrams.items()})
+        self._gram_counts = MappingProxyType({m: len(_trigrams(m.lower())) for m in exact})
+        # Names under three characters have no trigram a longer query could share
+        self._short = tuple(m for m in exact if len(m) < 3)
+        # The snapshot never changes, so fuzzy scores can be memoized for its lifetime
+        self.close_matches = lru_cache(maxsize=2048)(self._close_matches)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    @property
+    def providers(self) -> Tuple[str, ...]:
+        return tuple(self._models)
+
+    def models(self, provider: str) -> Tuple[str, ...]:
+        """Return the models served by ``provider`` (empty if unknown)."""
+        return self._models.get(provider, _EMPTY)
+
+    def has_model(self, provider: str, model: str) -> bool:
+        model_set = self._model_sets.get(provider)
+        return model_set is not None and model in model_set
+
+    def providers_for(self, model: str, allowed: Optional[Collection[str]] = None) -> Tuple[str, ...]:
+        """Return providers serving exactly ``model``, optionally restricted to ``allowed``."""
+        providers = self._exact.get(model, _EMPTY)
+        if allowed is None:
+            return providers
+        return tuple(p for p in providers if p in allowed)
+
+    def _first_provider(self, model: str, allowed: Optional[Collection[str]]) -> Optional[str]:
+        for provider in self._exact.get(model, _EMPTY):
+            if allowed is None or provider in allowed:
+                return provider
+        return None
+
+    def _candidates(self, query: str) -> Dict[str, int]:
+        """Models sharing at least one trigram with ``query``, with the shared count."""
+        shared: Dict[str, int] = {}
+        for gram in _trigrams(query):
+            for model in self._ngrams.get(gram, _EMPTY):
+                shared[model] = shared.get(model, 0) + 1
+        return shared
+
+    def find_exact(self, model: str, allowed: Optional[Collection[str]] = None) -> Optional[Tuple[str, str]]:
+        """Return ``(provider, model)`` for an exact name match."""
+        provider = self._first_provider(model, allowed)
+        return (provider, model) if provider else None
+
+    def find_lower(self, model: str, allowed: Optional[Collection[str]] = None) -> Optional[Tuple[str, str]]:
+        """Return ``(provider, model)`` for a case-insensitive name match."""
+        for name in self._lower.get(model.lower(), _EMPTY):
+            provider = self._first_provider(name, allowed)
+            if provider:
+                return provider, name
+        return None
+
+    def find_substring(self, model: str, allowed: Optional[Collection[str]] = None) -> Optional[Tuple[str, str]]:
+        """Return the first model (in discovery order) containing ``model`` or contained in it."""
+        query = model.lower()
+        if len(query) < 3:
+            # Too short to have a trigram: scan every name, like the legacy lookup
+            candidates = list(self._rank)
+        else:
+            query_grams = len(_trigrams(query))
+            shared = self._candidates(query)
+            # "query in name" needs every query trigram, "name in query" every name trigram
+            candidates = [
+                name for name, count in shared.items()
+                if count == query_grams or count == self._gram_counts[name]
+            ]
+            candidates.extend(name for name in self._short if name not in shared)
+            candidates.sort(key=self._rank.__getitem__)
+        for name in candidates:
+            key = name.lower()
+            if query in key or key in query:
+                provider = self._first_provider(name, allowed)
+                if provider:
+                    return provider, name
+        return None
+
+    def _close_matches(self, model: str, cutoff: float = 0.5, limit: int = 32) -> Tuple[str, ...]:
+        """Return models similar to ``model``, best first, like ``difflib.get_close_matches``.
+
+        Only the ``limit`` models sharing the most trigrams with ``model`` are
+        scored, instead of every known model; queries under three characters
+        have no trigrams, so every model is scored. Exposed as ``close_matches``.
+        """
+        if len(model) < 3:
+            pool = list(self._rank)
+        else:
+            shared = self._candidates(model.lower())
+            if not shared:
+                return _EMPTY
+            pool = sorted(shared, key=lambda m: (-shared[m], self._rank[m]))[:limit]
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(model)
+        scored = []
+        for name in pool:
+            matcher.set_seq1(name)
+            if matcher.real_quick_ratio() >= cutoff and matcher.quick_ratio() >= cutoff:
+                ratio = matcher.ratio()
+                if ratio >= cutoff:
+                    scored.append((ratio, name))
+        scored.sort(key=lambda item: (-item[0], self._rank[item[1]]))
+        return tuple(name for _, name in scored)
+
+    def find_fuzzy(
+        self, model: str, allowed: Optional[Collection[str]] = None, cutoff: float = 0.5
+    ) -> Optional[Tuple[str, str]]:
+        """Return ``(provider, model)`` for the closest fuzzy match."""
+        for name in self.close_matches(model, cutoff):
+            provider = self._first_provider(name, allowed)
+            if provider:
+                return provider, name
+        return None
+
+    def resolve(
+        self, model: str, allowed: Optional[Collection[str]] = None
+    ) -> Optional[Tuple[str, str, str]]:
+        """Resolve a model string to ``(provider, model, match_kind)``.
+
+        Tries exact, case-insensitive, substring and fuzzy matching in that
+        order; ``match_kind`` is one of ``exact``, ``lower``, ``substring`` or
+        ``fuzzy``. Returns ``None`` when nothing matches.
+        """
+        for kind, finder in (
+            ("exact", self.find_exact),
+            ("lower", self.find_lower),
+            ("substring", self.find_substring),
+            ("fuzzy", self.find_fuzzy),
+        ):
+            found = finder(model, allowed)
+            if found:
+                return found[0], found[1], kind
+        return None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "version": CACHE_VERSION,
+            "built_at": self.built_at,
+            "providers": {p: list(m) for p, m in self._models.items()},
+        }
+
+
+class SharedModelRegistry:
+    """Owns the current ``ModelRegistry`` for one provider family.
+
+    Args:
+        name: Family name, used for the cache file name.
+        providers: Returns the provider name -> class mapping to index.
+        discover: Returns the models served by one provider class.
+        refresh_interval: Seconds between background rebuilds (0 disables them).
+            A cache file older than this is still used for a cold start, and a
+            rebuild is started right away.
+        cache_dir: Directory of the JSON cache file, ``None`` or ``"off"`` to disable it.
+        max_workers: Threads used to discover providers in parallel.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        providers: Callable[[], Mapping[str, type]],
+        discover: Callable[[type], List[str]],
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_workers: int = 16,
+    ):
+        self.name = name
+        self._providers = providers
+        self._discover = discover
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.cache_path: Optional[Path] = None
+        if cache_dir and cache_dir.lower() not in ("off", "none", "false", "0"):
+            self.cache_path = Path(cache_dir) / f"model-registry-{name}.json"
+        self._registry: Optional[ModelRegistry] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def current(self) -> ModelRegistry:
+        """Return the current snapshot, loading or building it on first use."""
+        registry = self._registry
+        if registry is not None:
+            return registry
+        with self._lock:
+            if self._registry is None:
+                registry = self._load_cache()
+                if registry is None:
+                    registry = self._build()
+                    self._save_cache(registry)
+                self._registry = registry
+                self._start_refresher(stale=time.time() - registry.built_at >= self.refresh_interval)
+        return self._registry
+
+    def refresh(self) -> ModelRegistry:
+        """Rediscover every provider and swap in the new snapshot."""
+        with self._refresh_lock:
+            registry = self._build()
+            self._registry = registry
+            self._save_cache(registry)
+            return registry
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+
+    def _build(self) -> ModelRegistry:
+        providers = dict(self._providers())
+
+        def discover(cls: type) -> List[str]:
+            try:
+                return list(self._discover(cls))
+            except Exception:
+                return []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="webscout-models") as pool:
+            model_lists = list(pool.map(discover, providers.values()))
+        return ModelRegistry(dict(zip(providers, model_lists)))
+
+    def _load_cache(self) -> Optional[ModelRegistry]:
+        if self.cache_path is None or not self.cache_path.is_file():
+            return None
+        try:
+            data = orjson.loads(self.cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return None
+        cached = data.get("providers")
+        # A different provider set (e.g. after an upgrade) needs a full discovery
+        if not isinstance(cached, dict) or set(cached) != set(self._providers()):
+            return None
+        return ModelRegistry(cached, built_at=float(data.get("built_at", 0)))
+
+    def _save_cache(self, registry: ModelRegistry) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            tmp.write_bytes(orjson.dumps(registry.to_dict()))
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def _start_refresher(self, stale: bool) -> None:
+        if self.refresh_interval <= 0 or self._refresher is not None:
+            return
+
+        def loop() -> None:
+            if not stale and self._stop.wait(self.refresh_interval):
+                return
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                except Exception:
+                    pass
+                if self._stop.wait(self.refresh_interval):
+                    return
+
+        self._refresher = threading.Thread(target=loop, name=f"webscout-models-{self.name}", daemon=True)
+        self._refresher.start()
+
+
+if __name__ == "__main__":
+    # Benchmark: per-call discovery + linear/difflib resolution (the old path)
+    # against lookups on a prebuilt registry, over all OPENAI providers.
+    from webscout.client import OPENAI_PROVIDERS, _get_models_safely
+
+    start = time.perf_counter()
+    shared = SharedModelRegistry("bench", lambda: OPENAI_PROVIDERS, _get_models_safely, 0, cache_dir=None)
+    registry = shared.current()
+    print(f"discovery: {len(OPENAI_PROVIDERS)} providers, {len(registry)} models "
+          f"in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    provider_models = {p: list(registry.models(p)) for p in registry.providers}
+    queries = ["gpt-4o", "GPT-4o-mini", "llama-3.3-70b", "claude", "deepseek-r1", "qwen 2.5 coder", "gemini-flash"]
+    # Shorter than a trigram: resolved by the linear fallback
+    short_queries = ["o1", "o3", "r1", "4o"]
+
+    def legacy_resolve(model: str):
+        # Mirrors the old _resolve_provider_and_model / _fuzzy_resolve_provider_and_model,
+        # minus the per-call discovery which is timed separately above
+        for p_name, p_models in provider_models.items():
+            if model in p_models:
+                return p_name, model
+        model_to_provider = {}
+        for p_name, p_models in provider_models.items():
+            for m in p_models:
+                model_to_provider.setdefault(m, p_name)
+        for m in model_to_provider:
+            if m.lower() == model.lower():
+                return model_to_provider[m], m
+        for m in model_to_provider:
+            if model.lower() in m.lower() or m.lower() in model.lower():
+                return model_to_provider[m], m
+        matches = difflib.get_close_matches(model, model_to_provider.keys(), n=1, cutoff=0.5)
+        return (model_to_provider[matches[0]], matches[0]) if matches else None
+
+    rounds = 200
+    for label, fn in (("legacy", legacy_resolve), ("registry", registry.resolve)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for q in queries:
+                fn(q)
+        per_call = (time.perf_counter() - start) / (rounds * len(queries))
+        print(f"{label:<9} {per_call * 1e6:9.1f} us/resolve")
+    for q in queries + short_queries:
+        print(f"  {q!r:<18} legacy={legacy_resolve(q)}  registry={registry.resolve(q)}")
+    for q in short_queries:
+        found = registry.resolve(q)
+        assert (found and found[:2]) == legacy_resolve(q), q
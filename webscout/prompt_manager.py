@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
 
-import json
+import difflib
+import os
+import random
 import threading
-from datetime import datetime, timedelta
-from functools import lru_cache
+import time
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
+
+import orjson
 
 try:
     from curl_cffi.requests import Session
@@ -20,188 +23,312 @@ from rich.table import Table
 
 console = Console()
 
-class AwesomePrompts:
-    """Prompts manager with caching and optimization."""
+DEFAULT_REPO_URL = "https://raw.githubusercontent.com/OEvortex/prompts/main/prompt.json"
+DEFAULT_LOCAL_PATH = Path.home() / ".webscout" / "awesome-prompts.json"
+# Seconds before the local prompt file is refreshed in the background (0 disables refreshing)
+DEFAULT_REFRESH_INTERVAL = float(os.getenv("WEBSCOUT_PROMPTS_REFRESH", "86400"))
+
+
+class PromptIndex:
+    """Immutable snapshot of the prompts with exact, case-insensitive and fuzzy lookup.
+
+    Names keep their insertion order, which also defines the numeric index.
+    """
+
+    __slots__ = ("prompts", "names", "_lower", "_fuzzy")
+
+    def __init__(self, prompts: Dict[str, str]):
+        self.prompts = prompts
+        self.names: Tuple[str, ...] = tuple(prompts)
+        lower: Dict[str, str] = {}
+        for name in self.names:
+            lower.setdefault(name.lower(), name)
+        self._lower = lower
+        self._fuzzy: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_json(cls, data: object) -> "PromptIndex":
+        """Build an index from a decoded prompt file, skipping stale numeric keys."""
+        if not isinstance(data, dict):
+            return cls({})
+        # Files written by older versions also hold "0", "1", ... copies of every prompt
+        return cls({
+            str(k): v for k, v in data.items()
+            if isinstance(v, str) and not (isinstance(k, int) or (isinstance(k, str) and k.isdigit()))
+        })
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, key: Union[str, int], case_insensitive: bool = True, fuzzy: bool = False) -> Optional[str]:
+        """Return the prompt for a name or index, or None."""
+        if isinstance(key, int):
+            return self.prompts[self.names[key]] if -len(self.names) <= key < len(self.names) else None
+        prompt = self.prompts.get(key)
+        if prompt is not None or not case_insensitive:
+            return prompt
+        name = self._lower.get(key.lower())
+        if name is None and fuzzy:
+            name = self._close_match(key.lower())
+        return self.prompts[name] if name is not None else None
+
+    def _close_match(self, key: str) -> Optional[str]:
+        if key not in self._fuzzy:
+            matches = difflib.get_close_matches(key, self._lower.keys(), n=1, cutoff=0.8)
+            self._fuzzy[key] = self._lower[matches[0]] if matches else None
+        return self._fuzzy[key]
+
+    def to_dict(self) -> Dict[Union[str, int], str]:
+        """Return names and numeric indices mapped to prompts."""
+        acts: Dict[Union[str, int], str] = dict(self.prompts)
+        acts.update(enumerate(self.prompts[name] for name in self.names))
+        return acts
+
+
+class SharedPromptStore:
+    """Process-wide owner of the current ``PromptIndex`` for one prompt source.
+
+    The local file is read once, on first use. When it is missing, the prompts
+    are downloaded synchronously; when it is older than ``refresh_interval``
+    (by modification time, so the age is shared between processes), a
+    background thread downloads a fresh copy and swaps the index atomically.
+
+    Args:
+        repo_url: URL of the prompt JSON.
+        local_path: Local copy of the prompts.
+        refresh_interval: Seconds between refreshes (0 disables them).
+        timeout: Timeout for HTTP requests.
+        impersonate: Browser profile for curl_cffi.
+    """
 
     def __init__(
         self,
-        repo_url: str = "https://raw.githubusercontent.com/OEvortex/prompts/main/prompt.json",
-        local_path: Optional[str] = None,
-        auto_update: bool = True,
+        repo_url: str = DEFAULT_REPO_URL,
+        local_path: Union[str, Path] = DEFAULT_LOCAL_PATH,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
         timeout: int = 10,
         impersonate: str = "chrome110",
-        cache_size: int = 128,
-        max_workers: int = 4
     ):
-        """Initialize optimized Awesome Prompts.
-
-        Args:
-            repo_url: URL to fetch prompts from
-            local_path: Where to save prompts locally
-            auto_update: Auto update prompts on init
-            timeout: Timeout for HTTP requests
-            impersonate: Browser profile for curl_cffi
-            cache_size: LRU cache size for get operations
-            max_workers: Max threads for concurrent operations
-        """
         self.repo_url = repo_url
-        self.local_path = Path(local_path) if local_path else Path.home() / ".webscout" / "awesome-prompts.json"
+        self.local_path = Path(local_path)
+        self.refresh_interval = refresh_interval
         self.timeout = timeout
-        self._last_update: Optional[datetime] = None
-        self._cache_lock = threading.RLock()
-        self._file_lock = threading.Lock()
-        self._max_workers = max_workers
-
-        self._max_workers = max_workers
-        if CURL_AVAILABLE:
-            self.session = Session(timeout=timeout, impersonate=impersonate)
-        else:
-            self.session = requests.Session()
-            self.session.timeout = timeout
-        self.local_path.parent.mkdir(parents=True, exist_ok=True)
-        self._cache: Dict[Union[str, int], str] = {}
-        self._load_cache()
-        self._get_cached = lru_cache(maxsize=cache_size)(self._get_uncached)
-        if auto_update:
-            self.update_prompts_from_online()
-
-    def _load_cache(self) -> None:
-        """Initialize cache from local file."""
+        self.impersonate = impersonate
+        self.updated_at = 0.0
+        self._index: Optional[PromptIndex] = None
+        self._lock = threading.RLock()
+        self._refresh_lock = threading.RLock()  # re-entered by the first download in current()
+        self._refresher: Optional[threading.Thread] = None
+
+    def current(self) -> PromptIndex:
+        """Return the current snapshot, loading it on first use."""
+        index = self._index
+        if index is not None:
+            return index
+        # Locks are always taken as in refresh(): _refresh_lock, then _lock
+        with self._refresh_lock:
+            if self._index is None:
+                with self._lock:
+                    index = self._load_file()
+                    self._index = index if index is not None else PromptIndex({})
+                if index is None:
+                    self.refresh(quiet=True)
+        return self._index
+
+    def is_stale(self) -> bool:
+        """Return whether the prompts are older than ``refresh_interval``."""
+        return self.refresh_interval > 0 and time.time() - self.updated_at >= self.refresh_interval
+
+    def refresh_in_background(self) -> None:
+        """Start a background download if the local copy is older than ``refresh_interval``."""
+        self.current()
+        if not self.is_stale():
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self.refresh, kwargs={"quiet": True}, name="webscout-prompts", daemon=True
+            )
+            self._refresher.start()
+
+    def refresh(self, quiet: bool = False) -> int:
+        """Download the prompts, merge them into the current ones and save them.
+
+        Online prompts win over local ones with the same name; local-only
+        prompts are kept.
+
+        Returns:
+            Number of prompts after the merge.
+        """
+        with self._refresh_lock:
+            if CURL_AVAILABLE:
+                session = Session(timeout=self.timeout, impersonate=self.impersonate)
+            else:
+                session = requests.Session()
+            try:
+                response = session.get(self.repo_url, timeout=self.timeout)
+                response.raise_for_status()
+                online = PromptIndex.from_json(orjson.loads(response.content))
+                if not online:
+                    raise ValueError("Invalid response format")
+            except Exception:
+                # Do not retry on every call while offline
+                self.updated_at = time.time()
+                if not quiet:
+                    raise
+                return len(self.current())
+            finally:
+                session.close()
+            with self._lock:
+                merged = dict(self._index.prompts) if self._index is not None else {}
+                merged.update(online.prompts)
+                self.replace(merged)
+            return len(merged)
+
+    def replace(self, prompts: Dict[str, str]) -> PromptIndex:
+        """Swap in a new prompt set and save it to the local file."""
+        with self._lock:
+            index = self._index = PromptIndex(prompts)
+            self.updated_at = time.time()
+            self._save_file(index)
+        return index
+
+    def _load_file(self) -> Optional[PromptIndex]:
+        try:
+            data = self.local_path.read_bytes()
+            self.updated_at = self.local_path.stat().st_mtime
+        except OSError:
+            return None
         try:
-            if self.local_path.exists():
-                with self._file_lock:
-                    with open(self.local_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        with self._cache_lock:
-                            self._cache = data
-        except (json.JSONDecodeError, IOError) as e:
+            return PromptIndex.from_json(orjson.loads(data))
+        except orjson.JSONDecodeError as e:
             console.print(f"[red]Warning: Failed to load cache: {e}[/red]")
-            self._cache = {}
+            return None
 
-    def _save_cache(self) -> None:
-        """Save cache to local file with atomic write."""
+    def _save_file(self, index: PromptIndex) -> None:
         try:
+            self.local_path.parent.mkdir(parents=True, exist_ok=True)
             temp_path = self.local_path.with_suffix('.tmp')
-            with self._file_lock:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    json.dump(self._cache, f, indent=2, ensure_ascii=False, sort_keys=True)
-                temp_path.replace(self.local_path)
-        except IOError as e:
+            temp_path.write_bytes(orjson.dumps(index.prompts, option=orjson.OPT_INDENT_2))
+            os.replace(temp_path, self.local_path)
+        except OSError as e:
             console.print(f"[red]Error saving cache: {e}[/red]")
 
-    def _load_prompts(self) -> Dict[Union[str, int], str]:
-        """Load prompts from cache or file."""
-        with self._cache_lock:
-            if self._cache:
-                return self._cache.copy()
 
-        # Fallback to file if cache is empty
-        self._load_cache()
-        with self._cache_lock:
-            return self._cache.copy()
+_stores: Dict[Tuple[str, Union[str, Path, None]], SharedPromptStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_prompt_store(
+    repo_url: str = DEFAULT_REPO_URL,
+    local_path: Union[str, Path, None] = None,
+    timeout: int = 10,
+    impersonate: str = "chrome110",
+) -> SharedPromptStore:
+    """Get or create the shared store for a prompt source and local file."""
+    store = _stores.get((repo_url, local_path))
+    if store is not None:
+        return store
+    path = Path(local_path) if local_path else DEFAULT_LOCAL_PATH
+    with _stores_lock:
+        # Equivalent spellings of one path share a store; every spelling is cached as its own key
+        store = _stores.get((repo_url, str(path)))
+        if store is None:
+            store = _stores[(repo_url, str(path))] = SharedPromptStore(
+                repo_url, path, timeout=timeout, impersonate=impersonate
+            )
+        _stores[(repo_url, local_path)] = store
+    return store
 
-    def _save_prompts(self, prompts: Dict[Union[str, int], str]) -> None:
-        """Save prompts and update cache."""
-        with self._cache_lock:
-            self._cache = prompts.copy()
-        self._save_cache()
 
-    def update_prompts_from_online(self, force: bool = False) -> bool:
-        """Update prompts from repository with optimized merging."""
-        try:
-            # Check update frequency limit (1 hour)
-            if not force and self._last_update and \
-               (datetime.now() - self._last_update) < timedelta(hours=1):
-                console.print("[yellow]Prompts are already up to date![/yellow]")
-                return True
-
-            console.print("[cyan]Updating prompts...[/cyan]")
-
-            # Fetch new prompts with timeout
-            response = self.session.get(self.repo_url, timeout=self.timeout)
-            response.raise_for_status()
-
-            new_prompts = response.json()
-            if not isinstance(new_prompts, dict):
-                raise ValueError("Invalid response format")
-
-            # Efficient merge with existing prompts
-            existing_prompts = self._load_prompts()
+class AwesomePrompts:
+    """Prompts manager backed by a shared, indexed prompt store.
 
-            # Build optimized structure
-            merged_prompts = {}
-            string_keys = []
+    Instances are cheap: every ``AwesomePrompts`` with the same ``repo_url``
+    and ``local_path`` shares one process-wide store, which reads the local
+    file once and refreshes it in the background. ``get_act`` is a dictionary
+    lookup.
+    """
 
-            # Add existing string keys
-            for key, value in existing_prompts.items():
-                if isinstance(key, str):
-                    merged_prompts[key] = value
-                    string_keys.append(key)
+    def __init__(
+        self,
+        repo_url: str = DEFAULT_REPO_URL,
+        local_path: Optional[str] = None,
+        auto_update: bool = True,
+        timeout: int = 10,
+        impersonate: str = "chrome110",
+        cache_size: int = 128,
+        max_workers: int = 4
+    ):
+        """Initialize Awesome Prompts.
 
-            # Merge new prompts (prioritize new over existing)
-            for key, value in new_prompts.items():
-                if isinstance(key, str):
-                    merged_prompts[key] = value
-                    if key not in string_keys:
-                        string_keys.append(key)
+        Args:
+            repo_url: URL to fetch prompts from
+            local_path: Where to save prompts locally
+            auto_update: Refresh prompts in the background once the local copy
+                is older than ``WEBSCOUT_PROMPTS_REFRESH`` seconds (default one day)
+            timeout: Timeout for HTTP requests
+            impersonate: Browser profile for curl_cffi
+            cache_size: Kept for compatibility; lookups no longer need an LRU cache
+            max_workers: Kept for compatibility
+        """
+        self._store = get_prompt_store(repo_url, local_path, timeout, impersonate)
+        self.repo_url = self._store.repo_url
+        self.local_path = self._store.local_path
+        self.timeout = timeout
+        self._auto_update = auto_update
 
-            # Add numeric indices for fast access
-            for i, key in enumerate(string_keys):
-                merged_prompts[i] = merged_prompts[key]
+    def _index(self) -> PromptIndex:
+        if self._auto_update:
+            self._store.refresh_in_background()
+        return self._store.current()
 
-            self._save_prompts(merged_prompts)
-            self._last_update = datetime.now()
+    def update_prompts_from_online(self, force: bool = False) -> bool:
+        """Download prompts now and merge them into the shared store.
 
-            console.print(f"[green]Updated {len([k for k in merged_prompts if isinstance(k, str)])} prompts successfully![/green]")
+        Args:
+            force: Download even if the local copy is younger than the refresh interval
+        """
+        if not force and not self._store.is_stale() and len(self._store.current()):
+            console.print("[yellow]Prompts are already up to date![/yellow]")
             return True
-
+        console.print("[cyan]Updating prompts...[/cyan]")
+        try:
+            count = self._store.refresh()
         except Exception as e:
             error_msg = str(e)
-            if hasattr(e, 'response') and e.response is not None:
+            if getattr(e, 'response', None) is not None:
                 error_msg = f"HTTP {e.response.status_code}: {error_msg}"
             console.print(f"[red]Update failed: {error_msg}[/red]")
             return False
+        console.print(f"[green]Updated {count} prompts successfully![/green]")
+        return True
 
     def get_act(
         self,
         key: Union[str, int],
         default: Optional[str] = None,
         case_insensitive: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        fuzzy: bool = False,
+        raise_not_found: bool = False
     ) -> Optional[str]:
-        """Get prompt with LRU caching for performance.
+        """Get a prompt by name or index.
 
         Args:
             key: Prompt name or index
             default: Default value if not found
             case_insensitive: Enable case-insensitive matching
-            use_cache: Use LRU cache for better performance
+            use_cache: Kept for compatibility; every lookup hits the index
+            fuzzy: Fall back to the closest name (difflib ratio >= 0.8)
+            raise_not_found: Raise KeyError instead of returning ``default``
         """
-        if use_cache:
-            return self._get_cached(key, default, case_insensitive)
-        return self._get_uncached(key, default, case_insensitive)
-
-    def _get_uncached(
-        self,
-        key: Union[str, int],
-        default: Optional[str] = None,
-        case_insensitive: bool = True
-    ) -> Optional[str]:
-        """Core get logic without caching."""
-        with self._cache_lock:
-            prompts = self._cache if self._cache else self._load_prompts()
-
-            # Fast direct lookup
-            if key in prompts:
-                return prompts[key]
-
-            # Case-insensitive search for string keys
-            if isinstance(key, str) and case_insensitive:
-                key_lower = key.lower()
-                for k, v in prompts.items():
-                    if isinstance(k, str) and k.lower() == key_lower:
-                        return v
-
+        prompt = self._index().lookup(key, case_insensitive, fuzzy)
+        if prompt is not None:
+            return prompt
+        if raise_not_found:
+            raise KeyError(f"Prompt '{key}' not found!")
         return default
 
     def add_prompt(self, name: str, prompt: str, validate: bool = True) -> bool:
@@ -221,24 +348,20 @@ class AwesomePrompts:
                 console.print("[red]Name too long (max 100) or prompt too long (max 10000)[/red]")
                 return False
 
-        with self._cache_lock:
-            prompts = self._load_prompts()
+        # Load first: the initial load takes _refresh_lock, which must not be taken inside _lock
+        self._store.current()
+        with self._store._lock:
+            prompts = dict(self._store.current().prompts)
 
             # Check for existing prompt with same content
             if validate:
                 for existing_name, existing_prompt in prompts.items():
-                    if isinstance(existing_name, str) and existing_prompt == prompt:
+                    if existing_prompt == prompt:
                         console.print(f"[yellow]Prompt with same content exists: '{existing_name}'[/yellow]")
                         return False
 
             prompts[name] = prompt
-
-            # Update numeric indices
-            string_keys = [k for k in prompts.keys() if isinstance(k, str)]
-            for i, key in enumerate(string_keys):
-                prompts[i] = prompts[key]
-
-            self._save_prompts(prompts)
+            self._store.replace(prompts)
 
         console.print(f"[green]Added prompt: '{name}'[/green]")
         return True
@@ -249,60 +372,40 @@ class AwesomePrompts:
         case_insensitive: bool = True,
         raise_not_found: bool = False
     ) -> bool:
-        """Delete a prompt with proper cleanup.
+        """Delete a prompt.
 
         Args:
             name: Name or index of prompt to delete
             case_insensitive: Enable case-insensitive matching
             raise_not_found: Raise error if prompt not found?
         """
-        with self._cache_lock:
-            prompts = self._load_prompts()
-
-            # Handle direct key match
-            if name in prompts:
-                del prompts[name]
-
-                # Rebuild numeric indices after deletion
-                string_keys = [k for k in prompts.keys() if isinstance(k, str)]
-                # Remove old numeric indices
-                numeric_keys = [k for k in prompts.keys() if isinstance(k, int)]
-                for key in numeric_keys:
-                    del prompts[key]
-
-                # Add fresh numeric indices
-                for i, key in enumerate(string_keys):
-                    prompts[i] = prompts[key]
-
-                self._save_prompts(prompts)
+        # Load first: the initial load takes _refresh_lock, which must not be taken inside _lock
+        self._store.current()
+        with self._store._lock:
+            index = self._store.current()
+            if isinstance(name, int):
+                target = index.names[name] if -len(index) <= name < len(index) else None
+            elif name in index.prompts:
+                target = name
+            else:
+                target = index._lower.get(name.lower()) if case_insensitive else None
+
+            if target is not None:
+                prompts = dict(index.prompts)
+                del prompts[target]
+                self._store.replace(prompts)
                 console.print(f"[green]Deleted prompt: '{name}'[/green]")
                 return True
 
-            # Handle case-insensitive match
-            if isinstance(name, str) and case_insensitive:
-                name_lower = name.lower()
-                for k in list(prompts.keys()):
-                    if isinstance(k, str) and k.lower() == name_lower:
-                        return self.delete_prompt(k, case_insensitive=False, raise_not_found=raise_not_found)
-
-            if raise_not_found:
-                raise KeyError(f"Prompt '{name}' not found!")
-            console.print(f"[yellow]Prompt '{name}' not found![/yellow]")
-            return False
+        if raise_not_found:
+            raise KeyError(f"Prompt '{name}' not found!")
+        console.print(f"[yellow]Prompt '{name}' not found![/yellow]")
+        return False
 
     @property
     def all_acts(self) -> Dict[Union[str, int], str]:
-        """Get all prompts with optimized indexing."""
-        with self._cache_lock:
-            if self._cache:
-                return self._cache.copy()
-
-        prompts = self._load_prompts()
-        if not prompts:
-            self.update_prompts_from_online()
-            prompts = self._load_prompts()
-
-        return prompts.copy()
+        """Get all prompts by name and by numeric index."""
+        return self._index().to_dict()
 
     def show_acts(self, search: Optional[str] = None, limit: int = 100) -> None:
         """Display prompts with optimized filtering and pagination.
@@ -311,7 +414,7 @@ class AwesomePrompts:
             search: Filter by search term
             limit: Maximum number of prompts to display
         """
-        prompts = self.all_acts
+        prompts = self._index().prompts
 
         # Build filtered list efficiently
         filtered_items = []
@@ -351,11 +454,48 @@ class AwesomePrompts:
 
     def get_random_act(self) -> Optional[str]:
         """Get a random prompt."""
-        prompts = self.all_acts
-        string_keys = [k for k in prompts.keys() if isinstance(k, str)]
-        if not string_keys:
+        index = self._index()
+        if not index.names:
             return None
-        import random
-        return prompts[random.choice(string_keys)]
+        return index.prompts[random.choice(index.names)]
 
     # End of class AwesomePrompts
+
+
+if __name__ == "__main__":
+    # Benchmark: what every provider constructor used to pay (new session, file
+    # read and parse; the default auto_update also downloaded the prompts)
+    # against AwesomePrompts().get_act on the shared store.
+    import json
+    import tempfile
+
+    prompts = {f"Prompt {i}": f"I want you to act as persona number {i}. " * 20 for i in range(2000)}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "prompts.json")
+        Path(path).write_text(json.dumps(prompts), encoding="utf-8")
+        runs = 200
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            session = Session() if CURL_AVAILABLE else requests.Session()
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            data.get("Prompt 1500")
+            session.close()
+        legacy = (time.perf_counter() - start) / runs
+
+        AwesomePrompts(local_path=path).get_act("Prompt 0")  # first use loads the file
+        start = time.perf_counter()
+        for _ in range(runs * 100):
+            AwesomePrompts(local_path=path).get_act("prompt 1500")
+        shared = (time.perf_counter() - start) / (runs * 100)
+
+        start = time.perf_counter()
+        for i in range(runs):
+            AwesomePrompts(local_path=path).get_act(f"Promt {i}", fuzzy=True)
+        fuzzy = (time.perf_counter() - start) / runs
+
+    print(f"{len(prompts)} prompts, {len(json.dumps(prompts)) / 1e6:.1f} MB")
+    print(f"per-instance load (before, without the download) {legacy * 1000:8.3f}ms")
+    print(f"AwesomePrompts().get_act on the shared store      {shared * 1000:8.3f}ms")
+    print(f"first fuzzy lookup of a misspelled name           {fuzzy * 1000:8.3f}ms")
@@ -0,0 +1,190 @@
+"""
+Health-scored provider routing.
+
+Keeps a rolling success rate and latency EWMA per (provider, model) pair and
+uses them to order fallback candidates by expected time to a successful
+answer. Pairs that fail repeatedly get their circuit opened and are skipped
+until a cooldown has passed. After that the pair is half-open: the next
+attempt is a probe, which closes the circuit on success and reopens it for
+another cooldown on failure.
+
+A single process-wide ``HealthRouter`` (see ``get_health_router``) is shared by
+``Client``, ``AUTO`` and the API server so they all learn from each other.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderHealth:
+    """Rolling health statistics for one (provider, model) pair."""
+
+    __slots__ = (
+        "success_rate", "latency", "consecutive_failures", "state",
+        "opened_at", "successes", "failures",
+    )
+
+    def __init__(self, default_latency: float):
+        self.success_rate = 1.0
+        self.latency = default_latency
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.successes = 0
+        self.failures = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "success_rate": round(self.success_rate, 4),
+            "latency": round(self.latency, 4),
+            "consecutive_failures": self.consecutive_failures,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+
+class HealthRouter:
+    """Orders providers by expected latency and trips circuit breakers on repeated failures.
+
+    Args:
+        alpha: EWMA smoothing factor for success rate and latency.
+        failure_threshold: Consecutive failures that open a pair's circuit.
+        cooldown: Seconds an open circuit stays open before a probe is allowed.
+        default_latency: Latency assumed for pairs that have never been tried.
+        failure_penalty: Latency charged to a failed attempt when it has no
+            measured duration (for instance, a failure before any request was sent).
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        default_latency: float = 5.0,
+        failure_penalty: float = 30.0,
+    ):
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.default_latency = default_latency
+        self.failure_penalty = failure_penalty
+        self._stats: Dict[Tuple[str, str], ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, provider: str, model: str) -> ProviderHealth:
+        key = (provider, model)
+        health = self._stats.get(key)
+        if health is None:
+            health = self._stats[key] = ProviderHealth(self.default_latency)
+        return health
+
+    def state(self, provider: str, model: str) -> str:
+        """Return ``closed``, ``open`` or ``half_open`` (open, but the cooldown has passed)."""
+        health = self._stats.get((provider, model))
+        if health is None or health.state == CLOSED:
+            return CLOSED
+        if time.monotonic() - health.opened_at >= self.cooldown:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self, provider: str, model: str) -> bool:
+        """Return whether a request may be sent to ``provider``/``model`` now."""
+        return self.state(provider, model) != OPEN
+
+    def _observe_latency(self, health: ProviderHealth, latency: float) -> None:
+        # The first sample replaces the prior instead of being averaged into it
+        if health.successes + health.failures == 0:
+            health.latency = latency
+        else:
+            health.latency += self.alpha * (latency - health.latency)
+
+    def record_success(self, provider: str, model: str, latency: float) -> None:
+        """Record a successful attempt that took ``latency`` seconds to first output."""
+        with self._lock:
+            health = self._get(provider, model)
+            health.success_rate += self.alpha * (1.0 - health.success_rate)
+            self._observe_latency(health, latency)
+            health.consecutive_failures = 0
+            health.successes += 1
+            health.state = CLOSED
+
+    def record_failure(self, provider: str, model: str, latency: Optional[float] = None) -> None:
+        """Record a failed attempt; ``latency`` is how long it took to fail, if known."""
+        with self._lock:
+            health = self._get(provider, model)
+            health.success_rate -= self.alpha * health.success_rate
+            self._observe_latency(health, self.failure_penalty if latency is None else max(latency, 0.0))
+            health.consecutive_failures += 1
+            health.failures += 1
+            # Also covers a failed half-open probe, which restarts the cooldown
+            if health.consecutive_failures >= self.failure_threshold:
+                health.state = OPEN
+                health.opened_at = time.monotonic()
+
+    def expected_cost(self, provider: str, model: str) -> float:
+        """Expected seconds until a successful answer: latency divided by success rate."""
+        health = self._stats.get((provider, model))
+        if health is None:
+            return self.default_latency
+        return health.latency / max(health.success_rate, 0.01)
+
+    def order(self, candidates: Sequence[T], key: Callable[[T], Tuple[str, str]]) -> List[T]:
+        """Sort ``candidates`` by expected cost, skipping pairs whose circuit is open.
+
+        ``key`` maps a candidate to its (provider, model) pair. Candidates with
+        equal cost (such as pairs never tried) keep a random relative order to
+        spread load. When every candidate is open, they are all returned as a
+        last resort, cheapest first.
+        """
+        shuffled = list(candidates)
+        random.shuffle(shuffled)
+        with self._lock:
+            costs = {id(c): self.expected_cost(*key(c)) for c in shuffled}
+            allowed = [c for c in shuffled if self.state(*key(c)) != OPEN]
+        ordered = allowed or shuffled
+        ordered.sort(key=lambda c: costs[id(c)])
+        return ordered
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current health of every tracked pair keyed by ``provider/model``."""
+        with self._lock:
+            return {
+                f"{provider}/{model}": dict(
+                    health.as_dict(),
+                    state=self.state(provider, model),
+                    expected_cost=round(self.expected_cost(provider, model), 4),
+                )
+                for (provider, model), health in self._stats.items()
+            }
+
+    def reset(self, provider: Optional[str] = None) -> None:
+        """Forget collected statistics for ``provider`` (or for every provider)."""
+        with self._lock:
+            if provider is None:
+                self._stats.clear()
+            else:
+                for key in [k for k in self._stats if k[0] == provider]:
+                    del self._stats[key]
+
+
+_router: Optional[HealthRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_health_router() -> HealthRouter:
+    """Get or create the process-wide health router."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = HealthRouter()
+    return _router
@@ -27,6 +27,8 @@ from typing import (
     overload,
 )
 
+import orjson
+
 # Expanded encoding types
 EncodingType = Literal[
     "utf-8",
@@ -50,6 +52,7 @@ EncodingType = Literal[
 # Public API
 __all__ = [
     "sanitize_stream",
+    "StreamPipeline",
     "LITSTREAM",
     "sanitize_stream_decorator",
     "lit_streamer",
@@ -326,6 +329,723 @@ async def _decode_byte_stream_async(
         yield f"[Encoding Error: Could not decode final bytes with {encoding}]\n"
 
 
+_LINE_BREAKS = re.compile(r"\r\n|\r|\n")
+_LINE_BREAKS_BYTES = re.compile(rb"\r\n|\r|\n")
+# Multi-line JSON events larger than this are given up on and handled as a parse error
+_MAX_PENDING_EVENT = 1 << 20
+# Brackets and quotes outside JSON strings, and the rest of a string up to its closing quote
+_JSON_NESTING = re.compile(r'[\[\]{}"]')
+_JSON_STRING_END = re.compile(r'(?:[^"\\]|\\.)*"')
+
+
+class _LineFramer:
+    """
+    Incremental line framer for SSE/NDJSON streams of ``str`` or ``bytes`` chunks.
+
+    ``feed`` returns the lines completed by a chunk and keeps the unterminated
+    tail for the next one, so a network chunk that ends mid-line is never
+    parsed in two halves. Lines end at ``\\r\\n``, ``\\r`` or ``\\n`` (a
+    ``\\r\\n`` split across two chunks counts once), or at ``delimiter`` when
+    given. Only the new chunk is searched for line breaks; the tail is never
+    rescanned.
+    """
+
+    __slots__ = ("_tail", "_cr", "_delimiter", "_empty", "_lf", "_cr_char", "_split")
+
+    def __init__(self, binary: bool, delimiter: Optional[Union[str, bytes]] = None):
+        self._tail: List[Any] = []
+        self._cr = False
+        self._delimiter = delimiter
+        self._empty, self._lf, self._cr_char = (b"", b"\n", b"\r") if binary else ("", "\n", "\r")
+        self._split = (_LINE_BREAKS_BYTES if binary else _LINE_BREAKS).split
+
+    def feed(self, chunk: Any) -> List[Any]:
+        """Return the lines completed by ``chunk``."""
+        if self._delimiter is not None:
+            if self._tail:
+                chunk = self._empty.join(self._tail) + chunk
+            lines = chunk.split(self._delimiter)
+            last = lines.pop()
+            self._tail = [last] if last else []
+            return lines
+
+        lines: List[Any] = []
+        if self._cr:
+            # The previous chunk ended with "\r"; a leading "\n" completes that "\r\n"
+            self._cr = False
+            if chunk[:1] == self._lf:
+                chunk = chunk[1:]
+
+        cut = max(chunk.rfind(self._lf), chunk.rfind(self._cr_char))
+        if cut == -1:
+            if chunk:
+                self._tail.append(chunk)
+            return lines
+        end = cut
+        if chunk[cut : cut + 1] == self._cr_char:
+            self._cr = cut == len(chunk) - 1
+        elif cut and chunk[cut - 1 : cut] == self._cr_char:
+            end = cut - 1
+        head = chunk[:end]
+        if self._tail:
+            head = self._empty.join(self._tail) + head
+        rest = chunk[cut + 1 :]
+        self._tail = [rest] if rest else []
+        lines.extend(self._split(head))
+        return lines
+
+    def flush(self) -> List[Any]:
+        """Return the unterminated tail as a final line and reset the framer."""
+        self._cr = False
+        if not self._tail:
+            return []
+        tail = self._empty.join(self._tail)
+        self._tail = []
+        return [tail]
+
+
+def _partial_marker_suffix(text: str, marker: str) -> int:
+    """Length of the longest suffix of ``text`` that is a proper prefix of ``marker``."""
+    for size in range(min(len(marker) - 1, len(text)), 0, -1):
+        if text.endswith(marker[:size]):
+            return size
+    return 0
+
+
+def _extract_first(text: str, regexes: List[re.Pattern[str]]) -> Optional[str]:
+    """Apply the first matching extraction regex the way ``_process_chunk`` does."""
+    for regex in regexes:
+        match = regex.search(text)
+        if match:
+            if match.groups():
+                return match.group(1) if len(match.groups()) == 1 else str(match.groups())
+            return match.group(0)
+    return None
+
+
+# Generators of HTTP clients that yield raw network chunks (requests, curl_cffi, httpx)
+_CHUNK_SOURCES = (
+    "iter_content", "stream_decode_response_unicode", "iter_bytes", "iter_text", "iter_raw",
+)
+
+
+def _is_line_source(data: Any, first_item: Any) -> bool:
+    """Whether every item of ``data`` holds whole lines rather than a raw network chunk.
+
+    Only raw chunk streams, such as byte iterables or ``iter_content()``, are
+    reassembled across items. ``iter_lines()`` output, sequences, generator
+    expressions and user generators yield one or more whole lines per item,
+    with or without a trailing line break, and are processed item by item.
+    """
+    if isinstance(data, (list, tuple)):
+        return True
+    qualname = getattr(data, "__qualname__", None) or ""
+    if qualname.endswith("iter_lines"):
+        return True
+    if isinstance(first_item, (bytes, bytearray, memoryview)):
+        return False
+    return not any(source in qualname for source in _CHUNK_SOURCES)
+
+
+class _ParseFailure:
+    """Returned by a compiled line processor when a payload is not valid JSON."""
+
+    __slots__ = ("error", "payload")
+
+    def __init__(self, error: Exception, payload: str):
+        self.error = error
+        self.payload = payload
+
+
+def _loads_text(payload: str) -> Any:
+    """Parse with orjson; ``json`` takes what orjson rejects (NaN, huge integers...)."""
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        try:
+            return json.loads(payload)
+        except Exception as e:
+            # _process_chunk reports non-JSON-looking payloads stripped on both ends
+            if len(payload) >= 2 and payload[0] not in "{[" and payload[-1] not in "}]":
+                payload = payload.strip()
+            return _ParseFailure(e, payload)
+
+
+def _compile_line_processor(
+    intro_value: str,
+    to_json: bool,
+    skip_markers: frozenset,
+    strip_chars: Optional[str],
+    skip_regexes: Optional[List[re.Pattern[str]]],
+    extract_regexes: Optional[List[re.Pattern[str]]],
+) -> Callable[[str], Any]:
+    """
+    Build the per-line function for one configuration.
+
+    Same steps as ``_process_chunk``, but options that are not used are left
+    out instead of being checked on every line. The function returns the
+    processed value, ``None`` to skip the line, or a ``_ParseFailure``.
+    """
+    intro_len = len(intro_value)
+
+    if strip_chars is None and not skip_regexes and not extract_regexes:
+        if to_json:
+
+            def process_json_line(line: str) -> Any:
+                if intro_len and line.startswith(intro_value):
+                    line = line[intro_len:]
+                line = line.lstrip()
+                if not line or line in skip_markers:
+                    return None
+                return _loads_text(line)
+
+            return process_json_line
+
+        def process_text_line(line: str) -> Any:
+            if intro_len and line.startswith(intro_value):
+                line = line[intro_len:]
+            line = line.lstrip()
+            if not line or line in skip_markers:
+                return None
+            return line
+
+        return process_text_line
+
+    def process_line(line: str) -> Any:
+        if intro_len and line.startswith(intro_value):
+            line = line[intro_len:]
+        line = line.strip(strip_chars) if strip_chars is not None else line.lstrip()
+        if not line or line in skip_markers:
+            return None
+        if extract_regexes:
+            extracted = _extract_first(line, extract_regexes)
+            if extracted is not None:
+                line = extracted
+            elif not to_json:
+                return None
+        if skip_regexes and any(regex.search(line) for regex in skip_regexes):
+            return None
+        return _loads_text(line) if to_json else line
+
+    return process_line
+
+
+class StreamPipeline:
+    """
+    A ``sanitize_stream`` configuration compiled once and reused for every stream.
+
+    Providers call ``sanitize_stream`` with the same options on every request;
+    building a ``StreamPipeline`` at class level validates those options,
+    compiles the regexes and specializes the per-line function once. The
+    pipeline holds no per-stream state, so a single instance can serve any
+    number of sync and async streams at the same time.
+
+    Args:
+        Same as :func:`sanitize_stream`, without ``data``, ``object_mode`` and ``raw``.
+
+    Examples:
+        >>> class MyProvider:
+        ...     _pipeline = StreamPipeline(
+        ...         intro_value="data:",
+        ...         skip_markers=["[DONE]"],
+        ...         content_extractor=lambda chunk: chunk.get("text") if isinstance(chunk, dict) else None,
+        ...     )
+        ...
+        ...     def ask(self, response):
+        ...         for text in self._pipeline(response.iter_content(chunk_size=None)):
+        ...             yield text
+    """
+
+    __slots__ = (
+        "intro_value", "to_json", "skip_markers", "strip_chars", "start_marker", "end_marker",
+        "content_extractor", "yield_raw_on_error", "encoding", "encoding_errors", "line_delimiter",
+        "error_handler", "skip_regexes", "extract_regexes", "output_formatter",
+        "process_line", "join_events", "fast_bytes", "codec",
+    )
+
+    def __init__(
+        self,
+        intro_value: str = "data:",
+        to_json: bool = True,
+        skip_markers: Optional[List[str]] = None,
+        strip_chars: Optional[str] = None,
+        start_marker: Optional[str] = None,
+        end_marker: Optional[str] = None,
+        content_extractor: Optional[Callable[[Union[str, Dict[str, Any]]], Optional[Any]]] = None,
+        yield_raw_on_error: bool = True,
+        encoding: EncodingType = "utf-8",
+        encoding_errors: str = "replace",
+        line_delimiter: Optional[str] = None,
+        error_handler: Optional[Callable[[Exception, str], Optional[Any]]] = None,
+        skip_regexes: Optional[List[Union[str, re.Pattern[str]]]] = None,
+        extract_regexes: Optional[List[Union[str, re.Pattern[str]]]] = None,
+        output_formatter: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.intro_value = intro_value or ""
+        self.to_json = to_json
+        self.skip_markers = frozenset(skip_markers or ())
+        self.strip_chars = strip_chars
+        self.start_marker = start_marker or None
+        self.end_marker = end_marker or None
+        self.content_extractor = content_extractor
+        self.yield_raw_on_error = yield_raw_on_error
+        self.encoding = encoding
+        self.encoding_errors = encoding_errors
+        self.line_delimiter = line_delimiter
+        self.error_handler = error_handler
+        self.skip_regexes = _compile_regexes(skip_regexes)
+        self.extract_regexes = _compile_regexes(extract_regexes)
+        self.output_formatter = output_formatter
+        # extract_regexes run on each line unless a content_extractor comes first
+        self.process_line = _compile_line_processor(
+            self.intro_value,
+            to_json,
+            self.skip_markers,
+            strip_chars,
+            self.skip_regexes,
+            self.extract_regexes if not content_extractor else None,
+        )
+        self.join_events = bool(to_json and self.intro_value and not self.extract_regexes)
+        try:
+            self.codec = codecs.lookup(encoding).name
+        except LookupError:
+            self.codec = "utf-8"
+        self.fast_bytes = bool(
+            to_json
+            and self.codec in ("utf-8", "ascii")
+            and not (self.start_marker or self.end_marker or line_delimiter is not None)
+            and strip_chars is None
+            and not (self.skip_regexes or self.extract_regexes)
+            and self.intro_value.isascii()
+        )
+
+    def __call__(
+        self, data: Any, object_mode: Literal["as_is", "json", "str"] = "json"
+    ) -> Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
+        """Alias for :meth:`stream`."""
+        return self.stream(data, object_mode)
+
+    def stream(
+        self, data: Any, object_mode: Literal["as_is", "json", "str"] = "json"
+    ) -> Union[Generator[Any, None, None], AsyncGenerator[Any, None]]:
+        """
+        Process ``data`` like :func:`sanitize_stream` does with this configuration.
+
+        Returns an async generator for async iterables and a generator for
+        everything else (strings, bytes, sync iterables, responses, objects).
+        """
+        if data is None:
+            return self.iter_sync(())
+        if isinstance(data, bytes):
+            try:
+                return self.iter_sync(data.decode(self.encoding, self.encoding_errors))
+            except Exception:
+                return self.iter_sync(str(data))
+        if isinstance(data, str):
+            return self.iter_sync(data)
+        # Handle dict, list, int, float, bool (non-iterable, non-string/bytes)
+        if isinstance(data, (dict, list, int, float, bool)):
+            if object_mode == "as_is":
+
+                def _as_is_gen():
+                    yield data
+
+                return _as_is_gen()
+            if object_mode == "str":
+                return self.iter_sync(str(data))
+            try:
+                json_str = json.dumps(data)
+            except Exception:
+                json_str = str(data)
+            return self.iter_sync(json_str)
+        # Handle file-like objects (treat as string if .read exists)
+        if hasattr(data, "read") and callable(data.read):
+            try:
+                file_content = data.read()
+                if isinstance(file_content, bytes):
+                    file_content = file_content.decode(self.encoding, self.encoding_errors)
+                return self.iter_sync(file_content)
+            except Exception:
+                pass  # fallback to next
+        # Handle .text or .content attributes
+        text_attr = getattr(data, "text", None)
+        content_attr = getattr(data, "content", None)
+        if isinstance(text_attr, str):
+            return self.iter_sync(text_attr)
+        if isinstance(content_attr, bytes):
+            try:
+                return self.iter_sync(content_attr.decode(self.encoding, self.encoding_errors))
+            except Exception:
+                return self.iter_sync(str(content_attr))
+        if hasattr(data, "__aiter__"):
+            return self.iter_async(data)
+        if hasattr(data, "__iter__"):
+            return self.iter_sync(data)
+        # Fallback: treat as string
+        return self.iter_sync(str(data))
+
+    def iter_sync(self, data: Any) -> Generator[Any, None, None]:
+        """Process a string or a sync iterable of strings or bytes."""
+        processor = _StreamProcessor(self)
+        if isinstance(data, str):
+            chunks: Iterable[Any] = (data,)
+            processor.start(data, line_mode=False)
+        elif hasattr(data, "__iter__"):  # data is an iterable (but not a string)
+            _iter = iter(data)
+            first_item = next(_iter, None)
+
+            if first_item is None:  # Iterable was empty
+                return
+            if not isinstance(first_item, (str, bytes, bytearray)):
+                raise TypeError(
+                    f"Iterable must yield strings or bytes, not {type(first_item).__name__}"
+                )
+            chunks = chain([first_item], _iter)
+            processor.start(first_item, _is_line_source(data, first_item))
+        else:  # Not a string and not an iterable
+            raise TypeError(f"Input must be a string or an iterable, not {type(data).__name__}")
+
+        try:
+            for chunk in chunks:
+                yield from processor.feed(chunk)
+            yield from processor.close()
+        except Exception as e:
+            print(f"Stream processing error: {e}", file=sys.stderr)
+
+    async def iter_async(self, data: Any) -> AsyncGenerator[Any, None]:
+        """Process an async iterable of strings or bytes (sync input is accepted too)."""
+        if isinstance(data, str) or not hasattr(data, "__aiter__"):
+            # Strings and sync iterables need no awaiting
+            for item in self.iter_sync(data):
+                yield item
+            return
+
+        iterator = data.__aiter__()
+        first_item = None
+        async for first_item in iterator:
+            break
+        if first_item is None:
+            return
+        if not isinstance(first_item, (str, bytes, bytearray)):
+            raise TypeError(f"Stream must yield strings or bytes, not {type(first_item).__name__}")
+        processor = _StreamProcessor(self)
+        processor.start(first_item, _is_line_source(data, first_item))
+
+        try:
+            for item in processor.feed(first_item):
+                yield item
+            async for chunk in iterator:
+                for item in processor.feed(chunk):
+                    yield item
+            for item in processor.close():
+                yield item
+        except Exception as e:
+            print(f"Async stream processing error: {e}", file=sys.stderr)
+
+
+class _StreamProcessor:
+    """
+    Per-stream state of a ``StreamPipeline``.
+
+    Chunks go in through ``feed``; sanitized output items come out as lists.
+    Bytes are decoded incrementally, then gated by ``start_marker``/``end_marker``,
+    framed into lines by ``_LineFramer`` and handed to the pipeline's compiled
+    line function. A JSON payload spread over several consecutive ``data:``
+    lines is joined with ``\\n`` (as the SSE spec does) and parsed once, when
+    its outer object or array closes.
+
+    Byte streams with a plain JSON configuration (UTF-8, no markers, regexes,
+    ``strip_chars`` or custom delimiter) take a fast path: lines are framed as
+    bytes and parsed with ``orjson`` without decoding them first. Lines that do
+    not parse fall back to the text path, so the output is the same.
+    """
+
+    __slots__ = (
+        "pipeline", "_event", "_event_size", "_event_depth", "_event_in_string",
+        "_active", "_marker_buffer", "_fast",
+        "_line_mode", "_decoder", "_framer", "_intro_bytes", "_skip_bytes",
+    )
+
+    def __init__(self, pipeline: StreamPipeline):
+        self.pipeline = pipeline
+        self._event: Optional[List[str]] = None
+        self._event_size = 0
+        self._event_depth = 0
+        self._event_in_string = False
+        self._active = pipeline.start_marker is None
+        self._marker_buffer = ""
+        self._fast = False
+        self._line_mode = False
+        self._decoder: Any = None
+        self._framer: Optional[_LineFramer] = None
+
+    def start(self, first_item: Any, line_mode: bool) -> None:
+        """Pick text or byte framing from the first item of the stream."""
+        pipeline = self.pipeline
+        self._line_mode = line_mode
+        binary = isinstance(first_item, (bytes, bytearray, memoryview))
+        self._fast = binary and pipeline.fast_bytes
+        if self._fast:
+            self._intro_bytes = pipeline.intro_value.encode()
+            self._skip_bytes = {m.encode(pipeline.codec, "ignore") for m in pipeline.skip_markers}
+        elif binary:
+            try:
+                self._decoder = codecs.getincrementaldecoder(pipeline.encoding)(errors=pipeline.encoding_errors)
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors=pipeline.encoding_errors)
+        self._framer = _LineFramer(self._fast, pipeline.line_delimiter)
+
+    # --- input ---
+
+    def feed(self, chunk: Any) -> List[Any]:
+        """Process one chunk of the stream and return the output items it completed."""
+        out: List[Any] = []
+        if chunk is None:
+            return out
+        pipeline = self.pipeline
+        if self._fast:
+            if isinstance(chunk, str):
+                chunk = chunk.encode(pipeline.encoding, pipeline.encoding_errors)
+            elif not isinstance(chunk, bytes):
+                chunk = bytes(chunk)
+            if self._line_mode:
+                chunk += b"\n"
+            for line in self._framer.feed(chunk):
+                self._line_bytes(line, out)
+            return out
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8")(errors=pipeline.encoding_errors)
+            try:
+                text = self._decoder.decode(chunk, final=False)
+            except UnicodeDecodeError:
+                text = f"[Encoding Error: Could not decode bytes with {pipeline.encoding}]\n"
+        else:
+            text = chunk
+        if self._line_mode:
+            text += "\n" if pipeline.line_delimiter is None else pipeline.line_delimiter
+        if text:
+            self._feed_text(text, out)
+        return out
+
+    def close(self) -> List[Any]:
+        """Flush everything still buffered at the end of the stream."""
+        out: List[Any] = []
+        if self._decoder is not None:
+            try:
+                text = self._decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                text = f"[Encoding Error: Could not decode final bytes with {self.pipeline.encoding}]\n"
+            if text:
+                self._feed_text(text, out)
+        if self._active and self._marker_buffer:
+            self._frame(self._marker_buffer, out)
+        self._marker_buffer = ""
+        self._end_region(out)
+        return out
+
+    def _feed_text(self, text: str, out: List[Any]) -> None:
+        start_marker = self.pipeline.start_marker
+        end_marker = self.pipeline.end_marker
+        if start_marker is None and end_marker is None:
+            self._frame(text, out)
+            return
+        buffer = self._marker_buffer + text
+        while buffer:
+            if not self._active:
+                if not start_marker:
+                    buffer = ""  # the end marker was seen and nothing restarts processing
+                    break
+                idx = buffer.find(start_marker)
+                if idx == -1:
+                    # Keep only what could be the start of a marker split across chunks
+                    buffer = buffer[len(buffer) - _partial_marker_suffix(buffer, start_marker) :]
+                    break
+                buffer = buffer[idx + len(start_marker) :]
+                self._active = True
+            elif end_marker:
+                idx = buffer.find(end_marker)
+                if idx == -1:
+                    keep = _partial_marker_suffix(buffer, end_marker)
+                    self._frame(buffer[: len(buffer) - keep], out)
+                    buffer = buffer[len(buffer) - keep :]
+                    break
+                self._frame(buffer[:idx], out)
+                self._end_region(out)
+                buffer = buffer[idx + len(end_marker) :]
+                self._active = False
+            else:
+                self._frame(buffer, out)
+                buffer = ""
+        self._marker_buffer = buffer
+
+    def _frame(self, text: str, out: List[Any]) -> None:
+        if text:
+            for line in self._framer.feed(text):
+                self._line(line, out)
+
+    def _end_region(self, out: List[Any]) -> None:
+        """Flush the framer tail and any pending multi-line event."""
+        for line in self._framer.flush():
+            if self._fast:
+                self._line_bytes(line, out)
+            else:
+                self._line(line, out)
+        self._flush_event(out)
+
+    # --- lines ---
+
+    def _line_bytes(self, line: bytes, out: List[Any]) -> None:
+        """Fast path: parse a byte line with orjson; anything unusual takes the text path."""
+        if self._event is None:
+            intro = self._intro_bytes
+            payload = line[len(intro) :] if intro and line.startswith(intro) else line
+            payload = payload.lstrip()
+            if not payload or payload in self._skip_bytes:
+                return
+            try:
+                result = orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                self._emit(result, out)
+                return
+        self._line(line.decode(self.pipeline.encoding, self.pipeline.encoding_errors), out)
+
+    def _line(self, line: str, out: List[Any]) -> None:
+        if self._event is not None:
+            if self._continues_event(line):
+                self._extend_event(line, out)
+                return
+            self._flush_event(out)
+        if not line:
+            return
+        result = self.pipeline.process_line(line)
+        if result is None:
+            return
+        if type(result) is _ParseFailure:
+            pipeline = self.pipeline
+            if (
+                pipeline.join_events
+                and result.payload[:1] in ("{", "[")
+                and line.startswith(pipeline.intro_value)
+            ):
+                # Keep an unclosed object/array payload: its next data: lines may complete it
+                self._event_depth = 0
+                self._event_in_string = False
+                if not self._scan_event(result.payload):
+                    self._event = [result.payload]
+                    self._event_size = len(result.payload)
+                    return
+            result = self._parse_failed(result.error, result.payload)
+            if result is None:
+                return
+        self._emit(result, out)
+
+    def _parse_failed(self, error: Exception, payload: str) -> Optional[Any]:
+        """Apply ``error_handler`` and ``yield_raw_on_error`` like ``_process_chunk`` does."""
+        pipeline = self.pipeline
+        if pipeline.error_handler:
+            try:
+                handled = pipeline.error_handler(error, payload)
+                if handled is not None:
+                    return handled
+            except Exception:
+                pass
+        return payload if pipeline.yield_raw_on_error else None
+
+    def _continues_event(self, line: str) -> bool:
+        intro_value = self.pipeline.intro_value
+        if not line.startswith(intro_value):
+            return False
+        payload = line[len(intro_value) :].lstrip()
+        if not payload or payload in self.pipeline.skip_markers:
+            return False
+        if payload[:1] in ("{", "["):
+            # A payload that parses by itself is the next event, not a continuation
+            try:
+                json.loads(payload)
+            except ValueError:
+                return True
+            return False
+        return True
+
+    def _extend_event(self, line: str, out: List[Any]) -> None:
+        payload = line[len(self.pipeline.intro_value) :]
+        if payload[:1] == " ":
+            payload = payload[1:]
+        self._event.append(payload)
+        self._event_size += len(payload) + 1
+        # The event is parsed once, when its top-level value closes
+        if self._scan_event(payload) or self._event_size > _MAX_PENDING_EVENT:
+            self._flush_event(out)
+
+    def _scan_event(self, text: str) -> bool:
+        """Track the nesting of the pending event over ``text``; True once it is back to zero.
+
+        Only the new line is scanned, so an event of many lines costs one pass.
+        """
+        depth = self._event_depth
+        in_string = self._event_in_string
+        pos = 0
+        closed = False
+        while True:
+            if in_string:
+                match = _JSON_STRING_END.match(text, pos)
+                if match is None:
+                    break
+                in_string = False
+            else:
+                match = _JSON_NESTING.search(text, pos)
+                if match is None:
+                    break
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth <= 0:
+                        closed = True
+                        break
+            pos = match.end()
+        self._event_depth = depth
+        self._event_in_string = in_string
+        return closed
+
+    def _flush_event(self, out: List[Any]) -> None:
+        """Give up on a pending multi-line event: report it like any other parse failure."""
+        if self._event is None:
+            return
+        text = "\n".join(self._event)
+        self._event = None
+        try:
+            result = json.loads(text)
+        except ValueError as e:
+            result = self._parse_failed(e, text)
+        if result is not None:
+            self._emit(result, out)
+
+    def _emit(self, result: Any, out: List[Any]) -> None:
+        pipeline = self.pipeline
+        formatter = pipeline.output_formatter
+        if pipeline.content_extractor is None:
+            out.append(formatter(result) if formatter is not None else result)
+            return
+        try:
+            final_content = pipeline.content_extractor(result)
+            if final_content is None:
+                return
+            if pipeline.extract_regexes and isinstance(final_content, str):
+                final_content = _extract_first(final_content, pipeline.extract_regexes)
+                if final_content is None:
+                    return
+            out.append(formatter(final_content) if formatter is not None else final_content)
+        except Exception:
+            pass
+
+
 def _sanitize_stream_sync(
     data: Any,
     intro_value: str = "data:",
@@ -354,6 +1074,11 @@ def _sanitize_stream_sync(
     and extracting specific content. It also supports custom error handling for JSON parsing failures
     and output response formatting.
 
+    Raw byte chunks (``iter_content()``) are framed incrementally: a line split
+    across two chunks is joined before it is parsed. Items of any other
+    iterable (``iter_lines()``, lists, generators of strings) are taken as whole
+    lines, with or without a trailing line break.
+
     Args:
         data: String, iterable of strings, or iterable of bytes to process.
         intro_value: Prefix indicating the start of meaningful data.
@@ -366,9 +1091,9 @@ def _sanitize_stream_sync(
         yield_raw_on_error: Yield raw lines when JSON parsing fails.
         encoding: Byte stream encoding.
         encoding_errors: How to handle encoding errors.
-        buffer_size: Buffer size for byte decoding.
+        buffer_size: Kept for backwards compatibility; decoding is incremental.
         line_delimiter: Delimiter used to split incoming text into lines. ``None``
-            uses ``str.splitlines()``.
+            splits on ``\\r\\n``, ``\\r`` and ``\\n``.
         error_handler: Callback invoked with ``(Exception, str)`` when JSON
             parsing fails. If the callback returns a value, it is yielded instead of the raw line.
         skip_regexes: List of regex patterns (strings or compiled) for skipping lines that match.
@@ -402,210 +1127,24 @@ def _sanitize_stream_sync(
             return
     # --- END RAW MODE ---
 
-    # --- OUTPUT FORMATTING SETUP ---
-    def _apply_output_format(item: Any) -> Any:
-        """Apply output formatting to a processed item."""
-        if output_formatter is not None:
-            return output_formatter(item)
-        return item
-
-    # --- END OUTPUT FORMATTING SETUP ---
-
-    effective_skip_markers = skip_markers or []
-    # Compile regex patterns
-    compiled_skip_regexes = _compile_regexes(skip_regexes)
-    compiled_extract_regexes = _compile_regexes(extract_regexes)
-
-    processing_active = start_marker is None
-    buffer = ""
-    found_start = False if start_marker else True
-    line_iterator: Iterable[str]
-
-    if isinstance(data, str):
-        # If data is a string, decide whether to split it into lines
-        # or treat it as an iterable containing a single chunk.
-        temp_lines: List[str]
-        if line_delimiter is None:  # Default: split by newlines if present
-            if "\n" in data or "\r" in data:
-                temp_lines = data.splitlines()
-            else:
-                temp_lines = [data]  # Treat as a single line/chunk
-        elif line_delimiter in data:  # Custom delimiter found in string
-            temp_lines = data.split(line_delimiter)
-        else:  # Custom delimiter not found, or string is effectively a single segment
-            temp_lines = [data]
-        line_iterator = iter(temp_lines)
-    elif hasattr(data, "__iter__"):  # data is an iterable (but not a string)
-        _iter = iter(data)
-        first_item = next(_iter, None)
-
-        if first_item is None:  # Iterable was empty
-            return
-
-        # Reconstruct the full iterable including the first_item
-        stream_input_iterable = chain([first_item], _iter)
-
-        if isinstance(first_item, bytes):
-            # Ensure stream_input_iterable is typed as Iterable[bytes] for _decode_byte_stream
-            line_iterator = _decode_byte_stream(
-                stream_input_iterable,  # type: ignore
-                encoding=encoding,
-                errors=encoding_errors,
-                buffer_size=buffer_size,
-            )
-        elif isinstance(first_item, str):
-            # Ensure stream_input_iterable is typed as Iterable[str]
-            line_iterator = stream_input_iterable  # type: ignore
-        else:
-            raise TypeError(
-                f"Iterable must yield strings or bytes, not {type(first_item).__name__}"
-            )
-    else:  # Not a string and not an iterable
-        raise TypeError(f"Input must be a string or an iterable, not {type(data).__name__}")
-
-    try:
-        for line in line_iterator:
-            if not line:
-                continue
-            buffer += line
-            while True:
-                # Look for start marker if needed
-                if not found_start and start_marker:
-                    idx = buffer.find(start_marker)
-                    if idx != -1:
-                        found_start = True
-                        buffer = buffer[idx + len(start_marker) :]
-                    else:
-                        # Not found, keep buffering
-                        buffer = buffer[-max(len(start_marker), 256) :]  # avoid unbounded growth
-                        break
-                # Look for end marker if needed
-                if found_start and end_marker:
-                    idx = buffer.find(end_marker)
-                    if idx != -1:
-                        chunk = buffer[:idx]
-                        buffer = buffer[idx + len(end_marker) :]
-                        processing_active = False
-                    else:
-                        chunk = buffer
-                        buffer = ""
-                        processing_active = True
-                    # Process chunk if we are in active region
-                    if chunk and processing_active:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    if not processing_active:
-                        found_start = False
-                    if idx == -1:
-                        break
-                elif found_start:
-                    # No end marker, process all buffered content
-                    chunk = buffer
-                    buffer = ""
-                    if chunk:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    break
-                else:
-                    break
-    except Exception as e:
-        print(f"Stream processing error: {e}", file=sys.stderr)
+    pipeline = StreamPipeline(
+        intro_value,
+        to_json,
+        skip_markers,
+        strip_chars,
+        start_marker,
+        end_marker,
+        content_extractor,
+        yield_raw_on_error,
+        encoding,
+        encoding_errors,
+        line_delimiter,
+        error_handler,
+        skip_regexes,
+        extract_regexes,
+        output_formatter,
+    )
+    yield from pipeline.iter_sync(data)
 
 
 async def _sanitize_stream_async(
@@ -648,8 +1187,8 @@ async def _sanitize_stream_async(
         yield_raw_on_error: Yield raw lines when JSON parsing fails.
         encoding: Byte stream encoding.
         encoding_errors: How to handle encoding errors.
-        buffer_size: Buffer size for byte decoding.
-        line_delimiter: Delimiter used to split incoming text into lines. ``None`` uses ``str.splitlines()``.
+        buffer_size: Kept for backwards compatibility; decoding is incremental.
+        line_delimiter: Delimiter used to split incoming text into lines. ``None`` splits on ``\\r\\n``, ``\\r`` and ``\\n``.
         error_handler: Callback invoked with ``(Exception, str)`` when JSON parsing fails. If the callback returns a value, it is yielded in place of the raw line.
         skip_regexes: List of regex patterns (strings or compiled) for skipping lines that match.
         extract_regexes: List of regex patterns (strings or compiled) for extracting content using capturing groups.
@@ -681,243 +1220,25 @@ async def _sanitize_stream_async(
             return
     # --- END RAW MODE ---
 
-    if isinstance(data, str):
-        for item in _sanitize_stream_sync(
-            data,
-            intro_value=intro_value,
-            to_json=to_json,
-            skip_markers=skip_markers,
-            strip_chars=strip_chars,
-            start_marker=start_marker,
-            end_marker=end_marker,
-            content_extractor=content_extractor,
-            yield_raw_on_error=yield_raw_on_error,
-            encoding=encoding,
-            encoding_errors=encoding_errors,
-            buffer_size=buffer_size,
-            line_delimiter=line_delimiter,
-            error_handler=error_handler,
-            skip_regexes=skip_regexes,
-            extract_regexes=extract_regexes,
-            raw=raw,
-            output_formatter=output_formatter,
-        ):
-            yield item
-        return
-
-    if not hasattr(data, "__aiter__"):
-        # Fallback to synchronous processing if possible
-        for item in _sanitize_stream_sync(
-            data,
-            intro_value=intro_value,
-            to_json=to_json,
-            skip_markers=skip_markers,
-            strip_chars=strip_chars,
-            start_marker=start_marker,
-            end_marker=end_marker,
-            content_extractor=content_extractor,
-            yield_raw_on_error=yield_raw_on_error,
-            encoding=encoding,
-            encoding_errors=encoding_errors,
-            buffer_size=buffer_size,
-            line_delimiter=line_delimiter,
-            error_handler=error_handler,
-            skip_regexes=skip_regexes,
-            extract_regexes=extract_regexes,
-            raw=raw,
-            output_formatter=output_formatter,
-        ):
-            yield item
-        return
-
-    # --- OUTPUT FORMATTING SETUP FOR ASYNC ---
-    def _apply_output_format(item: Any) -> Any:
-        """Apply output formatting to a processed item."""
-        if output_formatter is not None:
-            return output_formatter(item)
-        return item
-
-    # --- END OUTPUT FORMATTING SETUP ---
-
-    effective_skip_markers = skip_markers or []
-    # Compile regex patterns
-    compiled_skip_regexes = _compile_regexes(skip_regexes)
-    compiled_extract_regexes = _compile_regexes(extract_regexes)
-
-    processing_active = start_marker is None
-    buffer = ""
-    found_start = False if start_marker else True
-
-    iterator = data.__aiter__()
-    first_item = None
-    async for first_item in iterator:
-        break
-    if first_item is None:
-        return
-
-    async def _chain(first, it):
-        yield first
-        async for x in it:
-            yield x
-
-    stream = _chain(first_item, iterator)
-
-    if isinstance(first_item, bytes):
-        line_iterator = _decode_byte_stream_async(
-            stream,
-            encoding=encoding,
-            errors=encoding_errors,
-            buffer_size=buffer_size,
-        )
-    elif isinstance(first_item, str):
-        line_iterator = stream
-    else:
-        raise TypeError(f"Stream must yield strings or bytes, not {type(first_item).__name__}")
-
-    try:
-        async for line in line_iterator:
-            if not line:
-                continue
-            buffer += line
-            while True:
-                # Look for start marker if needed
-                if not found_start and start_marker:
-                    idx = buffer.find(start_marker)
-                    if idx != -1:
-                        found_start = True
-                        buffer = buffer[idx + len(start_marker) :]
-                    else:
-                        # Not found, keep buffering
-                        buffer = buffer[-max(len(start_marker), 256) :]
-                        break
-                # Look for end marker if needed
-                if found_start and end_marker:
-                    idx = buffer.find(end_marker)
-                    if idx != -1:
-                        chunk = buffer[:idx]
-                        buffer = buffer[idx + len(end_marker) :]
-                        processing_active = False
-                    else:
-                        chunk = buffer
-                        buffer = ""
-                        processing_active = True
-                    # Process chunk if we are in active region
-                    if chunk and processing_active:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    if not processing_active:
-                        found_start = False
-                    if idx == -1:
-                        break
-                elif found_start:
-                    # No end marker, process all buffered content
-                    chunk = buffer
-                    buffer = ""
-                    if chunk:
-                        for subline in (
-                            chunk.split(line_delimiter)
-                            if line_delimiter is not None
-                            else chunk.splitlines()
-                        ):
-                            use_extract_in_process = (
-                                compiled_extract_regexes if not content_extractor else None
-                            )
-
-                            result = _process_chunk(
-                                subline,
-                                intro_value,
-                                to_json,
-                                effective_skip_markers,
-                                strip_chars,
-                                yield_raw_on_error,
-                                error_handler,
-                                compiled_skip_regexes,
-                                use_extract_in_process,
-                            )
-                            if result is None:
-                                continue
-                            if content_extractor:
-                                try:
-                                    final_content = content_extractor(result)
-                                    if final_content is not None:
-                                        # Apply extract_regexes to extracted content if provided
-                                        if compiled_extract_regexes and isinstance(
-                                            final_content, str
-                                        ):
-                                            extracted = None
-                                            for regex in compiled_extract_regexes:
-                                                match = regex.search(final_content)
-                                                if match:
-                                                    if match.groups():
-                                                        extracted = (
-                                                            match.group(1)
-                                                            if len(match.groups()) == 1
-                                                            else str(match.groups())
-                                                        )
-                                                    else:
-                                                        extracted = match.group(0)
-                                                    break
-                                            if extracted is not None:
-                                                yield _apply_output_format(extracted)
-                                        else:
-                                            yield _apply_output_format(final_content)
-                                except Exception:
-                                    pass
-                            else:
-                                yield _apply_output_format(result)
-                    break
-                else:
-                    break
-    except Exception as e:
-        print(f"Async stream processing error: {e}", file=sys.stderr)
+    pipeline = StreamPipeline(
+        intro_value,
+        to_json,
+        skip_markers,
+        strip_chars,
+        start_marker,
+        end_marker,
+        content_extractor,
+        yield_raw_on_error,
+        encoding,
+        encoding_errors,
+        line_delimiter,
+        error_handler,
+        skip_regexes,
+        extract_regexes,
+        output_formatter,
+    )
+    async for item in pipeline.iter_async(data):
+        yield item
 
 
 @overload
@@ -1099,248 +1420,7 @@ def sanitize_stream(
             return _yield_single()
     # --- END RAW MODE ---
 
-    text_attr = getattr(data, "text", None)
-    content_attr = getattr(data, "content", None)
-
-    # Handle None
-    if data is None:
-
-        def _empty_gen():
-            if False:
-                yield None
-
-        return _empty_gen()
-
-    # Handle bytes directly
-    if isinstance(data, bytes):
-        try:
-            payload = data.decode(encoding, encoding_errors)
-        except Exception:
-            payload = str(data)
-        return _sanitize_stream_sync(
-            payload,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-
-    # Handle string directly
-    if isinstance(data, str):
-        return _sanitize_stream_sync(
-            data,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-
-    # Handle dict, list, int, float, bool (non-iterable, non-string/bytes)
-    if isinstance(data, (dict, list, int, float, bool)):
-        if object_mode == "as_is":
-
-            def _as_is_gen():
-                yield data
-
-            return _as_is_gen()
-        elif object_mode == "str":
-            return _sanitize_stream_sync(
-                str(data),
-                intro_value,
-                to_json,
-                skip_markers,
-                strip_chars,
-                start_marker,
-                end_marker,
-                content_extractor,
-                yield_raw_on_error,
-                encoding,
-                encoding_errors,
-                buffer_size,
-                line_delimiter,
-                error_handler,
-                skip_regexes,
-                extract_regexes,
-                raw,
-                output_formatter,
-            )
-        else:  # "json"
-            try:
-                json_str = json.dumps(data)
-            except Exception:
-                json_str = str(data)
-            return _sanitize_stream_sync(
-                json_str,
-                intro_value,
-                to_json,
-                skip_markers,
-                strip_chars,
-                start_marker,
-                end_marker,
-                content_extractor,
-                yield_raw_on_error,
-                encoding,
-                encoding_errors,
-                buffer_size,
-                line_delimiter,
-                error_handler,
-                skip_regexes,
-                extract_regexes,
-                raw,
-                output_formatter,
-            )
-
-    # Handle file-like objects (optional, treat as string if .read exists)
-    if hasattr(data, "read") and callable(data.read):
-        try:
-            file_content = data.read()
-            if isinstance(file_content, bytes):
-                file_content = file_content.decode(encoding, encoding_errors)
-            return _sanitize_stream_sync(
-                file_content,
-                intro_value,
-                to_json,
-                skip_markers,
-                strip_chars,
-                start_marker,
-                end_marker,
-                content_extractor,
-                yield_raw_on_error,
-                encoding,
-                encoding_errors,
-                buffer_size,
-                line_delimiter,
-                error_handler,
-                skip_regexes,
-                extract_regexes,
-                raw,
-                output_formatter,
-            )
-        except Exception:
-            pass  # fallback to next
-
-    # Handle .text or .content attributes
-    if isinstance(text_attr, str):
-        payload = text_attr
-        return _sanitize_stream_sync(
-            payload,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-    elif isinstance(content_attr, bytes):
-        try:
-            payload = content_attr.decode(encoding, encoding_errors)
-        except Exception:
-            payload = str(content_attr)
-        return _sanitize_stream_sync(
-            payload,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-
-    # Handle async iterables
-    if hasattr(data, "__aiter__"):
-        return _sanitize_stream_async(
-            data,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-    # Handle sync iterables (but not strings/bytes)
-    if hasattr(data, "__iter__"):
-        return _sanitize_stream_sync(
-            data,
-            intro_value,
-            to_json,
-            skip_markers,
-            strip_chars,
-            start_marker,
-            end_marker,
-            content_extractor,
-            yield_raw_on_error,
-            encoding,
-            encoding_errors,
-            buffer_size,
-            line_delimiter,
-            error_handler,
-            skip_regexes,
-            extract_regexes,
-            raw,
-            output_formatter,
-        )
-    # Fallback: treat as string
-    return _sanitize_stream_sync(
-        str(data),
+    return StreamPipeline(
         intro_value,
         to_json,
         skip_markers,
@@ -1351,14 +1431,12 @@ def sanitize_stream(
         yield_raw_on_error,
         encoding,
         encoding_errors,
-        buffer_size,
         line_delimiter,
         error_handler,
         skip_regexes,
         extract_regexes,
-        raw,
         output_formatter,
-    )
+    ).stream(data, object_mode)
 
 
 # --- Decorator version of sanitize_stream ---
@@ -1478,3 +1556,139 @@ def __getattr__(name):
     if name == "lit_streamer":
         return _sanitize_stream_decorator
     raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
+if __name__ == "__main__":
+    # Fuzz/benchmark harness: replays recorded streams cut at random chunk
+    # boundaries, checks every replay yields the same events as the unsplit
+    # stream, and reports events/sec.
+    #   python -m webscout.sanitize [recording ...] [--trials N]
+    # A recording is a raw response body saved to a file (SSE or NDJSON).
+    import random
+    import time
+    from pathlib import Path
+
+    args = sys.argv[1:]
+    trials = 200
+    if "--trials" in args:
+        i = args.index("--trials")
+        trials = int(args[i + 1])
+        del args[i : i + 2]
+    rng = random.Random(0)
+
+    def _sample_sse(events: int, newline: str) -> bytes:
+        parts = []
+        for i in range(events):
+            event = {"id": f"chatcmpl-{i}", "choices": [{"delta": {"content": f"tok {i} ü 😀   "}}]}
+            parts.append(f"data: {json.dumps(event, ensure_ascii=False)}{newline}{newline}")
+        # One event spread over several data: lines, then the end marker
+        parts.append(f'data: {{"id": "multi",{newline}data:  "choices": []}}{newline}{newline}')
+        parts.append(f"data: [DONE]{newline}{newline}")
+        return "".join(parts).encode()
+
+    def _sample_ndjson(events: int) -> bytes:
+        return b"".join(orjson.dumps({"message": {"content": f"tok {i} é"}, "done": False}) + b"\n" for i in range(events))
+
+    recordings = {
+        "openai-sse-lf": (_sample_sse(5000, "\n"), "data:"),
+        "openai-sse-crlf": (_sample_sse(5000, "\r\n"), "data:"),
+        "ndjson": (_sample_ndjson(5000), ""),
+    }
+    for path in args:
+        body = Path(path).read_bytes()
+        recordings[Path(path).name] = (body, "" if body.lstrip()[:1] in (b"{", b"[") else "data:")
+
+    def _split(body: bytes, low: int, high: int) -> List[bytes]:
+        chunks, pos = [], 0
+        while pos < len(body):
+            size = rng.randint(low, high)
+            chunks.append(body[pos : pos + size])
+            pos += size
+        return chunks
+
+    def _as_text(chunks: List[bytes]) -> List[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        return [decoder.decode(c) for c in chunks]
+
+    def iter_text(chunks: List[str]) -> Generator[str, None, None]:
+        # Named like httpx's Response.iter_text: decoded network chunks, not lines
+        yield from chunks
+
+    def _replay(chunks: List[Any], intro: str) -> List[Any]:
+        source = iter_text(chunks) if isinstance(chunks[0], str) else iter(chunks)
+        return list(_sanitize_stream_sync(source, intro_value=intro, skip_markers=["[DONE]"]))
+
+    # Generators of unterminated lines are processed item by item, never glued together
+    @lit_streamer(skip_markers=["[DONE]"], to_json=True)
+    def streaming_response():
+        yield 'data: {"message": "hello"}'
+        yield 'data: {"message": "world"}'
+        yield '[DONE]'
+
+    assert list(streaming_response()) == [{"message": "hello"}, {"message": "world"}]
+    assert list(sanitize_stream(f'data: {{"n": {i}}}' for i in range(3))) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    for name, (body, intro) in recordings.items():
+        expected = _replay([body], intro)
+        failures = 0
+        for _ in range(trials):
+            # Chunk sizes from 1 byte (cuts through every multi-byte character) up to a few KB
+            high = rng.choice((2, 16, 256, 4096))
+            chunks = _split(body, 1, high)
+            if _replay(chunks, intro) != expected:
+                failures += 1
+            if _replay(_as_text(chunks), intro) != expected:
+                failures += 1
+        print(f"{name}: {len(body) / 1e6:.1f} MB, {len(expected)} events, {failures} mismatches in {2 * trials} replays")
+
+        for label, chunks in (
+            ("bytes, 16 KB chunks", _split(body, 16384, 16384)),
+            ("bytes, 1-4 KB chunks", _split(body, 1024, 4096)),
+            ("bytes, 64 B chunks", _split(body, 64, 64)),
+            ("text, 1-4 KB chunks", _as_text(_split(body, 1024, 4096))),
+        ):
+            best = float("inf")
+            for _ in range(3):
+                started = time.perf_counter()
+                count = len(_replay(chunks, intro))
+                best = min(best, time.perf_counter() - started)
+            print(f"  {label:<22} {count / best:12,.0f} events/s  {len(body) / best / 1e6:7.1f} MB/s")
+
+    # Compiled pipeline vs the generic per-line path (_process_chunk, as sanitize_stream
+    # used to run) on a multi-megabyte stream with a typical provider configuration
+    def _delta(chunk: Any) -> Optional[str]:
+        if isinstance(chunk, dict) and chunk.get("choices"):
+            return chunk["choices"][0]["delta"].get("content")
+        return None
+
+    def _generic_line(line: str) -> Any:
+        return _process_chunk(line, "data:", True, ["[DONE]"], None, True, None, None, None)
+
+    big = _sample_sse(60000, "\n")
+    text_chunks = _as_text(_split(big, 1024, 4096))
+    compiled = StreamPipeline(skip_markers=["[DONE]"], content_extractor=_delta)
+    generic = StreamPipeline(skip_markers=["[DONE]"], content_extractor=_delta)
+    generic.process_line = _generic_line
+    print(f"pipeline: {len(big) / 1e6:.1f} MB stream, 1-4 KB text chunks, content_extractor")
+    timings = {}
+    for label, pipeline in (("generic per-line path", generic), ("compiled StreamPipeline", compiled)):
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            count = sum(1 for _ in pipeline(iter_text(text_chunks)))
+            best = min(best, time.perf_counter() - started)
+        timings[label] = best
+        print(f"  {label:<24} {count / best:12,.0f} events/s  {len(big) / best / 1e6:7.1f} MB/s")
+    print(f"  speedup: {timings['generic per-line path'] / timings['compiled StreamPipeline']:.2f}x")
+
+    # Per-request overhead: many short responses through sanitize_stream() vs a prebuilt pipeline
+    small = _sample_sse(20, "\n")
+    rounds = 2000
+    for label, run in (
+        ("sanitize_stream() per call", lambda: list(sanitize_stream(iter([small]), skip_markers=["[DONE]"], content_extractor=_delta))),
+        ("prebuilt StreamPipeline", lambda: list(compiled(iter([small])))),
+    ):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            run()
+        print(f"  {label:<28} {(time.perf_counter() - started) / rounds * 1e6:8.1f} us per 20-event response")
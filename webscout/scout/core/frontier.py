@@ -0,0 +1,299 @@
+"""
+Scout Crawl Frontier - prioritized, per-host polite URL scheduling.
+
+Every host has its own priority queue and token bucket. A host is handed out
+again only after its previous request was released and the bucket allows
+another request, so ``delay`` (and robots ``Crawl-delay``) is enforced per
+host while requests to different hosts run concurrently. The frontier can be
+persisted to SQLite so a long crawl can be stopped and resumed.
+"""
+
+import asyncio
+import heapq
+import itertools
+import sqlite3
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+QUEUED, DONE, FAILED, DUPLICATE = 0, 1, 2, 3
+
+
+class TokenBucket:
+    """
+    Token bucket that allows one request every ``interval`` seconds.
+
+    Args:
+        interval (float): Seconds needed to refill one token (0 disables the limit)
+        burst (int): Maximum number of tokens that can accumulate
+    """
+
+    __slots__ = ("interval", "burst", "tokens", "updated")
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = max(0.0, interval)
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.interval:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) / self.interval)
+        else:
+            self.tokens = float(self.burst)
+        self.updated = now
+
+    def ready_at(self, now: Optional[float] = None) -> float:
+        """Return the monotonic time at which the next token is available."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        return now if self.tokens >= 1 else now + (1 - self.tokens) * self.interval
+
+    def take(self, now: Optional[float] = None) -> None:
+        """Consume a token; the caller must have waited until :meth:`ready_at`."""
+        self._refill(time.monotonic() if now is None else now)
+        self.tokens -= 1
+
+
+class _Host:
+    __slots__ = ("queue", "bucket", "busy", "scheduled")
+
+    def __init__(self, delay: float):
+        self.queue: List[Tuple[float, int, str, int]] = []  # (priority, seq, url, depth)
+        self.bucket = TokenBucket(delay)
+        self.busy = False
+        self.scheduled = False
+
+
+class CrawlFrontier:
+    """
+    Persistent crawl frontier with per-host politeness.
+
+    URLs are deduplicated by ``key(url)``; within a host the lowest priority
+    value is served first (the depth by default, i.e. breadth-first). Each
+    URL handed out by :meth:`get` must be finished with :meth:`complete`,
+    :meth:`fail`, :meth:`duplicate` or :meth:`requeue`, and its host freed
+    with :meth:`release`.
+
+    Args:
+        path (str or Path, optional): SQLite file to persist the frontier to; in memory if omitted
+        delay (float): Default seconds between requests to the same host
+        key (callable, optional): Maps a URL to its deduplication key
+        flush_every (int): Number of state changes buffered before writing to disk
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        delay: float = 0.0,
+        key: Optional[Callable[[str], str]] = None,
+        flush_every: int = 200,
+    ):
+        self.delay = delay
+        self.key = key or (lambda url: url)
+        self.flush_every = max(1, flush_every)
+        self._hosts: Dict[str, _Host] = {}
+        self._ready: List[Tuple[float, float, int, str]] = []  # (ready_at, priority, seq, host)
+        self._seen: Dict[str, int] = {}  # key -> state
+        self._seq = itertools.count()
+        self._queued = 0
+        self._outstanding = 0  # handed out but not yet completed, failed or requeued
+        self._changed: Optional[asyncio.Event] = None
+        self._pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        self.crawled = 0
+        self.failed = 0
+        self.duplicates = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS frontier ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, depth INTEGER NOT NULL, "
+                "priority REAL NOT NULL, state INTEGER NOT NULL)"
+            )
+            self._load()
+
+    def _load(self) -> None:
+        """Restore the frontier; URLs that were in flight when it stopped are queued again."""
+        rows = self._db.execute("SELECT key, url, depth, priority, state FROM frontier ORDER BY rowid")
+        for key, url, depth, priority, state in rows:
+            self._seen[key] = state
+            if state == QUEUED:
+                self._push(url, depth, priority)
+            elif state == DONE:
+                self.crawled += 1
+            elif state == DUPLICATE:
+                self.duplicates += 1
+            else:
+                self.failed += 1
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the politeness key (``host[:port]``) of ``url``."""
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _host(self, host: str) -> _Host:
+        entry = self._hosts.get(host)
+        if entry is None:
+            entry = self._hosts[host] = _Host(self.delay)
+        return entry
+
+    def _schedule(self, host: str, entry: _Host) -> None:
+        if entry.queue and not entry.busy and not entry.scheduled:
+            entry.scheduled = True
+            heapq.heappush(self._ready, (entry.bucket.ready_at(), entry.queue[0][0], next(self._seq), host))
+            self._notify()
+
+    def _push(self, url: str, depth: int, priority: float) -> None:
+        host = self.host_of(url)
+        entry = self._host(host)
+        heapq.heappush(entry.queue, (priority, next(self._seq), url, depth))
+        self._queued += 1
+        self._schedule(host, entry)
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    def _write(self, sql: str, params: Tuple[Any, ...]) -> None:
+        if self._db is not None:
+            self._pending.append((sql, params))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write buffered state changes to disk."""
+        if self._db is None or not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._db.execute("BEGIN")
+        try:
+            for sql, params in pending:
+                self._db.execute(sql, params)
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def add(self, url: str, depth: int = 0, priority: Optional[float] = None) -> bool:
+        """
+        Queue ``url`` unless its key has been seen before.
+
+        Returns:
+            bool: True if the URL was queued
+        """
+        key = self.key(url)
+        if key in self._seen:
+            return False
+        priority = float(depth if priority is None else priority)
+        self._seen[key] = QUEUED
+        self._write("INSERT OR IGNORE INTO frontier VALUES (?, ?, ?, ?, ?)", (key, url, depth, priority, QUEUED))
+        self._push(url, depth, priority)
+        return True
+
+    def seen(self, url: str) -> bool:
+        """Return whether ``url`` has already been queued, crawled or failed."""
+        return self.key(url) in self._seen
+
+    def set_delay(self, host: str, delay: float) -> None:
+        """Set the minimum seconds between requests to ``host``, e.g. from robots ``Crawl-delay``."""
+        self._host(host).bucket.interval = max(0.0, delay)
+
+    async def get(self) -> Optional[Tuple[str, int]]:
+        """
+        Wait for the best URL whose host may be contacted now.
+
+        Returns:
+            Tuple of (url, depth), or None once nothing is queued or outstanding
+        """
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        while True:
+            self._changed.clear()
+            if self._ready:
+                ready_at, _, _, host = self._ready[0]
+                wait = ready_at - time.monotonic()
+                if wait <= 0:
+                    heapq.heappop(self._ready)
+                    entry = self._hosts[host]
+                    entry.scheduled = False
+                    _, _, url, depth = heapq.heappop(entry.queue)
+                    entry.busy = True
+                    entry.bucket.take()
+                    self._queued -= 1
+                    self._outstanding += 1
+                    return url, depth
+                # Wake up when the host is ready, or earlier if another host is queued.
+                # (asyncio.wait_for can swallow a cancellation here before Python 3.12)
+                timer = asyncio.get_running_loop().call_later(wait, self._changed.set)
+                try:
+                    await self._changed.wait()
+                finally:
+                    timer.cancel()
+            elif not self._outstanding:
+                return None
+            else:
+                await self._changed.wait()
+
+    def release(self, url: str) -> None:
+        """Free the host of ``url`` for its next request once its bucket allows it."""
+        host = self.host_of(url)
+        entry = self._host(host)
+        entry.busy = False
+        self._schedule(host, entry)
+
+    def _finish(self, url: str, state: int) -> None:
+        key = self.key(url)
+        self._seen[key] = state
+        self._outstanding -= 1
+        self._write("UPDATE frontier SET state = ? WHERE key = ?", (state, key))
+        self._notify()
+
+    def complete(self, url: str) -> None:
+        """Mark ``url`` as crawled."""
+        self.crawled += 1
+        self._finish(url, DONE)
+
+    def fail(self, url: str) -> None:
+        """Mark ``url`` as failed; it is not retried on resume."""
+        self.failed += 1
+        self._finish(url, FAILED)
+
+    def duplicate(self, url: str) -> None:
+        """Mark ``url`` as a near-duplicate of a crawled page; it is not retried on resume."""
+        self.duplicates += 1
+        self._finish(url, DUPLICATE)
+
+    def requeue(self, url: str, depth: int, priority: Optional[float] = None) -> None:
+        """Put a URL handed out by :meth:`get` back into the queue and free its host."""
+        self._outstanding -= 1
+        entry = self._host(self.host_of(url))
+        entry.busy = False
+        self._push(url, depth, float(depth if priority is None else priority))
+
+    def stats(self) -> Dict[str, int]:
+        """Return queue, in-flight and completion counters."""
+        return {
+            "queued": self._queued,
+            "outstanding": self._outstanding,
+            "crawled": self.crawled,
+            "failed": self.failed,
+            "duplicates": self.duplicates,
+            "seen": len(self._seen),
+            "hosts": len(self._hosts),
+        }
+
+    def __len__(self) -> int:
+        return self._queued
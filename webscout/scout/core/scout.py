@@ -7,10 +7,10 @@ import json
 import re
 import unicodedata
 import urllib.parse
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from ..element import NavigableString, Tag
-from ..parsers import ParserRegistry
+from ..parsers import LXMLParser, ParserRegistry
 from ..utils import decode_markup
 from .search_result import ScoutSearchResult
 from .text_analyzer import ScoutTextAnalyzer
@@ -67,6 +67,8 @@ class Scout:
 
         # Parse that HTML! 🎯
         self._soup = self.parser.parse(self.markup)
+        if isinstance(self._soup, Tag):
+            self._soup.reindex()  # tag/id/class indexes for find, find_all and select
 
         # Set up the root element properly
         if hasattr(self._soup, "name"):
@@ -84,12 +86,47 @@ class Scout:
         # Advanced parsing options and caching
         self._cache = {}
         self._tag_name_cache = {}
-        self._css_selector_cache = {}
 
         # Text and web analyzers
         self.text_analyzer = ScoutTextAnalyzer()
         self.web_analyzer = ScoutWebAnalyzer()
 
+    @staticmethod
+    def iterparse(
+        chunks: Union[str, bytes, Iterable[Union[str, bytes]]],
+        tag: Optional[Union[str, List[str]]] = None,
+        attrs: Optional[Dict[str, Any]] = None,
+        features: str = "lxml",
+        discard: bool = True,
+        encoding: Optional[str] = None,
+    ) -> Iterator[Tag]:
+        """
+        Stream-parse markup and yield matching elements as soon as they are complete.
+
+        Unlike ``Scout(markup)``, the page is never held whole: chunks (for example
+        ``response.iter_content()`` of a streamed request) go straight into lxml's
+        incremental parser, and with ``discard=True`` finished subtrees are freed.
+
+        Args:
+            chunks: Iterable of str/bytes chunks, or one str/bytes
+            tag (str or List[str], optional): Tag name(s) to yield; every element if omitted
+            attrs (dict, optional): Attribute filters, e.g. ``{'href': True}``
+            features (str): 'lxml' for HTML or 'lxml-xml' for XML
+            discard (bool): Free processed subtrees to keep memory bounded
+            encoding (str, optional): Encoding of byte chunks (default utf-8)
+
+        Yields:
+            Tag: Detached elements in end-tag order (children before their parents)
+
+        Example:
+            >>> for link in Scout.iterparse(response.iter_content(), 'a', {'href': True}):
+            ...     print(link.get('href'))
+        """
+        if features not in ("lxml", "lxml-xml"):
+            raise ValueError(f"Incremental parsing needs lxml; use features='lxml' or 'lxml-xml', not '{features}'")
+        parser = LXMLParser("xml" if features == "lxml-xml" else "html")
+        return parser.iterparse(chunks, tag, attrs, discard, encoding)
+
     def normalize_text(self, text: str, form="NFKD") -> str:
         """
         Normalize text using Unicode normalization.
@@ -525,17 +562,18 @@ class Scout:
         """
         return self._soup.find_all_previous(name, attrs, text, limit, **kwargs)
 
-    def select(self, selector: str) -> List[Tag]:
+    def select(self, selector: str, limit: Optional[int] = None) -> List[Tag]:
         """
         Select elements using CSS selector.
 
         Args:
-            selector (str): CSS selector string
+            selector (str or CompiledSelector): CSS selector string
+            limit (int, optional): Maximum number of results
 
         Returns:
             List[Tag]: List of matching elements
         """
-        return self._soup.select(selector)
+        return self._soup.select(selector, limit)
 
     def select_one(self, selector: str) -> Optional[Tag]:
         """
@@ -3,7 +3,14 @@ Scout Element Module - Advanced HTML Element Representation
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .selector import CompiledSelector, compile_selector
+
+# Class attributes are split on whitespace and commas
+_CLASS_SPLIT = re.compile(r"[\s,]+")
 
 
 class NavigableString(str):
@@ -59,12 +66,97 @@ class NavigableString(str):
         return NavigableString(super().strip(chars))
 
 
+class _DocumentIndex:
+    """
+    Lookup tables for one document tree, built in a single preorder walk.
+
+    Every tag records its preorder position (``_pos``) and the position of its
+    last descendant (``_end``), so the tags of any subtree are a contiguous
+    range of each table and a query on a subtree is a bisect plus a slice.
+    """
+
+    __slots__ = ("root", "valid", "tags", "by_name", "by_id", "by_class")
+
+    def __init__(self, root: "Tag"):
+        self.root = root
+        self.valid = True
+        self.tags: List["Tag"] = []
+        # key -> (positions, tags), both in document order
+        self.by_name: Dict[str, Tuple[List[int], List["Tag"]]] = {}
+        self.by_id: Dict[Any, Tuple[List[int], List["Tag"]]] = {}
+        self.by_class: Dict[str, Tuple[List[int], List["Tag"]]] = {}
+
+        tags = self.tags
+        by_name, by_id, by_class = self.by_name, self.by_id, self.by_class
+        stack = [root]
+        while stack:
+            tag = stack.pop()
+            pos = len(tags)
+            tag._doc = self
+            tag._pos = pos
+            tags.append(tag)
+            name = tag.name
+            key = name.lower() if isinstance(name, str) else name
+            entry = by_name.get(key)  # _add inlined: this runs for every tag
+            if entry is None:
+                by_name[key] = ([pos], [tag])
+            else:
+                entry[0].append(pos)
+                entry[1].append(tag)
+            attrs = tag.attrs
+            if attrs:
+                tag_id = attrs.get("id")
+                if isinstance(tag_id, str):
+                    self._add(by_id, tag_id, pos, tag)
+                if "class" in attrs:
+                    for cls in set(tag._class_list()):
+                        self._add(by_class, cls, pos, tag)
+            children = [child for child in tag.contents if isinstance(child, Tag)]
+            if children:
+                children.reverse()
+                stack.extend(children)
+        # A subtree ends where its last child's subtree ends; children come later in preorder
+        for tag in reversed(tags):
+            end = tag._pos
+            for child in reversed(tag.contents):
+                if isinstance(child, Tag) and child._doc is self:
+                    end = child._end
+                    break
+            tag._end = end
+
+    @staticmethod
+    def _add(table: Dict[Any, Tuple[List[int], List["Tag"]]], key: Any, pos: int, tag: "Tag") -> None:
+        entry = table.get(key)
+        if entry is None:
+            table[key] = ([pos], [tag])
+        else:
+            entry[0].append(pos)
+            entry[1].append(tag)
+
+    def subtree(self, tag: "Tag", entry: Optional[Tuple[List[int], List["Tag"]]] = None) -> List["Tag"]:
+        """Return the tags of ``entry`` (default: all tags) inside ``tag``'s subtree."""
+        if entry is None:
+            return self.tags if tag is self.root else self.tags[tag._pos:tag._end + 1]
+        positions, tags = entry
+        if tag is self.root:
+            return tags
+        return tags[bisect_left(positions, tag._pos):bisect_right(positions, tag._end)]
+
+
 class Tag:
     """
     Represents an HTML tag with advanced traversal and manipulation capabilities.
     Enhanced to closely mimic BS4's Tag class.
+
+    Tags compare and hash by identity. ``find``/``find_all``/``select`` answer
+    from per-document indexes by tag name, id and class, built on the first
+    query (``Scout`` builds them right after parsing). The mutation methods keep
+    the indexes current; after editing ``contents`` or ``attrs`` in place, call
+    ``reindex()``.
     """
 
+    __slots__ = ("name", "attrs", "contents", "parent", "_doc", "_pos", "_end", "_class_source", "_classes")
+
     def __init__(self, name: str, attrs: Dict[str, str] = None):
         """
         Initialize a Tag with name and attributes.
@@ -73,11 +165,15 @@ class Tag:
             name (str): Tag name
             attrs (dict, optional): Tag attributes
         """
-        self.name = name
+        self.name = sys.intern(name) if type(name) is str else name
         self.attrs = attrs or {}
         self.contents = []
         self.parent = None
-        self.string = None  # For single string content
+        self._doc: Optional[_DocumentIndex] = None
+        self._pos = 0
+        self._end = 0
+        self._class_source: Any = None
+        self._classes: Tuple[str, ...] = ()
 
     def __str__(self):
         """String representation of the tag."""
@@ -118,37 +214,98 @@ class Tag:
         """
         return self.attrs[key]
 
-    def __iter__(self):
+    def __setitem__(self, key, value):
         """
-        Iterate through tag's contents.
+        Set an attribute value using dictionary-like access.
 
-        Returns:
-            Iterator: Contents of the tag
+        Args:
+            key (str): Attribute name
+            value (Any): Attribute value
         """
-        return iter(self.contents)
+        self.attrs[key] = value
+        self._touch()
 
-    def __eq__(self, other):
+    def __delitem__(self, key):
         """
-        Compare tags based on name and attributes.
+        Delete an attribute using dictionary-like access.
 
         Args:
-            other (Tag): Tag to compare
-
-        Returns:
-            bool: True if tags are equivalent
+            key (str): Attribute name
         """
-        if not isinstance(other, Tag):
-            return False
-        return self.name == other.name and self.attrs == other.attrs and str(self) == str(other)
+        del self.attrs[key]
+        self._touch()
 
-    def __hash__(self):
+    def __iter__(self):
         """
-        Generate a hash for the tag.
+        Iterate through tag's contents.
 
         Returns:
-            int: Hash value
+            Iterator: Contents of the tag
         """
-        return hash((self.name, frozenset(self.attrs.items()), str(self)))
+        return iter(self.contents)
+
+    def _touch(self, *others: Any) -> None:
+        """Mark the index of this tag's document (and of ``others``) as stale."""
+        if self._doc is not None:
+            self._doc.valid = False
+        for other in others:
+            doc = getattr(other, "_doc", None)
+            if doc is not None:
+                doc.valid = False
+
+    def _index(self) -> _DocumentIndex:
+        """Return a current index for the document containing this tag."""
+        doc = self._doc
+        if doc is None or not doc.valid:
+            root = self
+            while root.parent is not None:
+                root = root.parent
+            doc = _DocumentIndex(root)
+            if self._doc is not doc:
+                # Removed from its parent's contents but still linked to it (decompose keeps parent)
+                doc = _DocumentIndex(self)
+        return doc
+
+    def reindex(self) -> None:
+        """Rebuild the search indexes of the document containing this tag."""
+        self._touch()
+        self._index()
+
+    def _class_list(self) -> Union[List[str], Tuple[str, ...]]:
+        """Return the tag's classes, splitting (and caching) a class string once."""
+        value = self.attrs.get("class")
+        if isinstance(value, list):
+            return value
+        if value is not self._class_source:
+            self._class_source = value
+            self._classes = tuple(cls for cls in _CLASS_SPLIT.split(value) if cls) if isinstance(value, str) else ()
+        return self._classes
+
+    def _candidates(self, names: Any = None, tag_id: Any = None, classes: Any = ()) -> List["Tag"]:
+        """
+        Return this tag and its descendants that can match, in document order.
+
+        The narrowest of the name, id and class tables is used; the result is a
+        superset of the matches and still has to be filtered by the caller.
+        """
+        doc = self._index()
+        options = []
+        if isinstance(tag_id, str):
+            options.append(doc.by_id.get(tag_id, ((), ())))
+        for cls in classes:
+            options.append(doc.by_class.get(cls, ((), ())))
+        if isinstance(names, str):
+            options.append(doc.by_name.get(names.lower(), ((), ())))
+        elif isinstance(names, (list, tuple)) and all(isinstance(n, str) for n in names):
+            found = [doc.by_name[key] for key in {n.lower() for n in names} if key in doc.by_name]
+            if len(found) == 1:
+                options.append(found[0])
+            else:
+                merged = sorted((pair for pos, tags in found for pair in zip(pos, tags)), key=lambda p: p[0])
+                options.append(([p for p, _ in merged], [t for _, t in merged]))
+        if not options:
+            return doc.subtree(self)
+        return doc.subtree(self, min(options, key=lambda entry: len(entry[0])))
 
     def find(
         self, name=None, attrs={}, recursive=True, text=None, limit=None, class_=None, **kwargs
@@ -210,63 +367,61 @@ class Tag:
         """
         results = []
 
+        # Normalize the query once instead of for every node
+        search_attrs = dict(attrs)
+        if class_ is not None:
+            search_attrs["class"] = class_
+        wanted_classes: Any = None
+        if "class" in search_attrs:
+            v = search_attrs["class"]
+            if isinstance(v, str):
+                wanted_classes = [c for c in _CLASS_SPLIT.split(v) if c]
+            elif isinstance(v, list):
+                wanted_classes = v
+        lower_name = name.lower() if isinstance(name, str) else None
+        lower_names = {n.lower() for n in name} if isinstance(name, (list, tuple)) else None
+
         def _match(tag):
             # Check tag name with case-insensitive and regex support
             if name:
-                if isinstance(name, str):
-                    if name != "*" and tag.name.lower() != name.lower():
+                if lower_name is not None:
+                    if lower_name != "*" and tag.name.lower() != lower_name:
                         return False
                 elif isinstance(name, re.Pattern):
                     if not name.search(tag.name):
                         return False
-                elif isinstance(name, (list, tuple)):
-                    if tag.name.lower() not in [n.lower() for n in name]:
+                elif lower_names is not None:
+                    if tag.name.lower() not in lower_names:
                         return False
 
             # Check attributes with more flexible matching
-            # Handle class_ parameter if provided
-            search_attrs = dict(attrs)
-            if class_ is not None:
-                search_attrs["class"] = class_
-
             for k, v in search_attrs.items():
-                tag_attr = tag.attrs.get(k)
-
                 if k == "class":
                     # Support multiple classes and whole-word matching
-                    tag_classes = tag_attr
-                    if isinstance(tag_classes, str):
-                        tag_classes = [
-                            c.strip() for c in re.split(r"[ ,]+", tag_classes) if c.strip()
-                        ]
-                    elif not isinstance(tag_classes, list):
-                        tag_classes = []
-
-                    if isinstance(v, str):
-                        v_classes = [c.strip() for c in re.split(r"[ ,]+", v) if c.strip()]
-                        if not all(cls in tag_classes for cls in v_classes):
-                            return False
-                    elif isinstance(v, list):
-                        if not all(cls in tag_classes for cls in v):
+                    tag_classes = tag._class_list()
+                    if wanted_classes is not None:
+                        if not all(cls in tag_classes for cls in wanted_classes):
                             return False
                     elif isinstance(v, re.Pattern):
                         if not any(v.search(cls) for cls in tag_classes):
                             return False
                     else:
                         return False
-                else:
-                    # Regex or exact match for other attributes
-                    if v is True:
-                        if tag_attr is None:
-                            return False
-                    elif v is False:
-                        if tag_attr is not None:
-                            return False
-                    elif isinstance(v, re.Pattern):
-                        if tag_attr is None or not v.search(str(tag_attr)):
-                            return False
-                    elif tag_attr != v:
+                    continue
+
+                tag_attr = tag.attrs.get(k)
+                # Regex or exact match for other attributes
+                if v is True:
+                    if tag_attr is None:
+                        return False
+                elif v is False:
+                    if tag_attr is not None:
                         return False
+                elif isinstance(v, re.Pattern):
+                    if tag_attr is None or not v.search(str(tag_attr)):
+                        return False
+                elif tag_attr != v:
+                    return False
 
             # Check text content
             if text:
@@ -280,285 +435,56 @@ class Tag:
 
             return True
 
-        def _search(element):
-            if _match(element):
-                results.append(element)
+        if not recursive:
+            return [self] if _match(self) else []
+
+        names = name if name and name != "*" and not isinstance(name, re.Pattern) else None
+        tag_id = search_attrs.get("id")
+        classes = wanted_classes if wanted_classes and all(isinstance(c, str) for c in wanted_classes) else ()
+        candidates = self._candidates(names=names, tag_id=tag_id, classes=classes)
+        # A query on a single name, id or class is answered by its table alone
+        criteria = (names is not None) + isinstance(tag_id, str) + len(classes)
+        exact_name = names is not None or not name or name == "*"
+        if criteria == 1 and exact_name and not text and len(search_attrs) == (names is None):
+            return list(candidates[:limit] if limit else candidates)
+        for tag in candidates:
+            if _match(tag):
+                results.append(tag)
                 if limit and len(results) == limit:
-                    return
-
-            if recursive:
-                for child in element.contents:
-                    if isinstance(child, Tag):
-                        _search(child)
-
-        _search(self)
+                    break
         return results
 
-    def select(self, selector: str) -> List["Tag"]:
+    def select(self, selector: Union[str, "CompiledSelector"], limit: Optional[int] = None) -> List["Tag"]:
         """
         Select elements using CSS selector.
-        Enhanced to support more complex selectors including:
-        - Tag selectors: 'p', 'div'
-        - Class selectors: '.class', 'p.class'
-        - ID selectors: '#id', 'div#id'
-        - Attribute selectors: '[attr]', '[attr=value]'
-        - Descendant selectors: 'div p'
-        - Child selectors: 'div > p'
-        - Multiple classes: '.class1.class2'
+        Supports type, class, ID and attribute selectors (``=``, ``~=``,
+        ``|=``, ``^=``, ``$=``, ``*=``), the descendant, child (``>``),
+        adjacent (``+``) and general sibling (``~``) combinators, selector
+        lists and structural pseudo-classes such as ``:nth-child()``; see
+        ``webscout.scout.selector``. Compiled selectors are cached.
 
         Args:
-            selector (str): CSS selector string
+            selector (str or CompiledSelector): CSS selector string
+            limit (int, optional): Maximum number of results
 
         Returns:
             List[Tag]: List of matching elements
         """
+        if isinstance(selector, str):
+            selector = compile_selector(selector)
+        return selector.select(self, limit)
 
-        def _parse_simple_selector(simple_sel: str) -> dict:
-            """Parse a simple selector like 'p.class#id[attr=value]' into components."""
-            components = {"tag": None, "id": None, "classes": [], "attrs": {}}
-
-            # Extract tag name (at the start)
-            tag_match = re.match(r"^([a-zA-Z][\w-]*)", simple_sel)
-            if tag_match:
-                components["tag"] = tag_match.group(1)
-                simple_sel = simple_sel[len(tag_match.group(1)) :]
-
-            # Extract ID
-            id_matches = re.findall(r"#([\w-]+)", simple_sel)
-            if id_matches:
-                components["id"] = id_matches[0]
-
-            # Extract classes
-            class_matches = re.findall(r"\.([\w-]+)", simple_sel)
-            components["classes"] = class_matches
-
-            # Extract attributes
-            attr_matches = re.findall(r"\[([^\]]+)\]", simple_sel)
-            for attr_expr in attr_matches:
-                if "=" in attr_expr:
-                    attr_name, attr_value = attr_expr.split("=", 1)
-                    components["attrs"][attr_name.strip()] = attr_value.strip("'\"")
-                else:
-                    components["attrs"][attr_expr.strip()] = None
-
-            return components
-
-        def _match_simple_selector(tag: "Tag", components: dict) -> bool:
-            """Check if a tag matches the parsed selector components."""
-            # Check tag name
-            if components["tag"] and tag.name != components["tag"]:
-                return False
-
-            # Check ID
-            if components["id"] and tag.get("id") != components["id"]:
-                return False
-
-            # Check classes
-            tag_classes = tag.get("class", "")
-            if isinstance(tag_classes, str):
-                tag_classes = tag_classes.split()
-            elif not isinstance(tag_classes, list):
-                tag_classes = [str(tag_classes)] if tag_classes else []
-
-            for cls in components["classes"]:
-                if cls not in tag_classes:
-                    return False
-
-            # Check attributes
-            for attr_name, attr_value in components["attrs"].items():
-                if attr_value is None:
-                    # Just check attribute exists
-                    if attr_name not in tag.attrs:
-                        return False
-                else:
-                    # Check attribute value
-                    if tag.get(attr_name) != attr_value:
-                        return False
-
-            return True
-
-        def _find_all_matching(element: "Tag", components: dict) -> List["Tag"]:
-            """Recursively find all elements matching the selector components."""
-            matches = []
-
-            # Check current element
-            if _match_simple_selector(element, components):
-                matches.append(element)
-
-            # Check children recursively
-            for child in element.contents:
-                if isinstance(child, Tag):
-                    matches.extend(_find_all_matching(child, components))
-
-            return matches
-
-        # Handle combinators (descendant ' ' and child '>')
-        if " > " in selector:
-            # Child combinator
-            parts = [p.strip() for p in selector.split(" > ")]
-            return self._select_with_child_combinator(parts)
-        elif " " in selector.strip():
-            # Descendant combinator
-            parts = [p.strip() for p in selector.split()]
-            return self._select_with_descendant_combinator(parts)
-        else:
-            # Simple selector
-            components = _parse_simple_selector(selector)
-            return _find_all_matching(self, components)
-
-    def _select_with_descendant_combinator(self, parts: List[str]) -> List["Tag"]:
-        """Handle descendant combinator (space)."""
-        if not parts:
-            return []
-
-        if len(parts) == 1:
-            components = self._parse_selector_components(parts[0])
-            return self._find_all_matching_in_tree(self, components)
-
-        # Find elements matching the first part
-        first_components = self._parse_selector_components(parts[0])
-        first_matches = self._find_all_matching_in_tree(self, first_components)
-
-        # For each match, find descendants matching remaining parts
-        results = []
-        remaining_selector = " ".join(parts[1:])
-        for match in first_matches:
-            descendants = match.select(remaining_selector)
-            results.extend(descendants)
-
-        return results
-
-    def _select_with_child_combinator(self, parts: List[str]) -> List["Tag"]:
-        """Handle child combinator (>)."""
-        if not parts:
-            return []
-
-        if len(parts) == 1:
-            components = self._parse_selector_components(parts[0])
-            return self._find_all_matching_in_tree(self, components)
-
-        # Find elements matching the first part
-        first_components = self._parse_selector_components(parts[0])
-        first_matches = self._find_all_matching_in_tree(self, first_components)
-
-        # For each match, find direct children matching the next part
-        if len(parts) == 2:
-            # Last part, just check direct children
-            next_components = self._parse_selector_components(parts[1])
-            results = []
-            for match in first_matches:
-                for child in match.contents:
-                    if isinstance(child, Tag) and self._match_selector_components(
-                        child, next_components
-                    ):
-                        results.append(child)
-            return results
-        else:
-            # More parts, need to continue recursively
-            results = []
-            next_components = self._parse_selector_components(parts[1])
-            remaining_parts = parts[2:]
-            for match in first_matches:
-                for child in match.contents:
-                    if isinstance(child, Tag) and self._match_selector_components(
-                        child, next_components
-                    ):
-                        # Continue with remaining parts
-                        remaining_selector = " > ".join(remaining_parts)
-                        descendants = child.select(remaining_selector)
-                        results.extend(descendants)
-            return results
-
-    def _parse_selector_components(self, simple_sel: str) -> dict:
-        """Parse a simple selector like 'p.class#id[attr=value]' into components."""
-        components = {"tag": None, "id": None, "classes": [], "attrs": {}}
-
-        # Extract tag name (at the start)
-        tag_match = re.match(r"^([a-zA-Z][\w-]*)", simple_sel)
-        if tag_match:
-            components["tag"] = tag_match.group(1)
-            simple_sel = simple_sel[len(tag_match.group(1)) :]
-
-        # Extract ID
-        id_matches = re.findall(r"#([\w-]+)", simple_sel)
-        if id_matches:
-            components["id"] = id_matches[0]
-
-        # Extract classes
-        class_matches = re.findall(r"\.([\w-]+)", simple_sel)
-        components["classes"] = class_matches
-
-        # Extract attributes
-        attr_matches = re.findall(r"\[([^\]]+)\]", simple_sel)
-        for attr_expr in attr_matches:
-            if "=" in attr_expr:
-                attr_name, attr_value = attr_expr.split("=", 1)
-                components["attrs"][attr_name.strip()] = attr_value.strip("'\"")
-            else:
-                components["attrs"][attr_expr.strip()] = None
-
-        return components
-
-    def _match_selector_components(self, tag: "Tag", components: dict) -> bool:
-        """Check if a tag matches the parsed selector components."""
-        # Check tag name
-        if components["tag"] and tag.name != components["tag"]:
-            return False
-
-        # Check ID
-        if components["id"] and tag.get("id") != components["id"]:
-            return False
-
-        # Check classes
-        tag_classes = tag.get("class", "")
-        if isinstance(tag_classes, str):
-            tag_classes = tag_classes.split()
-        elif not isinstance(tag_classes, list):
-            tag_classes = [str(tag_classes)] if tag_classes else []
-
-        for cls in components["classes"]:
-            if cls not in tag_classes:
-                return False
-
-        # Check attributes
-        for attr_name, attr_value in components["attrs"].items():
-            if attr_value is None:
-                # Just check attribute exists
-                if attr_name not in tag.attrs:
-                    return False
-            else:
-                # Check attribute value
-                if tag.get(attr_name) != attr_value:
-                    return False
-
-        return True
-
-    def _find_all_matching_in_tree(self, element: "Tag", components: dict) -> List["Tag"]:
-        """Recursively find all elements matching the selector components."""
-        matches = []
-
-        # Check current element
-        if self._match_selector_components(element, components):
-            matches.append(element)
-
-        # Check children recursively
-        for child in element.contents:
-            if isinstance(child, Tag):
-                matches.extend(self._find_all_matching_in_tree(child, components))
-
-        return matches
-
-    def select_one(self, selector: str) -> Optional["Tag"]:
+    def select_one(self, selector: Union[str, "CompiledSelector"]) -> Optional["Tag"]:
         """
         Select the first element matching the CSS selector.
 
         Args:
-            selector (str): CSS selector string
+            selector (str or CompiledSelector): CSS selector string
 
         Returns:
             Tag or None: First matching element
         """
-        results = self.select(selector)
+        results = self.select(selector, limit=1)
         return results[0] if results else None
 
     def get_text(self, separator=" ", strip=False, types=None) -> str:
@@ -641,6 +567,7 @@ class Tag:
     def decompose(self) -> None:
         """Remove the tag and its contents from the document."""
         if self.parent:
+            self._touch(self.parent)
             self.parent.contents.remove(self)
 
     def extract(self) -> "Tag":
@@ -655,6 +582,7 @@ class Tag:
 
     def clear(self) -> None:
         """Remove all contents of the tag."""
+        self._touch()
         self.contents.clear()
 
     @property
@@ -687,6 +615,7 @@ class Tag:
         """Append a new child to this tag with error handling."""
         if isinstance(new_child, str):
             new_child = NavigableString(new_child)
+        self._touch(new_child)
         if hasattr(new_child, "parent"):
             new_child.parent = self
         self.contents.append(new_child)
@@ -700,6 +629,7 @@ class Tag:
         """Insert a new child at the given index with error handling."""
         if isinstance(new_child, str):
             new_child = NavigableString(new_child)
+        self._touch(new_child)
         if hasattr(new_child, "parent"):
             new_child.parent = self
         self.contents.insert(index, new_child)
@@ -707,6 +637,7 @@ class Tag:
     def replace_with(self, new_tag: "Tag") -> None:
         """Replace this tag with another tag with error handling."""
         if self.parent:
+            self._touch(self.parent, new_tag)
             try:
                 index = self.parent.contents.index(self)
                 self.parent.contents[index] = new_tag
@@ -716,6 +647,7 @@ class Tag:
 
     def wrap(self, wrapper_tag: "Tag") -> "Tag":
         """Wrap this tag in another tag."""
+        self._touch(self.parent, wrapper_tag)
         if self.parent:
             idx = self.parent.contents.index(self)
             self.parent.contents[idx] = wrapper_tag
@@ -729,6 +661,7 @@ class Tag:
     def unwrap(self) -> None:
         """Remove this tag but keep its contents in the parent."""
         if self.parent:
+            self._touch(self.parent)
             idx = self.parent.contents.index(self)
             for child in reversed(self.contents):
                 child.parent = self.parent
@@ -740,6 +673,7 @@ class Tag:
     def insert_before(self, new_element: "Tag") -> None:
         """Insert a tag or string immediately before this tag."""
         if self.parent:
+            self._touch(self.parent, new_element)
             idx = self.parent.contents.index(self)
             new_element.parent = self.parent
             self.parent.contents.insert(idx, new_element)
@@ -747,6 +681,7 @@ class Tag:
     def insert_after(self, new_element: "Tag") -> None:
         """Insert a tag or string immediately after this tag."""
         if self.parent:
+            self._touch(self.parent, new_element)
             idx = self.parent.contents.index(self)
             new_element.parent = self.parent
             self.parent.contents.insert(idx + 1, new_element)
@@ -861,3 +796,71 @@ class Tag:
             return result
 
         return _prettify(self)
+
+
+if __name__ == "__main__":
+    # Benchmark: repeated queries on a ~5 MB page, indexed lookups vs the
+    # recursive full-tree walk (re-splitting class strings) they replace.
+    import time
+
+    from webscout.scout import Scout, element
+
+    block = (
+        '<div class="result b_algo" id="r{i}"><h2><a href="https://example.com/{i}" class="title">'
+        "Result {i}</a></h2><p class=\"snippet\">Snippet text for result number {i}, "
+        "with a few more words of body text.</p><ul><li class=\"meta\">{i}</li>"
+        '<li class="meta date">2024</li></ul></div>'
+    )
+    blocks = []
+    size = 0
+    while size < 5_000_000:
+        blocks.append(block.format(i=len(blocks)))
+        size += len(blocks[-1])
+    html = "<html><body><main>" + "".join(blocks) + "</main></body></html>"
+    target = f"r{len(blocks) // 2}"
+
+    start = time.perf_counter()
+    soup = Scout(html, features="lxml")
+    parsed = time.perf_counter() - start
+    start = time.perf_counter()
+    soup._soup.reindex()
+    indexed = time.perf_counter() - start
+    print(f"{len(html) / 1e6:.1f} MB, {len(soup._soup._index().tags):,} tags: "
+          f"parse {parsed:.2f}s, index build {indexed * 1000:.0f}ms")
+
+    def legacy_find_all(root, name=None, cls=None, tag_id=None):
+        found = []
+
+        def walk(tag):
+            if (name is None or tag.name.lower() == name) and (tag_id is None or tag.attrs.get("id") == tag_id):
+                classes = [c.strip() for c in re.split(r"[ ,]+", tag.attrs.get("class", "")) if c.strip()]
+                if cls is None or cls in classes:
+                    found.append(tag)
+            for child in tag.contents:
+                if isinstance(child, element.Tag):
+                    walk(child)
+
+        walk(root)
+        return found
+
+    cases = [
+        ("find_all('a')", lambda: soup.find_all("a"), lambda: legacy_find_all(soup._soup, name="a")),
+        ("find_all(class_='meta')", lambda: soup.find_all(class_="meta"),
+         lambda: legacy_find_all(soup._soup, cls="meta")),
+        ("find(id=...)", lambda: [soup.find(attrs={"id": target})],
+         lambda: legacy_find_all(soup._soup, tag_id=target)[:1]),
+        ("select('div.b_algo')", lambda: soup.select("div.b_algo"),
+         lambda: legacy_find_all(soup._soup, name="div", cls="b_algo")),
+    ]
+    REPEAT = 5
+    for label, indexed_query, legacy_query in cases:
+        assert len(indexed_query()) == len(legacy_query())
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            legacy_query()
+        legacy = (time.perf_counter() - start) / REPEAT
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            indexed_query()
+        fast = (time.perf_counter() - start) / REPEAT
+        print(f"{label:<26} walk {legacy * 1000:8.2f}ms  indexed {fast * 1000:8.2f}ms  ({legacy / fast:6.1f}x)")
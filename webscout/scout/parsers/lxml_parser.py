@@ -3,7 +3,7 @@ Scout LXML Parser - Advanced HTML/XML Parsing with lxml
 """
 
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from lxml import etree
 from lxml import html as lxml_html
@@ -117,6 +117,91 @@ class LXMLParser:
 
         return tag
 
+    def iterparse(self, chunks: Union[str, bytes, Iterable[Union[str, bytes]]],
+                  tag: Optional[Union[str, List[str]]] = None,
+                  attrs: Optional[Dict[str, Any]] = None,
+                  discard: bool = True,
+                  encoding: Optional[str] = None) -> Iterator[Tag]:
+        """
+        Incrementally parse markup and yield matching elements as they complete.
+
+        Chunks are fed to lxml's pull parser as they arrive, so the document never
+        has to be held in memory as one string. Each matching element is converted
+        to a detached Scout Tag once its end tag has been seen.
+
+        Args:
+            chunks: Markup chunks, e.g. ``response.iter_content()``; a single str or bytes also works
+            tag (str or List[str], optional): Tag name(s) to yield; every element if omitted
+            attrs (dict, optional): Attribute filters; ``True`` only requires the attribute
+            discard (bool): Free each subtree once it has been yielded, or once it has
+                ended outside any pending match, keeping memory bounded
+            encoding (str, optional): Encoding of byte chunks (default utf-8)
+
+        Yields:
+            Tag: Completed elements in end-tag order (children before their parents)
+        """
+        names = {tag} if isinstance(tag, str) else set(tag) if tag else None
+        filters = attrs or {}
+
+        def matches(element) -> bool:
+            if names is not None:
+                name = element.tag
+                if '}' in name:
+                    name = name.split('}', 1)[1]
+                if name not in names:
+                    return False
+            for key, value in filters.items():
+                actual = element.get(key)
+                if actual is None or (value is not True and actual != value):
+                    return False
+            return True
+
+        pull_parser = etree.HTMLPullParser if self._parser_type == 'html' else etree.XMLPullParser
+        parser = pull_parser(
+            events=('start', 'end'), encoding=encoding or 'utf-8',
+            remove_comments=True, remove_pis=True, recover=True,
+        )
+        if isinstance(chunks, (str, bytes)):
+            chunks = (chunks,)
+        open_matches = 0  # matching elements started but not yet ended
+        closed = False
+
+        def drain() -> Iterator[Tag]:
+            nonlocal open_matches
+            for event, element in parser.read_events():
+                if not isinstance(element.tag, str):
+                    continue
+                if event == 'start':
+                    open_matches += matches(element)
+                    continue
+                matched = matches(element)
+                open_matches -= matched
+                if matched:
+                    yield self._convert_element(element)
+                # A match still open above this element needs its whole subtree
+                if discard and not open_matches:
+                    element.clear(keep_tail=True)
+                    parent = element.getparent()
+                    while parent is not None and element.getprevious() is not None:
+                        del parent[0]
+
+        try:
+            for chunk in chunks:
+                if chunk:
+                    parser.feed(chunk)
+                    yield from drain()
+            closed = True
+            parser.close()
+            yield from drain()
+        except etree.LxmlError as e:
+            self._parsing_errors.append(str(e))
+        finally:
+            if not closed:
+                try:
+                    parser.close()
+                except etree.LxmlError:
+                    pass
+
     def get_parsing_errors(self) -> List[str]:
         """
         Retrieve parsing errors encountered during processing.
@@ -184,3 +269,51 @@ class LXMLParser:
         results = []
         collect_matches(root, results)
         return results
+
+
+if __name__ == "__main__":
+    # Benchmark: extract every link from a large page with a full parse and with
+    # iterparse. Each mode runs in a fresh interpreter so peak RSS is comparable.
+    import resource
+    import subprocess
+    import sys
+    import time
+
+    def page_chunks(items: int, chunk_size: int = 64 * 1024):
+        row = ('<div class="row"><h3>Item {i}</h3><p>{text}</p>'
+               '<a href="https://example.com/item/{i}">item {i}</a></div>')
+        text = "lorem ipsum dolor sit amet " * 8
+        buffer = ["<html><head><title>big</title></head><body>"]
+        size = 0
+        for i in range(items):
+            buffer.append(row.format(i=i, text=text))
+            size += len(buffer[-1])
+            if size >= chunk_size:
+                yield "".join(buffer).encode()
+                buffer, size = [], 0
+        buffer.append("</body></html>")
+        yield "".join(buffer).encode()
+
+    if len(sys.argv) > 2:
+        from webscout.scout import Scout
+
+        mode, items = sys.argv[1], int(sys.argv[2])
+        start = time.perf_counter()
+        if mode == "full":
+            links = [a.get("href") for a in Scout(b"".join(page_chunks(items)), features="lxml").find_all("a")]
+        else:
+            links = [a.get("href") for a in Scout.iterparse(page_chunks(items), "a", discard=mode == "stream")]
+        elapsed = time.perf_counter() - start
+        print(f"{len(links)} {elapsed:.2f} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}")
+        sys.exit(0)
+
+    ITEMS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{ITEMS} items (~{ITEMS * 0.33 / 1000:.0f} MB of HTML)")
+    for mode, label in (("full", "Scout(markup).find_all"), ("keep", "iterparse, discard=False"),
+                        ("stream", "iterparse, discard=True")):
+        output = subprocess.run(
+            [sys.executable, "-m", "webscout.scout.parsers.lxml_parser", mode, str(ITEMS)],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        links, elapsed, rss = int(output[0]), float(output[1]), int(output[2])
+        print(f"{label:<26} {links:>8} links  {elapsed:6.2f}s  peak RSS {rss / 1024:7.1f} MB")
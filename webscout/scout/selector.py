@@ -0,0 +1,498 @@
+"""
+Scout Selector Module - Compiled CSS Selectors
+
+A selector string is parsed once into matcher functions and kept in an LRU
+cache, so ``Tag.select`` never re-parses it. Matching runs right to left: the
+rightmost compound picks its candidates from the document index (tag name, id
+or class), and combinators are only checked for those candidates by walking up
+to parents and back over siblings.
+
+Supported syntax:
+    - Type, universal, ``#id`` and ``.class`` selectors
+    - Attribute selectors: ``[attr]``, ``=``, ``~=``, ``|=``, ``^=``, ``$=``,
+      ``*=``, with an optional ``i`` flag for case-insensitive values
+    - Combinators: descendant (space), child ``>``, adjacent ``+``, general ``~``
+    - Selector lists: ``h1, h2``
+    - Pseudo-classes: ``:first-child``, ``:last-child``, ``:only-child``,
+      ``:nth-child()``, ``:nth-last-child()``, ``:first-of-type``,
+      ``:last-of-type``, ``:only-of-type``, ``:nth-of-type()``,
+      ``:nth-last-of-type()``, ``:not()``, ``:empty`` and ``:root``
+"""
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .element import Tag
+
+SELECTOR_CACHE_SIZE = 512
+
+_IDENT = r"(?:[-\w]|\\.)+"
+_TYPE_RE = re.compile(rf"\*|{_IDENT}")
+_HASH_RE = re.compile(rf"#({_IDENT})")
+_CLASS_RE = re.compile(rf"\.({_IDENT})")
+_ATTR_RE = re.compile(
+    rf"\[\s*({_IDENT})\s*(?:([~|^$*]?=)\s*"
+    rf"(?:\"((?:[^\"\\]|\\.)*)\"|'((?:[^'\\]|\\.)*)'|({_IDENT}))"
+    r"\s*(?:([iIsS])\s*)?)?\]"
+)
+_PSEUDO_RE = re.compile(rf":({_IDENT})")
+_COMBINATOR_RE = re.compile(r"\s*([>+~])\s*|\s+")
+_NTH_RE = re.compile(r"^([+-]?\d*)n(?:\s*([+-])\s*(\d+))?$")
+_UNESCAPE_RE = re.compile(r"\\(.)")
+
+# Matchers take (tag, context); the context caches sibling lists per parent for one query
+Matcher = Callable[["Tag", Dict[int, Any]], bool]
+
+
+def _unescape(value: str) -> str:
+    return _UNESCAPE_RE.sub(r"\1", value)
+
+
+def _tag_children(parent: Any, context: Dict[int, Any]) -> Tuple[List["Tag"], Dict[int, int]]:
+    """Return ``parent``'s child tags and their positions, computed once per query."""
+    key = id(parent)
+    entry = context.get(key)
+    if entry is None:
+        from .element import Tag
+
+        children = [child for child in parent.contents if isinstance(child, Tag)]
+        entry = context[key] = (children, {id(child): i for i, child in enumerate(children)})
+    return entry
+
+
+def _parse_nth(expr: str, selector: str) -> Tuple[int, int]:
+    """Parse an ``An+B`` expression (or ``odd``/``even``) into ``(a, b)``."""
+    expr = expr.strip().lower()
+    if expr == "odd":
+        return 2, 1
+    if expr == "even":
+        return 2, 0
+    if re.fullmatch(r"[+-]?\d+", expr):
+        return 0, int(expr)
+    match = _NTH_RE.match(expr)
+    if not match:
+        raise ValueError(f"Invalid CSS selector {selector!r}: bad nth expression {expr!r}")
+    a = match.group(1)
+    a = -1 if a == "-" else 1 if a in ("", "+") else int(a)
+    b = int(match.group(3) or 0) * (-1 if match.group(2) == "-" else 1)
+    return a, b
+
+
+def _nth_matches(a: int, b: int, index: int) -> bool:
+    """Whether the 1-based ``index`` is ``a*n + b`` for some ``n >= 0``."""
+    if a == 0:
+        return index == b
+    n, remainder = divmod(index - b, a)
+    return remainder == 0 and n >= 0
+
+
+def _nth_matcher(a: int, b: int, last: bool, of_type: bool) -> Matcher:
+    def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+        parent = tag.parent
+        if parent is None:
+            return False
+        siblings, positions = _tag_children(parent, context)
+        if of_type:
+            key = (id(parent), tag.name)
+            same_type = context.get(key)
+            if same_type is None:
+                typed = [sibling for sibling in siblings if sibling.name == tag.name]
+                same_type = context[key] = ({id(sibling): i for i, sibling in enumerate(typed)}, len(typed))
+            index, count = same_type[0][id(tag)], same_type[1]
+        else:
+            index, count = positions[id(tag)], len(siblings)
+        if last:
+            index = count - 1 - index
+        return _nth_matches(a, b, index + 1)
+
+    return match
+
+
+# Attribute operator -> test of (attribute value, selector value)
+_ATTR_TESTS: Dict[str, Callable[[str, str], bool]] = {
+    "=": lambda found, value: found == value,
+    "~=": lambda found, value: bool(value) and value in found.split(),
+    "|=": lambda found, value: found == value or found.startswith(value + "-"),
+    "^=": lambda found, value: bool(value) and found.startswith(value),
+    "$=": lambda found, value: bool(value) and found.endswith(value),
+    "*=": lambda found, value: bool(value) and value in found,
+}
+
+
+def _attr_matcher(name: str, op: Optional[str], value: str, ignore_case: bool) -> Matcher:
+    if op is None:
+        return lambda tag, context: name in tag.attrs
+    if ignore_case:
+        value = value.lower()
+
+    def actual(tag: "Tag") -> Optional[str]:
+        found = tag.attrs.get(name)
+        if found is None:
+            return None
+        if isinstance(found, list):
+            found = " ".join(found)
+        found = str(found)
+        return found.lower() if ignore_case else found
+
+    test = _ATTR_TESTS[op]
+
+    def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+        found = actual(tag)
+        return found is not None and test(found, value)
+
+    return match
+
+
+class _Compound:
+    """One compound selector (``div.item[href]:first-child``) and its index keys."""
+
+    __slots__ = ("name", "tag_id", "classes", "tests")
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.tag_id: Optional[str] = None
+        self.classes: List[str] = []
+        self.tests: List[Matcher] = []
+
+    def matcher(self) -> Matcher:
+        name, tag_id, classes, tests = self.name, self.tag_id, tuple(self.classes), tuple(self.tests)
+
+        def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+            if name is not None and tag.name.lower() != name:
+                return False
+            if tag_id is not None and tag.attrs.get("id") != tag_id:
+                return False
+            if classes:
+                tag_classes = tag._class_list()
+                for cls in classes:
+                    if cls not in tag_classes:
+                        return False
+            for test in tests:
+                if not test(tag, context):
+                    return False
+            return True
+
+        return match
+
+
+class _Parser:
+    """Recursive-descent parser producing one compiled matcher per complex selector."""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid CSS selector {self.selector!r}: {message} at position {self.pos}")
+
+    def parse_list(self) -> List[Tuple[Matcher, _Compound]]:
+        """Parse ``complex (, complex)*`` up to the end of the string."""
+        text = self.selector
+        selectors = []
+        while True:
+            self.skip_whitespace()
+            selectors.append(self.parse_complex())
+            self.skip_whitespace()
+            if self.pos < len(text) and text[self.pos] == ",":
+                self.pos += 1
+                continue
+            break
+        if self.pos != len(text):
+            raise self.error(f"unexpected {text[self.pos]!r}")
+        return selectors
+
+    def skip_whitespace(self) -> None:
+        while self.pos < len(self.selector) and self.selector[self.pos].isspace():
+            self.pos += 1
+
+    def parse_complex(self) -> Tuple[Matcher, _Compound]:
+        """Parse ``compound (combinator compound)*`` into a right-to-left matcher."""
+        text = self.selector
+        compounds = [self.parse_compound()]
+        combinators: List[str] = []
+        while self.pos < len(text):
+            match = _COMBINATOR_RE.match(text, self.pos)
+            if not match:
+                break
+            if match.end() == len(text) or text[match.end()] == ",":
+                break  # trailing whitespace before a comma or the end
+            combinators.append(match.group(1) or " ")
+            self.pos = match.end()
+            compounds.append(self.parse_compound())
+
+        matcher = compounds[0].matcher()
+        for combinator, compound in zip(combinators, compounds[1:]):
+            matcher = self.combine(matcher, combinator, compound.matcher())
+        return matcher, compounds[-1]
+
+    @staticmethod
+    def combine(left: Matcher, combinator: str, right: Matcher) -> Matcher:
+        """Matcher for ``left <combinator> right``, checked from ``right`` outwards."""
+        if combinator == " ":
+            def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+                if not right(tag, context):
+                    return False
+                scope = context["scope"]
+                node = tag
+                while node is not scope and node.parent is not None:
+                    node = node.parent
+                    if left(node, context):
+                        return True
+                return False
+        elif combinator == ">":
+            def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+                if not right(tag, context) or tag is context["scope"]:
+                    return False
+                parent = tag.parent
+                return parent is not None and left(parent, context)
+        else:
+            adjacent = combinator == "+"
+
+            def match(tag: "Tag", context: Dict[int, Any]) -> bool:
+                if not right(tag, context) or tag is context["scope"] or tag.parent is None:
+                    return False
+                siblings, positions = _tag_children(tag.parent, context)
+                index = positions.get(id(tag))
+                if not index:
+                    return False
+                if adjacent:
+                    return left(siblings[index - 1], context)
+                return any(left(sibling, context) for sibling in siblings[:index])
+        return match
+
+    def parse_compound(self) -> _Compound:
+        text = self.selector
+        compound = _Compound()
+        start = self.pos
+        match = _TYPE_RE.match(text, self.pos)
+        if match:
+            if match.group(0) != "*":
+                compound.name = _unescape(match.group(0)).lower()
+            self.pos = match.end()
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char == "#":
+                match = _HASH_RE.match(text, self.pos)
+                if not match:
+                    raise self.error("expected an id after '#'")
+                tag_id = _unescape(match.group(1))
+                if compound.tag_id is None:
+                    compound.tag_id = tag_id
+                elif compound.tag_id != tag_id:
+                    compound.tests.append(lambda tag, context: False)  # two different ids never match
+                self.pos = match.end()
+            elif char == ".":
+                match = _CLASS_RE.match(text, self.pos)
+                if not match:
+                    raise self.error("expected a class name after '.'")
+                compound.classes.append(_unescape(match.group(1)))
+                self.pos = match.end()
+            elif char == "[":
+                match = _ATTR_RE.match(text, self.pos)
+                if not match:
+                    raise self.error("malformed attribute selector")
+                name, op, double, single, bare, flag = match.groups()
+                value = next((v for v in (double, single, bare) if v is not None), "")
+                compound.tests.append(
+                    _attr_matcher(_unescape(name), op, _unescape(value), (flag or "").lower() == "i")
+                )
+                self.pos = match.end()
+            elif char == ":":
+                compound.tests.append(self.parse_pseudo())
+            else:
+                break
+        if self.pos == start:
+            raise self.error("expected a selector")
+        return compound
+
+    def parse_pseudo(self) -> Matcher:
+        text = self.selector
+        match = _PSEUDO_RE.match(text, self.pos)
+        if not match:
+            raise self.error("expected a pseudo-class after ':'")
+        name = match.group(1).lower()
+        self.pos = match.end()
+        argument = None
+        if self.pos < len(text) and text[self.pos] == "(":
+            depth = 0
+            for end in range(self.pos, len(text)):
+                depth += {"(": 1, ")": -1}.get(text[end], 0)
+                if depth == 0:
+                    break
+            else:
+                raise self.error("unclosed '('")
+            argument = text[self.pos + 1:end]
+            argument_start = self.pos + 1
+            self.pos = end + 1
+
+        simple = {
+            "first-child": (0, 1, False, False),
+            "last-child": (0, 1, True, False),
+            "first-of-type": (0, 1, False, True),
+            "last-of-type": (0, 1, True, True),
+        }
+        nth = {
+            "nth-child": (False, False),
+            "nth-last-child": (True, False),
+            "nth-of-type": (False, True),
+            "nth-last-of-type": (True, True),
+        }
+        if name in simple and argument is None:
+            return _nth_matcher(*simple[name])
+        if name in nth and argument is not None:
+            a, b = _parse_nth(argument, self.selector)
+            return _nth_matcher(a, b, *nth[name])
+        if name in ("only-child", "only-of-type") and argument is None:
+            first = _nth_matcher(0, 1, False, name == "only-of-type")
+            last = _nth_matcher(0, 1, True, name == "only-of-type")
+            return lambda tag, context: first(tag, context) and last(tag, context)
+        if name == "empty" and argument is None:
+            from .element import Tag
+
+            return lambda tag, context: not any(
+                isinstance(child, Tag) or str(child) for child in tag.contents
+            )
+        if name == "root" and argument is None:
+            return lambda tag, context: tag.parent is None
+        if name == "not" and argument is not None:
+            inner = _Parser(argument)
+            try:
+                negated = [matcher for matcher, _ in inner.parse_list()]
+            except ValueError as e:
+                self.pos = argument_start + inner.pos
+                raise self.error(f"in :not(): {e}") from None
+            return lambda tag, context: not any(matcher(tag, context) for matcher in negated)
+        raise self.error(f"unsupported pseudo-class ':{name}'")
+
+
+class CompiledSelector:
+    """
+    A parsed CSS selector list, ready to run against any tag.
+
+    Get instances from ``compile_selector``, which caches them.
+    """
+
+    __slots__ = ("selector", "_selectors")
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self._selectors = [
+            (matcher, compound.name, compound.tag_id, tuple(compound.classes))
+            for matcher, compound in _Parser(selector).parse_list()
+        ]
+
+    def __repr__(self) -> str:
+        return f"CompiledSelector({self.selector!r})"
+
+    def select(self, scope: "Tag", limit: Optional[int] = None) -> List["Tag"]:
+        """
+        Return the tags in ``scope``'s subtree (``scope`` included) that match.
+
+        Combinators only look at ancestors and siblings inside ``scope``.
+        Results are in document order without duplicates.
+        """
+        context: Dict[Any, Any] = {"scope": scope}
+        if len(self._selectors) == 1:
+            matcher, name, tag_id, classes = self._selectors[0]
+            results = []
+            for tag in scope._candidates(names=name, tag_id=tag_id, classes=classes):
+                if matcher(tag, context):
+                    results.append(tag)
+                    if limit and len(results) == limit:
+                        break
+            return results
+
+        found: Dict[int, "Tag"] = {}
+        for matcher, name, tag_id, classes in self._selectors:
+            for tag in scope._candidates(names=name, tag_id=tag_id, classes=classes):
+                if id(tag) not in found and matcher(tag, context):
+                    found[id(tag)] = tag
+        results = sorted(found.values(), key=lambda tag: tag._pos)
+        return results[:limit] if limit else results
+
+    def match(self, tag: "Tag") -> bool:
+        """Whether ``tag`` itself matches, with combinators free to look at the whole document."""
+        root = tag
+        while root.parent is not None:
+            root = root.parent
+        context: Dict[Any, Any] = {"scope": root}
+        return any(matcher(tag, context) for matcher, _, _, _ in self._selectors)
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def compile_selector(selector: str) -> CompiledSelector:
+    """
+    Compile a CSS selector string, reusing the cached result for repeated strings.
+
+    Raises:
+        ValueError: If the selector is malformed or uses unsupported syntax.
+    """
+    return CompiledSelector(selector.strip())
+
+
+if __name__ == "__main__":
+    # Benchmark: common scraping selectors on a search-results style page.
+    # Reports cold compile time, cached select time and, when BeautifulSoup is
+    # installed, soupsieve on the same markup for reference.
+    import sys
+    import time
+
+    from webscout.scout import Scout
+
+    COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    REPEAT = 10
+    item = (
+        '<li class="b_algo result" data-pos="{i}"><h2><a href="https://site{m}.example.com/page/{i}.html" '
+        'class="title">Result {i}</a></h2><div class="b_caption"><p class="snippet">Snippet {i}</p>'
+        '<span class="date">2024-01-{d:02d}</span></div><ul class="links"><li><a href="/a/{i}">A</a></li>'
+        '<li><a href="/b/{i}.pdf">B</a></li></ul></li>'
+    )
+    html = (
+        '<html><head><title>Results</title><meta name="description" content="x"></head><body>'
+        '<div id="b_content"><ol id="b_results">'
+        + "".join(item.format(i=i, m=i % 7, d=i % 28 + 1) for i in range(COUNT))
+        + '</ol><nav role="navigation"><a class="sb_pagN" href="/next">Next</a></nav></div></body></html>'
+    )
+    selectors = [
+        "ol#b_results > li.b_algo",
+        "li.b_algo h2 a",
+        "div.b_caption p.snippet",
+        'a[href^="https://site3"]',
+        'a[href$=".pdf"]',
+        "ul.links li:nth-child(2) a",
+        "li.b_algo:nth-child(odd)",
+        "h2 + div.b_caption",
+        'div#b_content nav[role="navigation"] a.sb_pagN',
+        "p.snippet, span.date",
+        "li:not(.b_algo) > a",
+        'meta[name="description"]',
+    ]
+
+    soup = Scout(html, features="lxml")
+    try:
+        from bs4 import BeautifulSoup  # optional, for reference only
+        reference = BeautifulSoup(html, "lxml")
+    except ImportError:
+        reference = None
+
+    print(f"{len(html) / 1e6:.1f} MB page, {REPEAT} runs per selector")
+    for selector in selectors:
+        compile_selector.cache_clear()
+        start = time.perf_counter()
+        compile_selector(selector)
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            found = soup.select(selector)
+        cached = (time.perf_counter() - start) / REPEAT
+        line = f"{selector:<50} {len(found):>6} hits  compile {compiled * 1e6:7.1f}us  select {cached * 1000:7.2f}ms"
+        if reference is not None:
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                expected = reference.select(selector)
+            line += f"  soupsieve {(time.perf_counter() - start) / REPEAT * 1000:7.2f}ms"
+            if len(expected) != len(found):
+                line += f"  (soupsieve found {len(expected)})"
+        print(line)
@@ -2,10 +2,12 @@
 
 from .base import BaseSearch, BaseSearchEngine
 from .bing_main import BingSearch
+from .cache import CachedEngine, SearchCache, cached_engines
 from .duckduckgo_main import DuckDuckGoSearch
 
 # Import new search engines
 from .engines.brave import Brave
+from .engines.meta import MetaSearch
 from .engines.mojeek import Mojeek
 from .engines.wikipedia import Wikipedia
 from .engines.yandex import Yandex
@@ -37,6 +39,12 @@ __all__ = [
     "Mojeek",
     "Yandex",
     "Wikipedia",
+    "MetaSearch",
+
+    # Result cache
+    "SearchCache",
+    "CachedEngine",
+    "cached_engines",
 
     # Result models
     "TextResult",
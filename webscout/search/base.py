@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Iterator, Mapping
 from functools import cached_property
 from typing import Any, Generic, Literal, TypeVar
 
@@ -23,8 +24,82 @@ from .results import BooksResult, ImagesResult, NewsResult, TextResult, VideosRe
 
 T = TypeVar("T")
 
+_DONE = object()  # end-of-iteration marker for ``astream``
 
-class BaseSearchEngine(ABC, Generic[T]):
+
+def result_items(results: Any) -> list[Any]:
+    """Items of a ``run`` result: the list itself, or a single non-list result."""
+    if isinstance(results, list):
+        return results
+    return [] if results is None else [results]
+
+
+def streams_pages(engine: Any) -> bool:
+    """Whether ``engine`` yields results page by page rather than all at once."""
+    return isinstance(engine, AsyncRunMixin) and type(engine).iter_run is not AsyncRunMixin.iter_run
+
+
+async def astream_results(engine: Any, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+    """Stream the results of any engine in ``ENGINES`` (or a ``CachedEngine``).
+
+    Engines yield as their pages are parsed. ``MetaSearch`` keeps its own
+    ``astream`` of ranking snapshots; its fused ranking is only final once
+    every engine answered, so its results are yielded after ``arun``.
+    """
+    from .engines.meta import MetaSearch  # imported here: engines import this module
+
+    if not isinstance(engine, MetaSearch) and hasattr(engine, "astream"):
+        async for result in engine.astream(*args, **kwargs):
+            yield result
+        return
+    for result in result_items(await engine.arun(*args, **kwargs)):
+        yield result
+
+
+class AsyncRunMixin:
+    """Provides ``arun``, the awaitable counterpart of an engine's ``run``,
+    and the streaming ``iter_run``/``astream`` pair.
+
+    The default runs the blocking ``run`` in a worker thread, which keeps the
+    event loop free while still reusing the pooled connections. Engines with a
+    native async path (see ``BaseSearchEngine.asearch``) override it.
+    """
+
+    async def arun(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the search without blocking the event loop."""
+        return await asyncio.to_thread(self.run, *args, **kwargs)  # type: ignore[attr-defined]
+
+    def iter_run(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """Yield results as they become available; same arguments as ``run``.
+
+        Paginating engines override this to yield each page as soon as it is
+        parsed (with the same deduplication as ``run``); the default yields
+        the items of ``run``'s list, or its single non-list result.
+        """
+        yield from result_items(self.run(*args, **kwargs))  # type: ignore[attr-defined]
+
+    async def astream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """Async iterator over :meth:`iter_run`, advanced in a worker thread."""
+        if type(self).iter_run is AsyncRunMixin.iter_run:
+            # Nothing arrives page by page, so one (possibly native) arun is cheapest
+            for result in result_items(await self.arun(*args, **kwargs)):
+                yield result
+            return
+        iterator = self.iter_run(*args, **kwargs)
+        try:
+            while True:
+                result = await asyncio.to_thread(next, iterator, _DONE)
+                if result is _DONE:
+                    return
+                yield result
+        finally:
+            try:
+                iterator.close()
+            except ValueError:
+                pass  # cancelled mid-page: the worker thread still owns the generator
+
+
+class BaseSearchEngine(AsyncRunMixin, ABC, Generic[T]):
     """Abstract base class for all search engine backends."""
 
     name: str  # unique key, e.g. "google"
@@ -80,6 +155,16 @@ class BaseSearchEngine(ABC, Generic[T]):
             ic(f"Error in {self.name} request: {ex}")
             return None
 
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> str | None:
+        """Make an async request to the search engine on the shared session pool."""
+        try:
+            response = await self.http_client.arequest(method, url, **kwargs)  # type: ignore
+            return response.text
+        except Exception as ex:
+            ic.configureOutput(prefix='ERROR| ')
+            ic(f"Error in {self.name} request: {ex}")
+            return None
+
     @cached_property
     def parser(self) -> Any:
         """Get HTML parser."""
@@ -152,6 +237,33 @@ class BaseSearchEngine(ABC, Generic[T]):
         results = self.extract_results(html_text)
         return self.post_extract_results(results)
 
+    async def asearch(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        **kwargs: Any,
+    ) -> list[T] | None:
+        """Search the engine asynchronously; same arguments and result as :meth:`search`."""
+        if type(self).search is not BaseSearchEngine.search:
+            # Engines with their own (e.g. paginating) search() keep its logic, off the loop
+            return await asyncio.to_thread(
+                self.search, query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+            )
+        payload = self.build_payload(
+            query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+        )
+        if self.search_method == "GET":
+            html_text = await self.arequest(self.search_method, self.search_url, params=payload, headers=self.search_headers)
+        else:
+            html_text = await self.arequest(self.search_method, self.search_url, data=payload, headers=self.search_headers)
+        if not html_text:
+            return None
+        results = self.extract_results(html_text)
+        return self.post_extract_results(results)
+
 
 # Legacy base class for backwards compatibility
 class BaseSearch(ABC):
@@ -0,0 +1,555 @@
+"""Result cache for the search engines in ``ENGINES``.
+
+Results are keyed by engine, category, normalized query, region, safesearch,
+timelimit and page (plus any other call arguments, such as ``max_results``).
+Lookups go to an in-memory LRU first and then to an optional SQLite file, so
+results survive restarts and are shared between worker processes.
+
+Every category has its own TTL (news expires quickly, text slowly). Past the
+TTL an entry is stale for another ``stale_ttl`` seconds: it is still returned
+immediately while a single background refresh fetches a new copy. Concurrent
+misses for the same key collapse into one upstream request whose result every
+caller receives.
+
+Entries are stored as JSON (see :func:`dumps_results`), never pickled, so a
+shared cache file cannot inject code into the processes reading it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Mapping
+
+import orjson
+from litprinter import ic
+
+from .base import result_items, streams_pages
+from .results import BooksResult, ImagesResult, NewsResult, TextResult, VideosResult
+
+# Seconds a result stays fresh, per category
+DEFAULT_TTLS: dict[str, float] = {
+    "text": 6 * 3600,
+    "images": 24 * 3600,
+    "videos": 12 * 3600,
+    "news": 300,
+    "suggestions": 24 * 3600,
+    "answers": 24 * 3600,
+    "maps": 7 * 24 * 3600,
+    "translate": 7 * 24 * 3600,
+    "weather": 900,
+}
+DEFAULT_TTL = float(os.getenv("WEBSCOUT_SEARCH_CACHE_TTL", "3600"))
+DEFAULT_STALE_TTL = float(os.getenv("WEBSCOUT_SEARCH_CACHE_STALE_TTL", "86400"))
+
+# Keyword names engines use for the query argument
+_QUERY_PARAMS = ("keywords", "query", "q", "location")
+_KEY_PARAMS = ("region", "safesearch", "timelimit", "page")
+_signatures: dict[type, inspect.Signature | None] = {}
+
+
+def _result_types() -> dict[str, type]:
+    from .engines.meta import MetaTextResult  # imported here: engines import this package
+
+    return {cls.__name__: cls for cls in (TextResult, ImagesResult, VideosResult, NewsResult, BooksResult, MetaTextResult)}
+
+
+def dumps_results(results: Any) -> bytes:
+    """Serialize engine results as JSON.
+
+    A list of result dataclasses is stored as dicts tagged with the class
+    name, so :func:`loads_results` can rebuild it; anything else (dicts,
+    strings) is stored as is. Raises ``TypeError`` for values JSON cannot hold.
+    """
+    if isinstance(results, list) and results:
+        cls = type(results[0])
+        if cls.__name__ in _result_types() and all(type(r) is cls for r in results):
+            return orjson.dumps({"type": cls.__name__, "results": [asdict(r) for r in results]})
+    return orjson.dumps({"type": None, "results": results})
+
+
+def loads_results(payload: bytes) -> Any:
+    """Rebuild results serialized by :func:`dumps_results`."""
+    data = orjson.loads(payload)
+    cls = _result_types().get(data.get("type"))
+    if cls is None:
+        return data["results"]
+    names = {f.name for f in fields(cls)}
+    return [cls(**{k: v for k, v in item.items() if k in names}) for item in data["results"]]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (Unicode form, case and whitespace)."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def _bind(func: Callable[..., Any], args: tuple, kwargs: dict) -> dict[str, Any]:
+    """Map call arguments to parameter names where the signature allows it."""
+    owner = getattr(func, "__func__", func)
+    signature = _signatures.get(owner, ...)
+    if signature is ...:
+        try:
+            signature = inspect.signature(func)
+            if any(p.kind is p.VAR_POSITIONAL for p in signature.parameters.values()):
+                signature = None  # run(*args, **kwargs): positions are engine specific
+        except (TypeError, ValueError):
+            signature = None
+        _signatures[owner] = signature
+    if signature is not None:
+        try:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            for name, parameter in signature.parameters.items():
+                if parameter.kind is parameter.VAR_KEYWORD:
+                    params.update(params.pop(name, None) or {})
+            return params
+        except TypeError:
+            pass
+    params = dict(kwargs)
+    if args:
+        if not any(name in params for name in _QUERY_PARAMS):
+            params["keywords"], args = args[0], args[1:]
+        if args:
+            params["args"] = list(args)
+    return params
+
+
+class SearchCache:
+    """Two-tier search result cache with stale-while-revalidate.
+
+    Args:
+        path: SQLite file for the on-disk tier; memory only if omitted.
+        max_entries: Capacity of the in-memory LRU.
+        max_disk_entries: Capacity of the on-disk tier.
+        ttls: Per-category TTL overrides in seconds.
+        stale_ttl: Seconds past the TTL during which a stale entry is served.
+        refresh_workers: Threads running background refreshes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int = 1000,
+        max_disk_entries: int = 10000,
+        ttls: Mapping[str, float] | None = None,
+        stale_ttl: float = DEFAULT_STALE_TTL,
+        refresh_workers: int = 4,
+    ):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stale_ttl = max(0.0, stale_ttl)
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=max(1, refresh_workers), thread_name_prefix="webscout-search-cache")
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.collapsed = 0
+        self.refreshes = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS search_results_accessed ON search_results (accessed_at)")
+
+    def ttl_for(self, category: str) -> float:
+        """Return the freshness TTL of ``category``."""
+        return self.ttls.get(category, DEFAULT_TTL)
+
+    @staticmethod
+    def key(engine: str, category: str, params: Mapping[str, Any]) -> str:
+        """Return the cache key for a call with named ``params``."""
+        params = {k: v for k, v in params.items() if v is not None}
+        query = next((params.pop(name) for name in _QUERY_PARAMS if name in params), "")
+        canonical = {
+            "engine": engine,
+            "category": category,
+            "query": normalize_query(query) if isinstance(query, str) else query,
+            **{name: params.pop(name, None) for name in _KEY_PARAMS},
+            "extra": params,
+        }
+        if canonical["page"] is None:
+            canonical["page"] = 1
+        return hashlib.sha256(orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+    def get(self, key: str, category: str) -> tuple[Any, bool] | None:
+        """Return ``(results, fresh)`` for ``key``, or None if missing or expired."""
+        now = time.time()
+        ttl = self.ttl_for(category)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute("SELECT stored_at, value FROM search_results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    entry = (row[0], row[1])
+                    self._db.execute("UPDATE search_results SET accessed_at = ? WHERE key = ?", (now, key))
+                    self._remember(key, entry)
+            if entry is None or now - entry[0] > ttl + self.stale_ttl:
+                if entry is not None:
+                    self._forget(key)
+                self.misses += 1
+                return None
+            fresh = now - entry[0] <= ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        try:
+            return loads_results(entry[1]), fresh
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            # Unreadable entry (e.g. written by an older version): treat as a miss
+            with self._lock:
+                self._forget(key)
+            return None
+
+    def set(self, key: str, results: Any) -> None:
+        """Store ``results`` under ``key`` in both tiers."""
+        try:
+            payload = dumps_results(results)
+        except TypeError as ex:
+            ic.configureOutput(prefix='WARNING| ')
+            ic(f"Search results not cached: {ex}")
+            return
+        now = time.time()
+        with self._lock:
+            self._remember(key, (now, payload))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_results (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, payload, now, now),
+                )
+                excess = self._db.execute("SELECT COUNT(*) FROM search_results").fetchone()[0] - self.max_disk_entries
+                if excess > 0:
+                    self._db.execute(
+                        "DELETE FROM search_results WHERE key IN "
+                        "(SELECT key FROM search_results ORDER BY accessed_at ASC LIMIT ?)",
+                        (excess,),
+                    )
+
+    def _remember(self, key: str, entry: tuple[float, bytes]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._db.execute("DELETE FROM search_results WHERE key = ?", (key,))
+
+    def _lead(self, key: str) -> tuple[Future, bool]:
+        """Join the in-flight request for ``key``, or register this caller as its leader."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.collapsed += 1
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _settle(self, key: str, future: Future, results: Any = None, error: BaseException | None = None) -> None:
+        if error is None and results:
+            self.set(key, results)
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(results)
+
+    def _revalidate(self, key: str, call: Callable[[], Any]) -> None:
+        """Refresh a stale entry in the background unless a refresh is already running."""
+        with self._lock:
+            if key in self._inflight:
+                return
+            future = self._inflight[key] = Future()
+            self.refreshes += 1
+
+        def refresh() -> None:
+            try:
+                results = call()
+            except Exception as ex:
+                ic.configureOutput(prefix='WARNING| ')
+                ic(f"Search cache refresh failed: {ex}")
+                self._settle(key, future, None)  # keep serving the stale copy
+                return
+            self._settle(key, future, results)
+
+        self._refresher.submit(refresh)
+
+    def fetch(self, key: str, category: str, call: Callable[[], Any],
+              refresh: Callable[[], Any] | None = None) -> Any:
+        """Return cached results for ``key`` or compute them with ``call``.
+
+        Args:
+            key: Cache key from :meth:`key`.
+            category: Engine category, selects the TTL.
+            call: Performs the upstream search.
+            refresh: Performs the search from a background thread; defaults to ``call``.
+        """
+        cached = self.get(key, category)
+        if cached is not None:
+            results, fresh = cached
+            if not fresh:
+                self._revalidate(key, refresh or call)
+            return results
+        future, leader = self._lead(key)
+        if not leader:
+            return future.result()
+        try:
+            results = call()
+        except BaseException as ex:
+            self._settle(key, future, error=ex)
+            raise
+        self._settle(key, future, results)
+        return results
+
+    async def afetch(self, key: str, category: str, call: Callable[[], Awaitable[Any]],
+                     refresh: Callable[[], Any]) -> Any:
+        """Async counterpart of :meth:`fetch`; ``call`` returns an awaitable and
+        ``refresh`` is the blocking variant used for background refreshes."""
+        cached = self.get(key, category)
+        if cached is not None:
+            results, fresh = cached
+            if not fresh:
+                self._revalidate(key, refresh)
+            return results
+        future, leader = self._lead(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            results = await call()
+        except BaseException as ex:
+            self._settle(key, future, error=ex)
+            raise
+        self._settle(key, future, results)
+        return results
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM search_results")
+
+    def close(self) -> None:
+        """Stop background refreshes and close the database."""
+        self._refresher.shutdown(wait=False)
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters."""
+        lookups = self.hits + self.stale_hits + self.misses
+        with self._lock:
+            disk = self._db.execute("SELECT COUNT(*) FROM search_results").fetchone()[0] if self._db else None
+        return {
+            "entries": len(self._entries),
+            "disk_entries": disk,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "collapsed": self.collapsed,
+            "refreshes": self.refreshes,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachedEngine:
+    """Search engine proxy whose ``run``/``arun`` go through a :class:`SearchCache`.
+
+    Every other attribute is forwarded to the wrapped engine instance.
+
+    Args:
+        engine_cls: Engine class from ``ENGINES``.
+        name: Engine name, part of the cache key.
+        category: Engine category, part of the cache key and selects the TTL.
+        cache: Cache to use.
+        *args, **kwargs: Engine constructor arguments.
+    """
+
+    def __init__(self, engine_cls: type, name: str, category: str, cache: SearchCache, *args: Any, **kwargs: Any):
+        self._factory = lambda: engine_cls(*args, **kwargs)
+        self.engine = self._factory()
+        self.engine_name = name
+        self.category = category
+        self.cache = cache
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.engine, attr)
+
+    def _key(self, args: tuple, kwargs: dict) -> str:
+        return self.cache.key(self.engine_name, self.category, _bind(self.engine.run, args, kwargs))
+
+    def _refresh(self, args: tuple, kwargs: dict) -> Callable[[], Any]:
+        # A separate instance, so refreshes never share per-call state with foreground requests
+        return lambda: self._factory().run(*args, **kwargs)
+
+    def run(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the search, answering from the cache when possible."""
+        return self.cache.fetch(
+            self._key(args, kwargs), self.category,
+            lambda: self.engine.run(*args, **kwargs), self._refresh(args, kwargs),
+        )
+
+    async def arun(self, *args: Any, **kwargs: Any) -> Any:
+        """Run the search without blocking the event loop, answering from the cache when possible."""
+        arun = getattr(self.engine, "arun", None)
+        if arun is None:
+            def arun(*a: Any, **kw: Any) -> Awaitable[Any]:
+                return asyncio.to_thread(self.engine.run, *a, **kw)
+        return await self.cache.afetch(
+            self._key(args, kwargs), self.category,
+            lambda: arun(*args, **kwargs), self._refresh(args, kwargs),
+        )
+
+
+    def _cached(self, key: str, args: tuple, kwargs: dict) -> Any | None:
+        cached = self.cache.get(key, self.category)
+        if cached is None:
+            return None
+        results, fresh = cached
+        if not fresh:
+            self.cache._revalidate(key, self._refresh(args, kwargs))
+        return results
+
+    def iter_run(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """Stream the search: cached results are replayed, fresh ones cached once complete.
+
+        Streams skip the single-flight collapsing of :meth:`run`; an abandoned
+        stream is not cached.
+        """
+        if not streams_pages(self.engine):
+            yield from result_items(self.run(*args, **kwargs))
+            return
+        key = self._key(args, kwargs)
+        cached = self._cached(key, args, kwargs)
+        if cached is not None:
+            yield from result_items(cached)
+            return
+        collected = []
+        for result in self.engine.iter_run(*args, **kwargs):
+            collected.append(result)
+            yield result
+        if collected:
+            self.cache.set(key, collected)
+
+    async def astream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`iter_run`."""
+        if not streams_pages(self.engine):
+            for result in result_items(await self.arun(*args, **kwargs)):
+                yield result
+            return
+        key = self._key(args, kwargs)
+        cached = self._cached(key, args, kwargs)
+        if cached is not None:
+            for result in result_items(cached):
+                yield result
+            return
+        collected = []
+        async for result in self.engine.astream(*args, **kwargs):
+            collected.append(result)
+            yield result
+        if collected:
+            self.cache.set(key, collected)
+
+
+def cached_engines(cache: SearchCache,
+                   engines: Mapping[str, Mapping[str, type]] | None = None) -> dict[str, dict[str, Callable[..., CachedEngine]]]:
+    """Wrap an engine registry (``ENGINES`` by default) so every engine is cached.
+
+    The result has the same ``{category: {name: factory}}`` shape; calling a
+    factory with the engine's constructor arguments returns a :class:`CachedEngine`.
+    """
+    if engines is None:
+        from .engines import ENGINES as engines
+
+    def factory(engine_cls: type, name: str, category: str) -> Callable[..., CachedEngine]:
+        return lambda *args, **kwargs: CachedEngine(engine_cls, name, category, cache, *args, **kwargs)
+
+    return {
+        category: {name: factory(engine_cls, name, category) for name, engine_cls in members.items()}
+        for category, members in engines.items()
+    }
+
+
+if __name__ == "__main__":
+    # Benchmark: a simulated 200ms engine called repeatedly and concurrently.
+    import tempfile
+
+    from .results import TextResult
+
+    class SlowEngine:
+        calls = 0
+
+        def run(self, keywords: str, region: str = "us-en", safesearch: str = "moderate",
+                timelimit: str | None = None, max_results: int | None = None) -> list[TextResult]:
+            SlowEngine.calls += 1
+            time.sleep(0.2)
+            return [TextResult(title=f"{keywords} {i}", href=f"https://example.com/{i}") for i in range(max_results or 10)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SearchCache(Path(tmp) / "search.sqlite3", ttls={"text": 0.5}, stale_ttl=60)
+        engine = cached_engines(cache, {"text": {"slow": SlowEngine}})["text"]["slow"]()
+
+        start = time.perf_counter()
+        engine.run("Python  Tutorial")
+        miss = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(1000):
+            engine.run("python tutorial")
+        hit = (time.perf_counter() - start) / 1000
+
+        with ThreadPoolExecutor(32) as pool:
+            SlowEngine.calls = 0
+            start = time.perf_counter()
+            list(pool.map(lambda _: engine.run("concurrent query"), range(32)))
+            collapsed = time.perf_counter() - start
+            concurrent_calls = SlowEngine.calls
+
+        time.sleep(0.6)  # let the entry go stale
+        SlowEngine.calls = 0
+        start = time.perf_counter()
+        engine.run("python tutorial")
+        stale = time.perf_counter() - start
+        time.sleep(0.3)
+
+        restarted = SearchCache(Path(tmp) / "search.sqlite3")
+        start = time.perf_counter()
+        cached_engines(restarted, {"text": {"slow": SlowEngine}})["text"]["slow"]().run("python tutorial")
+        disk = time.perf_counter() - start
+
+        print(f"miss                  {miss * 1000:8.2f}ms")
+        print(f"memory hit            {hit * 1e6:8.1f}us")
+        print(f"32 concurrent misses  {collapsed * 1000:8.2f}ms with {concurrent_calls} upstream call(s)")
+        print(f"stale hit             {stale * 1000:8.2f}ms ({SlowEngine.calls} background refresh)")
+        print(f"disk hit after restart {disk * 1000:7.2f}ms")
+        print(cache.stats())
+        cache.close()
+        restarted.close()
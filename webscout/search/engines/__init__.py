@@ -17,6 +17,7 @@ from .duckduckgo import (
     DuckDuckGoVideos,
     DuckDuckGoWeather,
 )
+from .meta import MetaSearch
 from .mojeek import Mojeek
 from .wikipedia import Wikipedia
 from .yahoo import (
@@ -40,6 +41,7 @@ ENGINES = {
         "duckduckgo": DuckDuckGoTextSearch,
         "yep": YepTextSearch,
         "yahoo": YahooText,
+        "meta": MetaSearch,
     },
     "images": {
         "bing": BingImagesSearch,
@@ -78,6 +80,7 @@ ENGINES = {
 
 __all__ = [
     "Brave",
+    "MetaSearch",
     "Mojeek",
     "Wikipedia",
     "Yandex",
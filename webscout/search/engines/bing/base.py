@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from curl_cffi.requests import Session
-
 from ....litagent import LitAgent
+from ...base import AsyncRunMixin
+from ...http_client import PooledSession
 
 
-class BingBase:
+class BingBase(AsyncRunMixin):
     """Base class for Bing search engines."""
 
     def __init__(
@@ -25,7 +25,7 @@ class BingBase:
         self.lang = lang
         self.sleep_interval = sleep_interval
         self.base_url = "https://www.bing.com"
-        self.session = Session(
+        self.session = PooledSession(
             proxies=proxies,
             verify=verify,
             timeout=timeout,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from time import sleep
-from typing import List
+from typing import Iterator, List
 from urllib.parse import urlencode
 
 from webscout.scout import Scout
@@ -16,6 +16,10 @@ class BingImagesSearch(BingBase):
     name = "bing"
     category = "images"
     def run(self, *args, **kwargs) -> List[ImagesResult]:
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[ImagesResult]:
+        """Yield results as each page is parsed; same arguments as ``run``."""
         keywords = args[0] if args else kwargs.get("keywords")
         args[1] if len(args) > 1 else kwargs.get("region", "us")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -50,11 +54,11 @@ class BingImagesSearch(BingBase):
             'iid': 'images.1'
         }
 
-        results = []
+        produced = 0
         first = 1
         sfx = 0
 
-        while len(results) < max_results:
+        while produced < max_results:
             params['first'] = str(first)
             params['SFX'] = str(sfx)
             full_url = f"{url}?{urlencode(params)}"
@@ -68,9 +72,11 @@ class BingImagesSearch(BingBase):
 
             soup = Scout(html)
             img_tags = soup.select('a.iusc img')
+            if not img_tags:
+                break
 
             for img in img_tags:
-                if len(results) >= max_results:
+                if produced >= max_results:
                     break
 
                 title = img.get('alt', '')
@@ -95,7 +101,7 @@ class BingImagesSearch(BingBase):
                     if source_tag:
                         source = source_tag.get_text(strip=True)
 
-                results.append(ImagesResult(
+                yield ImagesResult(
                     title=title,
                     image=image_url,
                     thumbnail=thumbnail,
@@ -103,7 +109,8 @@ class BingImagesSearch(BingBase):
                     height=0,
                     width=0,
                     source=source
-                ))
+                )
+                produced += 1
 
             first += 35
             sfx += 1
@@ -111,4 +118,3 @@ class BingImagesSearch(BingBase):
             if self.sleep_interval:
                 sleep(self.sleep_interval)
 
-        return results[:max_results]
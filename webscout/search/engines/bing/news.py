@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from time import sleep
-from typing import List
+from typing import Iterator, List
 from urllib.parse import urlencode
 
 from webscout.scout import Scout
@@ -16,6 +16,10 @@ class BingNewsSearch(BingBase):
     name = "bing"
     category = "news"
     def run(self, *args, **kwargs) -> List[NewsResult]:
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[NewsResult]:
+        """Yield results as each page is parsed; same arguments as ``run``."""
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "us")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -45,11 +49,11 @@ class BingNewsSearch(BingBase):
             'setlang': self.lang.split('-')[0]
         }
 
-        results = []
+        produced = 0
         first = 1
         sfx = 0
 
-        while len(results) < max_results:
+        while produced < max_results:
             params['first'] = str(first)
             params['SFX'] = str(sfx)
             full_url = f"{url}?{urlencode(params)}"
@@ -66,9 +70,11 @@ class BingNewsSearch(BingBase):
 
             soup = Scout(html)
             news_items = soup.select('div.newsitem')
+            if not news_items:
+                break
 
             for item in news_items:
-                if len(results) >= max_results:
+                if produced >= max_results:
                     break
 
                 title = item.select_one('a.title')
@@ -85,7 +91,8 @@ class BingNewsSearch(BingBase):
                         date=date.get_text(strip=True) if date else '',
                         image=""
                     )
-                    results.append(news_result)
+                    yield news_result
+                    produced += 1
 
             first += 10
             sfx += 1
@@ -93,4 +100,3 @@ class BingNewsSearch(BingBase):
             if self.sleep_interval:
                 sleep(self.sleep_interval)
 
-        return results[:max_results]
@@ -2,19 +2,107 @@
 
 from __future__ import annotations
 
+import base64
+from functools import cached_property
 from time import sleep
-from typing import List
+from typing import Iterator, List
+from urllib.parse import parse_qs, urlencode, urlparse
 
-from webscout.scout import Scout
+from lxml import html
+from lxml.etree import HTMLParser as LHTMLParser
+
+from webscout.search.pagination import DEFAULT_WORKERS, Paginator
 from webscout.search.results import TextResult
 
 from .base import BingBase
 
 
+def decode_href(href: str) -> str:
+    """Unwrap a Bing ``/ck/a?...&u=a1<base64>`` click-tracking link."""
+    if not href.startswith('/ck/a?'):
+        return href
+    try:
+        query_params = parse_qs(urlparse(href).query)
+        if 'u' in query_params:
+            encoded_url = query_params['u'][0]
+            if encoded_url.startswith('a1'):
+                encoded_url = encoded_url[2:]
+            padding = len(encoded_url) % 4
+            if padding:
+                encoded_url += '=' * (4 - padding)
+            return base64.urlsafe_b64decode(encoded_url).decode()
+    except Exception:
+        pass
+    return href
+
+
 class BingTextSearch(BingBase):
     name = "bing"
     category = "text"
+
+    # Bing pages hold ten organic results and are addressed by ``first=``
+    per_page = 10
+    max_pages = 20
+    items_xpath = "//ol[@id='b_results']/li[contains(@class, 'b_algo')]"
+    elements_xpath = {
+        "title": "(.//h2)[1]//text()",
+        "href": "(.//h2//a)[1]/@href",
+        "body": "(.//p)[1]//text()",
+    }
+
+    @cached_property
+    def parser(self) -> LHTMLParser:
+        return LHTMLParser(remove_blank_text=True, remove_comments=True, remove_pis=True, collect_ids=False)
+
+    def page_url(self, keywords: str, page: int) -> str:
+        """URL of the 1-indexed result ``page`` for ``keywords``."""
+        params = {"q": keywords, "form": "QBLH"}
+        if page > 1:
+            params.update(first=(page - 1) * self.per_page + 1, FORM="PERE")
+        return f"{self.base_url}/search?{urlencode(params)}"
+
+    def extract_results(self, html_text: str) -> List[TextResult]:
+        """Parse the organic results of one page."""
+        if not html_text.strip():
+            return []
+        tree = html.fromstring(html_text, parser=self.parser)
+        results = []
+        for item in tree.xpath(self.items_xpath):
+            values = {key: "".join(item.xpath(xpath)).strip() for key, xpath in self.elements_xpath.items()}
+            # A result needs a title, a link and a snippet paragraph
+            if values["title"] and values["href"] and item.xpath(".//p"):
+                results.append(TextResult(title=values["title"], href=decode_href(values["href"]), body=values["body"]))
+        return results
+
+    def fetch_page(self, keywords: str, page: int) -> List[TextResult]:
+        """Fetch and parse one result page; later pages queue at lower priority."""
+        try:
+            response = self.session.get(self.page_url(keywords, page), timeout=self.timeout, priority=page)
+            response.raise_for_status()
+        except Exception as e:
+            raise Exception(f"Failed to fetch page: {str(e)}")
+        if self.sleep_interval:
+            sleep(self.sleep_interval)
+        return self.extract_results(response.text)
+
+    def paginator(
+        self, keywords: str, unique: bool = True, workers: int = DEFAULT_WORKERS, max_pages: int | None = None
+    ) -> Paginator[TextResult]:
+        """Paginator over the result pages of ``keywords``."""
+        return Paginator(
+            lambda page: self.fetch_page(keywords, page),
+            per_page=self.per_page,
+            key=(lambda result: result.href) if unique else None,
+            # An explicit sleep interval asks for one page at a time
+            workers=1 if self.sleep_interval else workers,
+            max_pages=max_pages or self.max_pages,
+        )
+
     def run(self, *args, **kwargs) -> List[TextResult]:
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[TextResult]:
+        """Yield unique results page by page, in ranking order; same arguments as ``run``."""
         keywords = args[0] if args else kwargs.get("keywords")
         args[1] if len(args) > 1 else kwargs.get("region", "us")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -34,76 +122,5 @@ class BingTextSearch(BingBase):
         }
         safe_map.get(safesearch.lower(), "Moderate")
 
-        fetched_results = []
-        fetched_links = set()
-
-        def fetch_page(url):
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.text
-            except Exception as e:
-                raise Exception(f"Failed to fetch page: {str(e)}")
-
-        # Get first page URL
-        url = f'{self.base_url}/search?q={keywords}&search=&form=QBLH'
-        urls_to_fetch = [url]
-
-        while len(fetched_results) < max_results and urls_to_fetch:
-            current_url = urls_to_fetch.pop(0)
-            html = fetch_page(current_url)
-            soup = Scout(html)
-
-            links = soup.select('ol#b_results > li.b_algo')
-            for link in links:
-                if len(fetched_results) >= max_results:
-                    break
-                title_tag = link.select_one('h2')
-                url_tag = link.select_one('h2 a')
-                text_tag = link.select_one('p')
-
-                if title_tag and url_tag and text_tag:
-                    title = title_tag.get_text(strip=True)
-                    href = url_tag.get('href', '')
-                    body = text_tag.get_text(strip=True)
-
-                    # Decode Bing URL if needed
-                    if href.startswith('/ck/a?'):
-                        # Simple unwrap, similar to bing.py
-                        from urllib.parse import parse_qs, urlparse
-                        try:
-                            parsed = urlparse(href)
-                            query_params = parse_qs(parsed.query)
-                            if 'u' in query_params:
-                                encoded_url = query_params['u'][0]
-                                if encoded_url.startswith('a1'):
-                                    encoded_url = encoded_url[2:]
-                                padding = len(encoded_url) % 4
-                                if padding:
-                                    encoded_url += '=' * (4 - padding)
-                                import base64
-                                decoded = base64.urlsafe_b64decode(encoded_url).decode()
-                                href = decoded
-                        except Exception:
-                            pass
-
-                    if unique and href in fetched_links:
-                        continue
-                    fetched_links.add(href)
-
-                    fetched_results.append(TextResult(
-                        title=title,
-                        href=href,
-                        body=body
-                    ))
-
-            # Get next page
-            next_page_tag = soup.select_one('div#b_content nav[role="navigation"] a.sb_pagN')
-            if next_page_tag and next_page_tag.get('href'):
-                next_url = self.base_url + next_page_tag['href']
-                urls_to_fetch.append(next_url)
-
-            if self.sleep_interval:
-                sleep(self.sleep_interval)
-
-        return fetched_results[:max_results]
+        pages = self.paginator(keywords, unique, kwargs.get("workers", DEFAULT_WORKERS), kwargs.get("max_pages"))
+        return pages.iter(max_results)
@@ -63,3 +63,15 @@ class Brave(BaseSearchEngine[TextResult]):
         if results and max_results:
             results = results[:max_results]
         return results or []
+
+    async def arun(self, *args, **kwargs) -> list[TextResult]:
+        """Run text search on Brave asynchronously; same arguments as :meth:`run`."""
+        keywords = args[0] if args else kwargs.get("keywords")
+        region = args[1] if len(args) > 1 else kwargs.get("region", "us-en")
+        safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
+        max_results = args[3] if len(args) > 3 else kwargs.get("max_results")
+
+        results = await self.asearch(query=keywords, region=region, safesearch=safesearch)
+        if results and max_results:
+            results = results[:max_results]
+        return results or []
@@ -6,8 +6,6 @@ import os
 from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 from itertools import cycle, islice
-from random import choice
-from time import sleep, time
 from typing import Any
 
 try:
@@ -15,8 +13,6 @@ try:
 except ImportError:
     pass
 
-import curl_cffi.requests
-
 try:
     from lxml.html import HTMLParser as LHTMLParser
     from lxml.html import document_fromstring
@@ -32,20 +28,23 @@ from ....utils import (
     _normalize_url,
     json_loads,
 )
+from ...base import AsyncRunMixin
+from ...http_client import IMPERSONATES, PooledSession
+from .vqd import vqd_cache
+
+# DuckDuckGo answers a request carrying an unknown or expired vqd with 403
+VQD_REJECTED_STATUS = 403
+
 
+class VqdRejectedE(RatelimitE):
+    """The server refused the vqd a request carried; a fresh token may be accepted."""
 
-class DuckDuckGoBase:
+
+class DuckDuckGoBase(AsyncRunMixin):
     """Base class for DuckDuckGo search operations."""
 
     _executor: ThreadPoolExecutor = ThreadPoolExecutor()
-    _impersonates = (
-        "chrome99", "chrome100", "chrome101", "chrome104", "chrome107", "chrome110",
-        "chrome116", "chrome119", "chrome120", "chrome123", "chrome124", "chrome131", "chrome133a",
-        "chrome99_android", "chrome131_android",
-        "safari15_3", "safari15_5", "safari17_0", "safari17_2_ios", "safari18_0", "safari18_0_ios",
-        "edge99", "edge101",
-        "firefox133", "firefox135",
-    )
+    _impersonates = IMPERSONATES
 
     def __init__(
         self,
@@ -79,16 +78,14 @@ class DuckDuckGoBase:
         self.headers = headers if headers else {}
         self.headers.update(default_headers)
 
-        impersonate_browser = choice(self._impersonates)
-        self.client = curl_cffi.requests.Session(
+        # Connections come from the shared pool, which picks a random impersonation per host
+        self.client = PooledSession(
             headers=self.headers,
-            proxies={'http': self.proxy, 'https': self.proxy} if self.proxy else None,
+            proxies=self.proxy,
             timeout=timeout,
-            impersonate=impersonate_browser,
             verify=verify,
         )
         self.timeout = timeout
-        self.sleep_timestamp = 0.0
 
         # Utility methods
         self.cycle = cycle
@@ -115,12 +112,6 @@ class DuckDuckGoBase:
 
         return Parser()
 
-    def _sleep(self, sleeptime: float = 0.75) -> None:
-        """Sleep between API requests."""
-        delay = 0.0 if not self.sleep_timestamp else 0.0 if time() - self.sleep_timestamp >= 20 else sleeptime
-        self.sleep_timestamp = time()
-        sleep(delay)
-
     def _get_url(
         self,
         method: str,
@@ -132,15 +123,20 @@ class DuckDuckGoBase:
         cookies: dict[str, str] | None = None,
         json: Any = None,
         timeout: float | None = None,
+        priority: float = 0,
     ) -> Any:
-        """Make HTTP request."""
-        self._sleep()
+        """Make HTTP request.
+
+        Requests are paced per host by the process-wide rate limiter of the
+        pooled session; ``priority`` orders queued requests, lower first.
+        """
         try:
             request_kwargs = {
                 "params": params,
                 "headers": headers,
                 "json": json,
                 "timeout": timeout or self.timeout,
+                "priority": priority,
             }
 
             if isinstance(cookies, dict):
@@ -165,15 +161,54 @@ class DuckDuckGoBase:
 
         if resp.status_code == 200:
             return resp
+        elif resp.status_code == VQD_REJECTED_STATUS and "vqd" in (data or params or {}):
+            raise VqdRejectedE(f"{resp.url} {resp.status_code} vqd rejected")
         elif resp.status_code in (202, 301, 403, 400, 429, 418):
             raise RatelimitE(f"{resp.url} {resp.status_code} Ratelimit")
         raise WebscoutE(f"{resp.url} return None. {params=} {content=} {data=}")
 
-    def _get_vqd(self, keywords: str) -> str:
-        """Get vqd value for a search query."""
+    def _fetch_vqd(self, keywords: str) -> str:
+        """Fetch a new vqd value for a search query from the DuckDuckGo homepage."""
         resp_content = self._get_url("GET", "https://duckduckgo.com", params={"q": keywords}).content
         return _extract_vqd(resp_content, keywords)
 
+    def _vqd_token(self, keywords: str) -> tuple[str, bool]:
+        """Return ``(vqd, cached)`` for a search query from the shared token cache."""
+        return vqd_cache.get(keywords, lambda: self._fetch_vqd(keywords))
+
+    def _get_vqd(self, keywords: str) -> str:
+        """Get vqd value for a search query."""
+        return self._vqd_token(keywords)[0]
+
+    def _vqd_request(
+        self,
+        keywords: str,
+        method: str,
+        url: str,
+        params: dict[str, str] | None = None,
+        content: bytes | None = None,
+        data: dict[str, str] | None = None,
+    ) -> Any:
+        """Make an HTTP request that carries the vqd of ``keywords``.
+
+        The vqd is added to ``data`` for form posts and to ``params`` otherwise.
+        If the server rejects a cached vqd (it may have expired), the token is
+        fetched again and the request retried once. Throttling, timeouts and
+        other errors are raised as is, without touching the token.
+        """
+        vqd, cached = self._vqd_token(keywords)
+        target = "data" if data is not None else "params"
+        payload = {"params": params, "data": data}
+        payload[target] = {**(payload[target] or {}), "vqd": vqd}
+        try:
+            return self._get_url(method, url, content=content, **payload)
+        except VqdRejectedE:
+            if not cached:
+                raise
+        vqd = vqd_cache.refresh(keywords, vqd, lambda: self._fetch_vqd(keywords))
+        payload[target] = {**payload[target], "vqd": vqd}
+        return self._get_url(method, url, content=content, **payload)
+
     def json_loads(self, obj: str | bytes) -> Any:
         """Load JSON from string or bytes."""
         return json_loads(obj)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from ....search.results import ImagesResult
 from .base import DuckDuckGoBase
 
@@ -30,6 +32,10 @@ class DuckDuckGoImages(DuckDuckGoBase):
         Returns:
             List of ImagesResult objects.
         """
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[ImagesResult]:
+        """Yield results as each page is parsed; same arguments as :meth:`run`."""
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "wt-wt")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -43,8 +49,6 @@ class DuckDuckGoImages(DuckDuckGoBase):
 
         assert keywords, "keywords is mandatory"
 
-        vqd = self._get_vqd(keywords)
-
         safesearch_base = {"on": "1", "moderate": "1", "off": "-1"}
         timelimit = f"time:{timelimit}" if timelimit else ""
         size = f"size:{size}" if size else ""
@@ -56,17 +60,15 @@ class DuckDuckGoImages(DuckDuckGoBase):
             "l": region,
             "o": "json",
             "q": keywords,
-            "vqd": vqd,
             "f": f"{timelimit},{size},{color},{type_image},{layout},{license_image}",
             "p": safesearch_base[safesearch.lower()],
         }
 
         cache = set()
-        results: list[ImagesResult] = []
 
         def _images_page(s: int) -> list[ImagesResult]:
             payload["s"] = f"{s}"
-            resp_content = self._get_url("GET", "https://duckduckgo.com/i.js", params=payload).content
+            resp_content = self._vqd_request(keywords, "GET", "https://duckduckgo.com/i.js", params=payload).content
             resp_json = self.json_loads(resp_content)
 
             page_data = resp_json.get("results", [])
@@ -91,10 +93,6 @@ class DuckDuckGoImages(DuckDuckGoBase):
         if max_results:
             max_results = min(max_results, 500)
             slist.extend(range(100, max_results, 100))
-        try:
-            for r in self._executor.map(_images_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(self.islice(results, max_results))
+        # Pages are requested together and yielded in order as each one is parsed
+        results = (result for page in self._executor.map(_images_page, slist) for result in page)
+        yield from self.islice(results, max_results)
@@ -38,8 +38,6 @@ class DuckDuckGoMaps(DuckDuckGoBase):
 
         assert keywords, "keywords is mandatory"
 
-        vqd = self._get_vqd(keywords)
-
         # if longitude and latitude are specified, skip the request about bbox to the nominatim api
         if latitude and longitude:
             lat_t = Decimal(latitude.replace(",", "."))
@@ -103,7 +101,6 @@ class DuckDuckGoMaps(DuckDuckGoBase):
             lat_t, lon_l, lat_b, lon_r = bbox
             params = {
                 "q": keywords,
-                "vqd": vqd,
                 "tg": "maps_places",
                 "rt": "D",
                 "mkexp": "b",
@@ -113,7 +110,7 @@ class DuckDuckGoMaps(DuckDuckGoBase):
                 "bbox_br": f"{lat_b},{lon_r}",
                 "strict_bbox": "1",
             }
-            resp_content = self._get_url("GET", "https://duckduckgo.com/local.js", params=params).content
+            resp_content = self._vqd_request(keywords, "GET", "https://duckduckgo.com/local.js", params=params).content
             resp_json = self.json_loads(resp_content)
             page_data = resp_json.get("results", [])
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 from ....search.results import NewsResult
@@ -10,6 +11,10 @@ class DuckDuckGoNews(DuckDuckGoBase):
     name = "duckduckgo"
     category = "news"
     def run(self, *args, **kwargs) -> list[NewsResult]:
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[NewsResult]:
+        """Yield results as each page is parsed; same arguments as :meth:`run`."""
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "wt-wt")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -18,26 +23,22 @@ class DuckDuckGoNews(DuckDuckGoBase):
 
         assert keywords, "keywords is mandatory"
 
-        vqd = self._get_vqd(keywords)
-
         safesearch_base = {"on": "1", "moderate": "-1", "off": "-2"}
         payload = {
             "l": region,
             "o": "json",
             "noamp": "1",
             "q": keywords,
-            "vqd": vqd,
             "p": safesearch_base[safesearch.lower()],
         }
         if timelimit:
             payload["df"] = timelimit
 
         cache = set()
-        results: list[NewsResult] = []
 
         def _news_page(s: int) -> list[NewsResult]:
             payload["s"] = f"{s}"
-            resp_content = self._get_url("GET", "https://duckduckgo.com/news.js", params=payload).content
+            resp_content = self._vqd_request(keywords, "GET", "https://duckduckgo.com/news.js", params=payload).content
             resp_json = self.json_loads(resp_content)
             page_data = resp_json.get("results", [])
             page_results = []
@@ -60,11 +61,7 @@ class DuckDuckGoNews(DuckDuckGoBase):
         if max_results:
             max_results = min(max_results, 120)
             slist.extend(range(30, max_results, 30))
-        try:
-            for r in self._executor.map(_news_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(self.islice(results, max_results))
+        # Pages are requested together and yielded in order as each one is parsed
+        results = (result for page in self._executor.map(_news_page, slist) for result in page)
+        yield from self.islice(results, max_results)
 
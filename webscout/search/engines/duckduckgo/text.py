@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterator
 from random import shuffle
 
 from ....exceptions import WebscoutE
@@ -30,6 +31,46 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         Returns:
             List of TextResult objects.
         """
+        keywords, region, timelimit, backends, max_results = self._parse_args(args, kwargs)
+
+        err = None
+        for b in backends:
+            pages = self._text_html if b == "html" else self._text_lite
+            try:
+                # A failure on any page moves on to the next backend
+                return list(pages(keywords, region, timelimit, max_results))
+            except Exception as ex:
+                err = ex
+
+        raise WebscoutE(err)
+
+    def iter_run(self, *args, **kwargs) -> Iterator[TextResult]:
+        """Yield text results as each page is parsed; same arguments as :meth:`run`.
+
+        Unlike :meth:`run`, the next backend is only tried until the first
+        result is out; a later failure is raised to the caller mid-stream.
+        """
+        keywords, region, timelimit, backends, max_results = self._parse_args(args, kwargs)
+
+        err = None
+        for b in backends:
+            pages = self._text_html if b == "html" else self._text_lite
+            results = pages(keywords, region, timelimit, max_results)
+            try:
+                first = next(results, None)
+            except Exception as ex:
+                err = ex
+                continue
+            if first is not None:
+                yield first
+                yield from results
+            return
+
+        raise WebscoutE(err)
+
+    @staticmethod
+    def _parse_args(args: tuple, kwargs: dict) -> tuple:
+        """Return ``(keywords, region, timelimit, backends, max_results)`` from ``run`` arguments."""
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "wt-wt")
         args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -38,23 +79,11 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         max_results = args[5] if len(args) > 5 else kwargs.get("max_results")
 
         if backend in ("api", "ecosia"):
-            warnings.warn(f"{backend=} is deprecated, using backend='auto'", stacklevel=2)
+            warnings.warn(f"{backend=} is deprecated, using backend='auto'", stacklevel=3)
             backend = "auto"
         backends = ["html", "lite"] if backend == "auto" else [backend]
         shuffle(backends)
-
-        results, err = [], None
-        for b in backends:
-            try:
-                if b == "html":
-                    results = self._text_html(keywords, region, timelimit, max_results)
-                elif b == "lite":
-                    results = self._text_lite(keywords, region, timelimit, max_results)
-                return results
-            except Exception as ex:
-                err = ex
-
-        raise WebscoutE(err)
+        return keywords, region, timelimit, backends, max_results
 
     def _text_html(
         self,
@@ -62,8 +91,8 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         region: str = "wt-wt",
         timelimit: str | None = None,
         max_results: int | None = None,
-    ) -> list[TextResult]:
-        """Text search using HTML backend."""
+    ) -> Iterator[TextResult]:
+        """Text search using HTML backend, page by page."""
         assert keywords, "keywords is mandatory"
 
         payload = {
@@ -82,7 +111,6 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
             payload["vqd"] = vqd
 
         cache = set()
-        results: list[TextResult] = []
 
         def _text_html_page(s: int) -> list[TextResult]:
             payload["s"] = f"{s}"
@@ -123,13 +151,9 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         if max_results:
             max_results = min(max_results, 2023)
             slist.extend(range(23, max_results, 50))
-        try:
-            for r in self._executor.map(_text_html_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(self.islice(results, max_results))
+        # Pages are requested together and yielded in order as each one is parsed
+        results = (result for page in self._executor.map(_text_html_page, slist) for result in page)
+        yield from self.islice(results, max_results)
 
     def _text_lite(
         self,
@@ -137,8 +161,8 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         region: str = "wt-wt",
         timelimit: str | None = None,
         max_results: int | None = None,
-    ) -> list[TextResult]:
-        """Text search using lite backend."""
+    ) -> Iterator[TextResult]:
+        """Text search using lite backend, page by page."""
         assert keywords, "keywords is mandatory"
 
         payload = {
@@ -154,7 +178,6 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
             payload["df"] = timelimit
 
         cache = set()
-        results: list[TextResult] = []
 
         def _text_lite_page(s: int) -> list[TextResult]:
             payload["s"] = f"{s}"
@@ -206,10 +229,6 @@ class DuckDuckGoTextSearch(DuckDuckGoBase):
         if max_results:
             max_results = min(max_results, 2023)
             slist.extend(range(23, max_results, 50))
-        try:
-            for r in self._executor.map(_text_lite_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(self.islice(results, max_results))
+        # Pages are requested together and yielded in order as each one is parsed
+        results = (result for page in self._executor.map(_text_lite_page, slist) for result in page)
+        yield from self.islice(results, max_results)
@@ -13,10 +13,7 @@ class DuckDuckGoTranslate(DuckDuckGoBase):
 
         assert keywords, "keywords is mandatory"
 
-        vqd = self._get_vqd("translate")
-
         payload = {
-            "vqd": vqd,
             "query": "translate",
             "to": to,
         }
@@ -24,7 +21,8 @@ class DuckDuckGoTranslate(DuckDuckGoBase):
             payload["from"] = from_
 
         def _translate_keyword(keyword: str) -> dict[str, str]:
-            resp_content = self._get_url(
+            resp_content = self._vqd_request(
+                "translate",
                 "POST",
                 "https://duckduckgo.com/translation.js",
                 params=payload,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 from ....search.results import VideosResult
 from .base import DuckDuckGoBase
 
@@ -8,6 +10,10 @@ class DuckDuckGoVideos(DuckDuckGoBase):
     name = "duckduckgo"
     category = "videos"
     def run(self, *args, **kwargs) -> list[VideosResult]:
+        return list(self.iter_run(*args, **kwargs))
+
+    def iter_run(self, *args, **kwargs) -> Iterator[VideosResult]:
+        """Yield results as each page is parsed; same arguments as :meth:`run`."""
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "wt-wt")
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
@@ -19,8 +25,6 @@ class DuckDuckGoVideos(DuckDuckGoBase):
 
         assert keywords, "keywords is mandatory"
 
-        vqd = self._get_vqd(keywords)
-
         safesearch_base = {"on": "1", "moderate": "-1", "off": "-2"}
         timelimit = f"publishedAfter:{timelimit}" if timelimit else ""
         resolution = f"videoDefinition:{resolution}" if resolution else ""
@@ -30,17 +34,15 @@ class DuckDuckGoVideos(DuckDuckGoBase):
             "l": region,
             "o": "json",
             "q": keywords,
-            "vqd": vqd,
             "f": f"{timelimit},{resolution},{duration},{license_videos}",
             "p": safesearch_base[safesearch.lower()],
         }
 
         cache = set()
-        results: list[VideosResult] = []
 
         def _videos_page(s: int) -> list[VideosResult]:
             payload["s"] = f"{s}"
-            resp_content = self._get_url("GET", "https://duckduckgo.com/v.js", params=payload).content
+            resp_content = self._vqd_request(keywords, "GET", "https://duckduckgo.com/v.js", params=payload).content
             resp_json = self.json_loads(resp_content)
 
             page_data = resp_json.get("results", [])
@@ -70,11 +72,7 @@ class DuckDuckGoVideos(DuckDuckGoBase):
         if max_results:
             max_results = min(max_results, 400)
             slist.extend(range(60, max_results, 60))
-        try:
-            for r in self._executor.map(_videos_page, slist):
-                results.extend(r)
-        except Exception as e:
-            raise e
-
-        return list(self.islice(results, max_results))
+        # Pages are requested together and yielded in order as each one is parsed
+        results = (result for page in self._executor.map(_videos_page, slist) for result in page)
+        yield from self.islice(results, max_results)
 
@@ -0,0 +1,189 @@
+"""Shared cache of DuckDuckGo vqd tokens.
+
+Image, news, video, maps and translate searches need a ``vqd`` token, which
+DuckDuckGo embeds in the HTML of a full ``https://duckduckgo.com/?q=...``
+page. Fetching that page before every search doubles latency and request
+volume, so tokens are cached per keyword for ``ttl`` seconds, shared by all
+engine instances and threads. Concurrent misses for one keyword wait for a
+single fetch, and a token the server rejects is replaced at most once per
+rejection, however many requests noticed it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+
+DEFAULT_VQD_TTL = float(os.getenv("WEBSCOUT_DDG_VQD_TTL", "600"))
+DEFAULT_VQD_ENTRIES = 1024
+
+
+class VqdCache:
+    """LRU of vqd tokens keyed by keyword, with single-flight fetches.
+
+    Args:
+        ttl: Seconds a token is reused.
+        max_entries: Number of keywords kept.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_VQD_TTL, max_entries: int = DEFAULT_VQD_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._tokens: OrderedDict[str, tuple[str, float]] = OrderedDict()  # keyword -> (vqd, fetched_at)
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.fetches = 0
+        self.refreshes = 0
+
+    def _cached(self, keywords: str) -> str | None:
+        entry = self._tokens.get(keywords)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[1] > self.ttl:
+            del self._tokens[keywords]
+            return None
+        self._tokens.move_to_end(keywords)
+        return entry[0]
+
+    def get(self, keywords: str, fetch: Callable[[], str]) -> tuple[str, bool]:
+        """Return ``(vqd, cached)`` for ``keywords``, calling ``fetch`` on a miss.
+
+        ``cached`` is False when the token was fetched for this call (or a
+        concurrent one), so a rejection cannot be blamed on its age.
+        """
+        with self._lock:
+            token = self._cached(keywords)
+            if token is not None:
+                self.hits += 1
+                return token, True
+            future = self._inflight.get(keywords)
+            leader = future is None
+            if leader:
+                future = self._inflight[keywords] = Future()
+        if not leader:
+            return future.result(), False
+        try:
+            token = fetch()
+        except BaseException as ex:
+            with self._lock:
+                self._inflight.pop(keywords, None)
+            future.set_exception(ex)
+            raise
+        with self._lock:
+            self.fetches += 1
+            self._inflight.pop(keywords, None)
+            self._tokens[keywords] = (token, time.monotonic())
+            self._tokens.move_to_end(keywords)
+            while len(self._tokens) > self.max_entries:
+                self._tokens.popitem(last=False)
+        future.set_result(token)
+        return token, False
+
+    def refresh(self, keywords: str, rejected: str, fetch: Callable[[], str]) -> str:
+        """Replace a token the server rejected and return the new one.
+
+        If another thread already replaced ``rejected``, its token is
+        returned without fetching again.
+        """
+        with self._lock:
+            entry = self._tokens.get(keywords)
+            if entry is not None and entry[0] == rejected:
+                del self._tokens[keywords]
+                self.refreshes += 1
+        return self.get(keywords, fetch)[0]
+
+    def clear(self) -> None:
+        """Forget every token."""
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and fetch counters."""
+        return {"entries": len(self._tokens), "hits": self.hits, "fetches": self.fetches, "refreshes": self.refreshes}
+
+
+# One cache for every DuckDuckGo engine instance in the process
+vqd_cache = VqdCache()
+
+
+if __name__ == "__main__":
+    # Benchmark: news searches against a local stub of duckduckgo.com that
+    # counts round trips and issues a new vqd every second, accepting the
+    # current and the previous one.
+    import json
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlsplit
+
+    from webscout.search.engines.duckduckgo import DuckDuckGoNews
+    from webscout.search.engines.duckduckgo.vqd import vqd_cache as shared_cache
+
+    SEARCHES = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    hits = {"page": 0, "api": 0}
+
+    def current_vqd(age: int = 0) -> str:
+        return f"4-{int(time.time()) - age}"
+
+    class Stub(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            if url.path == "/news.js":
+                hits["api"] += 1
+                if query.get("vqd", [""])[0] not in (current_vqd(), current_vqd(1)):
+                    self.send_response(403)
+                    self.end_headers()
+                    return
+                body = json.dumps({"results": [{
+                    "url": f"https://example.com/{query['q'][0]}", "title": "t", "excerpt": "e",
+                    "date": 0, "source": "s",
+                }]}).encode()
+            else:
+                hits["page"] += 1
+                time.sleep(0.02)  # the full page is the slow part
+                body = f'<html><script>vqd="{current_vqd()}"</script></html>'.encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    class StubNews(DuckDuckGoNews):
+        def _get_url(self, method, url, *args, **kwargs):
+            return super()._get_url(method, url.replace("https://duckduckgo.com", base), *args, **kwargs)
+
+        def _fetch_every_time(self, keywords: str) -> tuple[str, bool]:
+            return self._fetch_vqd(keywords), False
+
+    def run(cached: bool) -> None:
+        shared_cache.clear()
+        hits.update(page=0, api=0)
+        engine = StubNews()
+        engine.client.limiter = None  # measure round trips, not pacing
+        if not cached:
+            engine._vqd_token = engine._fetch_every_time  # every request fetches its own token
+        start = time.perf_counter()
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda i: engine.run(f"query {i % 10}"), range(SEARCHES)))
+        elapsed = time.perf_counter() - start
+        trips = hits["page"] + hits["api"]
+        print(f"{'cached' if cached else 'uncached':<9} {SEARCHES / elapsed:7.1f} searches/s  "
+              f"{trips / SEARCHES:.2f} round trips per search ({hits['page']} page, {hits['api']} api, "
+              f"{sum(not r for r in results)} empty)")
+
+    run(cached=False)
+    run(cached=True)
+    print(shared_cache.stats())
+    server.shutdown()
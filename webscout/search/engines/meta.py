@@ -0,0 +1,268 @@
+"""Metasearch: fan a query out to several text engines and fuse their rankings.
+
+Every engine runs concurrently. Whatever has arrived when the global deadline
+expires is used and slower engines are cancelled: engines with a native async
+path stop at once, paginating engines (pulled through ``astream``) request no
+further pages, and other thread-backed engines finish their current requests
+in the background with their results discarded. Results are deduplicated by
+normalized URL and merged with reciprocal rank fusion (RRF): a result scores
+``sum(1 / (k + rank))`` over every engine that returned it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from ...exceptions import WebscoutE
+from ..base import streams_pages
+from ..results import TextResult
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "yclid", "mc_cid", "mc_eid", "ref_src"})
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+DEADLINE_EXCEEDED = "deadline exceeded"
+
+
+def normalize_url(url: str) -> str:
+    """Return a comparison key for ``url``.
+
+    The scheme, a leading ``www.``, default ports, the fragment, trailing
+    slashes and tracking parameters (``utm_*``, ``fbclid``...) are dropped; the
+    host is lowercased and the remaining query parameters are sorted.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    port = parts.port if parts.netloc else None
+    if port is not None and str(port) != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    key = host + path
+    if query:
+        key += "?" + urlencode(query)
+    return key or url.strip()
+
+
+@dataclass
+class MetaTextResult(TextResult):
+    """Fused text result with the engines that returned it and its RRF score."""
+
+    engines: list[str] = field(default_factory=list)
+    score: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return dict(super().to_dict(), engines=list(self.engines), score=self.score)
+
+
+@dataclass
+class MetaSearchUpdate:
+    """Snapshot yielded by :meth:`MetaSearch.astream` each time an engine finishes."""
+
+    engine: str | None  # engine that just finished; None for the final deadline update
+    results: list[MetaTextResult]  # fused ranking of everything received so far
+    completed: list[str]  # engines that returned results, in arrival order
+    pending: list[str]  # engines still running
+    errors: dict[str, str]  # engine -> error message (failures and deadline misses)
+    final: bool = False
+
+
+def reciprocal_rank_fusion(
+    rankings: Mapping[str, Sequence[TextResult]],
+    k: int = 60,
+    max_results: int | None = None,
+) -> list[MetaTextResult]:
+    """Merge per-engine rankings into one, deduplicating by normalized URL.
+
+    Args:
+        rankings: Engine name -> that engine's results, best first.
+        k: RRF damping constant; larger values flatten the rank contribution.
+        max_results: Truncate the fused list to this many results.
+
+    Returns:
+        Fused results, highest score first. Ties keep the order of first appearance.
+    """
+    merged: dict[str, MetaTextResult] = {}
+    for engine, results in rankings.items():
+        rank = 0
+        for result in results:
+            if not result.href:
+                continue
+            key = normalize_url(result.href)
+            entry = merged.get(key)
+            if entry is None:
+                entry = merged[key] = MetaTextResult(title=result.title, href=result.href, body=result.body)
+            elif engine in entry.engines:
+                continue  # the same page twice from one engine counts once, at its best rank
+            rank += 1
+            entry.engines.append(engine)
+            entry.score += 1.0 / (k + rank)
+            if not entry.title:
+                entry.title = result.title
+            if len(result.body or "") > len(entry.body or ""):
+                entry.body = result.body
+    fused = sorted(merged.values(), key=lambda r: r.score, reverse=True)
+    return fused[:max_results] if max_results else fused
+
+
+class MetaSearch:
+    """Metasearch engine over the text engines in ``ENGINES["text"]``.
+
+    Args:
+        engines: Engine names to query; defaults to every other text engine.
+        deadline: Seconds to wait for engines before returning what arrived.
+        k: Reciprocal rank fusion constant.
+        proxy: Proxy URL passed to every engine.
+        timeout: Request timeout passed to every engine.
+        verify: Whether engines verify SSL certificates.
+    """
+
+    name = "meta"
+    category = "text"
+    provider = "meta"
+
+    def __init__(
+        self,
+        engines: Sequence[str] | None = None,
+        deadline: float = 6.0,
+        k: int = 60,
+        proxy: str | None = None,
+        timeout: int | None = None,
+        verify: bool = True,
+    ):
+        available = self._available_engines()
+        if engines is None:
+            engines = list(available)
+        unknown = [name for name in engines if name not in available]
+        if unknown:
+            raise ValueError(f"Unknown text engines: {', '.join(unknown)}. Use: {', '.join(available)}")
+        self.engines = list(engines)
+        self.deadline = deadline
+        self.k = k
+        self.proxy = proxy
+        self.timeout = timeout
+        self.verify = verify
+
+    @staticmethod
+    def _available_engines() -> dict[str, type]:
+        from . import ENGINES  # imported here: this module is loaded while ENGINES is being built
+
+        return {name: cls for name, cls in ENGINES["text"].items() if cls is not MetaSearch}
+
+    async def _run_engine(self, name: str, kwargs: dict[str, Any]) -> list[TextResult]:
+        engine = self._available_engines()[name](proxy=self.proxy, timeout=self.timeout, verify=self.verify)
+        if streams_pages(engine):
+            # Pulled page by page, so a cancelled engine requests no further pages
+            return [result async for result in engine.astream(**kwargs)]
+        return list(await engine.arun(**kwargs) or [])
+
+    async def astream(
+        self,
+        keywords: str,
+        region: str | None = None,
+        safesearch: str = "moderate",
+        max_results: int | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[MetaSearchUpdate]:
+        """Query every engine concurrently and yield the fused ranking as each one finishes.
+
+        The last update has ``final=True``. Engines still running at the deadline
+        are cancelled (see the module docstring for how far that reaches) and
+        reported in ``errors``.
+        """
+        kwargs: dict[str, Any] = {"keywords": keywords, "safesearch": safesearch, "max_results": max_results}
+        if region is not None:
+            kwargs["region"] = region  # otherwise each engine keeps its own default region format
+        loop = asyncio.get_running_loop()
+        end = loop.time() + (self.deadline if deadline is None else deadline)
+        tasks = {asyncio.ensure_future(self._run_engine(name, kwargs)): name for name in self.engines}
+        pending = set(tasks)
+        rankings: dict[str, list[TextResult]] = {}
+        errors: dict[str, str] = {}
+
+        def update(engine: str | None, final: bool) -> MetaSearchUpdate:
+            return MetaSearchUpdate(
+                engine=engine,
+                results=reciprocal_rank_fusion(rankings, self.k, max_results),
+                completed=list(rankings),
+                pending=[name for task, name in tasks.items() if task in pending],
+                errors=dict(errors),
+                final=final,
+            )
+
+        try:
+            while pending:
+                remaining = end - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                finished = list(done)
+                for i, task in enumerate(finished):
+                    name = tasks[task]
+                    try:
+                        rankings[name] = task.result()
+                    except Exception as e:
+                        errors[name] = str(e) or type(e).__name__
+                    yield update(name, final=not pending and i == len(finished) - 1)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                    errors[tasks[task]] = DEADLINE_EXCEEDED
+                pending = set()
+                yield update(None, final=True)
+            elif not tasks:
+                yield update(None, final=True)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def arun(self, *args: Any, **kwargs: Any) -> list[MetaTextResult]:
+        """Run the metasearch and return the fused results that arrived before the deadline.
+
+        Args:
+            keywords: Search query.
+            region: Region code passed to every engine (each engine's default if omitted).
+            safesearch: on, moderate, or off.
+            max_results: Maximum number of results per engine and after fusion.
+            deadline: Overrides the instance deadline for this call.
+
+        Raises:
+            WebscoutE: If every engine failed.
+        """
+        keywords = args[0] if args else kwargs.get("keywords")
+        region = args[1] if len(args) > 1 else kwargs.get("region")
+        safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
+        max_results = args[3] if len(args) > 3 else kwargs.get("max_results")
+        deadline = kwargs.get("deadline")
+
+        last: MetaSearchUpdate | None = None
+        async for last in self.astream(keywords, region, safesearch, max_results, deadline):
+            pass
+        assert last is not None  # astream always ends with a final update
+        # Running out of time returns an empty list; only outright failures of every engine raise
+        if self.engines and not last.completed and DEADLINE_EXCEEDED not in last.errors.values():
+            details = "; ".join(f"{name}: {error}" for name, error in last.errors.items())
+            raise WebscoutE(f"All engines failed. Errors: {details}")
+        return last.results
+
+    def run(self, *args: Any, **kwargs: Any) -> list[MetaTextResult]:
+        """Blocking wrapper around :meth:`arun`; use ``arun`` inside a running event loop."""
+        return asyncio.run(self.arun(*args, **kwargs))
+
+    def iter_run(self, *args: Any, **kwargs: Any) -> Iterator[MetaTextResult]:
+        """Yield the fused results of :meth:`run`.
+
+        Fusion needs every engine's ranking, so nothing is yielded early; use
+        :meth:`astream` for intermediate snapshots.
+        """
+        yield from self.run(*args, **kwargs)
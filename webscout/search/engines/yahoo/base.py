@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from secrets import token_urlsafe
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from ...base import BaseSearchEngine
 
@@ -18,6 +19,7 @@ class YahooSearchEngine(BaseSearchEngine[T], Generic[T]):
 
     provider = "yahoo"
     _base_url = "https://search.yahoo.com"
+    max_pages = 10  # default page limit of a paginated search
 
     def generate_ylt_token(self) -> str:
         """Generate Yahoo _ylt tracking token."""
@@ -32,3 +34,52 @@ class YahooSearchEngine(BaseSearchEngine[T], Generic[T]):
         ylt = self.generate_ylt_token()
         ylu = self.generate_ylu_token()
         return f"{self._base_url}/{base_path};_ylt={ylt};_ylu={ylu}"
+
+    def iter_search(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        max_results: int | None = None,
+        max_pages: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """Yield post-processed results page by page until ``max_results``.
+
+        Args:
+            query: Search query
+            region: Region code
+            safesearch: Safe search level
+            timelimit: Time filter
+            page: Starting page
+            max_results: Maximum results to yield
+            max_pages: Last page number to fetch (``self.max_pages`` by default)
+            **kwargs: Additional parameters for ``build_payload``
+        """
+        produced = 0
+        for current_page in range(page, (max_pages or self.max_pages) + 1):
+            payload = self.build_payload(
+                query=query,
+                region=region,
+                safesearch=safesearch,
+                timelimit=timelimit,
+                page=current_page,
+                **kwargs
+            )
+
+            html_text = self.request(self.search_method, self.search_url, params=payload)
+            if not html_text:
+                return
+
+            html_text = self.pre_process_html(html_text)
+            page_results = self.extract_results(html_text)
+            if not page_results:
+                return
+
+            for result in self.post_extract_results(page_results):
+                yield result
+                produced += 1
+                if max_results and produced >= max_results:
+                    return
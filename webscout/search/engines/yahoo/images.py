@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from ...results import ImagesResult
@@ -26,6 +26,7 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
 
     name = "yahoo"
     category = "images"
+    max_pages = 5
 
     search_url = "https://images.search.yahoo.com/search/images"
     search_method = "GET"
@@ -238,42 +239,9 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
         Returns:
             List of ImageResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 5)
-
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-
-            if not page_results:
-                break
-
-            results.extend(page_results)
-
-            if max_results and len(results) >= max_results:
-                break
-
-            current_page += 1
-
-        results = self.post_extract_results(results)
-
-        if max_results:
-            results = results[:max_results]
-
+        results = list(self.iter_search(
+            query, region, safesearch, timelimit, page, max_results, kwargs.pop("max_pages", None), **kwargs
+        ))
         return results if results else None
 
     def run(
@@ -306,7 +274,39 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
         Returns:
             List of image result dictionaries.
         """
-        results = self.search(
+        return list(self.iter_run(keywords, region, safesearch, timelimit, size, color, type_image, layout, license_image, max_results))
+
+    def iter_run(
+        self,
+        keywords: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        size: str | None = None,
+        color: str | None = None,
+        type_image: str | None = None,
+        layout: str | None = None,
+        license_image: str | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Yield image results as dictionaries as each page is parsed.
+
+        Args:
+            keywords: Search query.
+            region: Region code.
+            safesearch: Safe search level.
+            timelimit: Time filter.
+            size: Image size filter.
+            color: Color filter.
+            type_image: Image type filter.
+            layout: Layout filter.
+            license_image: License filter.
+            max_results: Maximum number of results.
+
+        Yields:
+            Image result dictionaries.
+        """
+        for result in self.iter_search(
             query=keywords,
             region=region,
             safesearch=safesearch,
@@ -317,7 +317,5 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
             layout=layout,
             license_image=license_image,
             max_results=max_results,
-        )
-        if results is None:
-            return []
-        return [result.to_dict() for result in results]
+        ):
+            yield result.to_dict()
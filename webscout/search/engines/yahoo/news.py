@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from secrets import token_urlsafe
 from typing import Any
 
@@ -188,42 +188,9 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         Returns:
             List of NewsResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 10)
-
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-
-            if not page_results:
-                break
-
-            results.extend(page_results)
-
-            if max_results and len(results) >= max_results:
-                break
-
-            current_page += 1
-
-        results = self.post_extract_results(results)
-
-        if max_results:
-            results = results[:max_results]
-
+        results = list(self.iter_search(
+            query, region, safesearch, timelimit, page, max_results, kwargs.pop("max_pages", None), **kwargs
+        ))
         return results if results else None
 
     def run(
@@ -246,13 +213,33 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         Returns:
             List of news result dictionaries.
         """
-        results = self.search(
+        return list(self.iter_run(keywords, region, safesearch, timelimit, max_results))
+
+    def iter_run(
+        self,
+        keywords: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Yield news results as dictionaries as each page is parsed.
+
+        Args:
+            keywords: Search query.
+            region: Region code.
+            safesearch: Safe search level.
+            timelimit: Time filter.
+            max_results: Maximum number of results.
+
+        Yields:
+            News result dictionaries.
+        """
+        for result in self.iter_search(
             query=keywords,
             region=region,
             safesearch=safesearch,
             timelimit=timelimit,
             max_results=max_results,
-        )
-        if results is None:
-            return []
-        return [result.to_dict() for result in results]
+        ):
+            yield result.to_dict()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 from urllib.parse import unquote_plus
 
+from ...pagination import DEFAULT_WORKERS, Paginator
 from ...results import TextResult
 from .base import YahooSearchEngine
 
@@ -34,8 +35,8 @@ class YahooText(YahooSearchEngine[TextResult]):
     """Yahoo text search engine with full pagination support.
 
     Features:
-    - Multi-page navigation like a human
-    - Automatic next page detection
+    - Concurrent multi-page fetching by predicted ``b=`` offsets
+    - Early stop once enough unique results are collected
     - Clean result extraction
     - Time filter support
     - Region support
@@ -46,6 +47,7 @@ class YahooText(YahooSearchEngine[TextResult]):
 
     search_url = "https://search.yahoo.com/search"
     search_method = "GET"
+    per_page = 7
 
     # XPath selectors for result extraction
     items_xpath = "//div[contains(@class, 'compTitle')]"
@@ -127,10 +129,7 @@ class YahooText(YahooSearchEngine[TextResult]):
         max_results: int | None = None,
         **kwargs: Any,
     ) -> list[TextResult] | None:
-        """Search Yahoo with automatic pagination like a human browser.
-
-        This method automatically follows pagination links to gather results
-        across multiple pages, similar to how a human would browse search results.
+        """Search Yahoo, fetching result pages concurrently.
 
         Args:
             query: Search query string
@@ -139,66 +138,45 @@ class YahooText(YahooSearchEngine[TextResult]):
             timelimit: Time filter (d=day, w=week, m=month, y=year)
             page: Starting page number
             max_results: Maximum number of results to return
-            **kwargs: Additional search parameters
+            **kwargs: Additional search parameters (``max_pages``, ``workers``)
 
         Returns:
-            List of TextResult objects, or None if search fails
+            List of unique TextResult objects, or None if search fails
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 10)  # Limit to prevent infinite loops
-
-        while current_page <= max_pages:
-            # Build payload for current page
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-
-            # Make request
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-
-            # Pre-process HTML
-            html_text = self.pre_process_html(html_text)
-
-            # Extract results from current page
-            page_results = self.extract_results(html_text)
-            if not page_results:
-                break
-
-            results.extend(page_results)
-
-            # Check if we have enough results
-            if max_results and len(results) >= max_results:
-                break
-
-            # Look for next page link
-            tree = self.extract_tree(html_text)
-            next_links = tree.xpath("//a[contains(text(), 'Next') or contains(@class, 'next')]/@href")
-
-            if not next_links:
-                # Try to find numbered page links
-                page_links = tree.xpath(f"//a[contains(text(), '{current_page + 1}')]/@href")
-                if not page_links:
-                    break
-
-            current_page += 1
-
-        # Post-process all results
-        results = self.post_extract_results(results)
-
-        # Trim to max_results if specified
-        if max_results:
-            results = results[:max_results]
-
+        results = list(self.iter_search(query, region, safesearch, timelimit, page, max_results, **kwargs))
         return results if results else None
 
+    def iter_search(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        max_results: int | None = None,
+        max_pages: int | None = None,
+        workers: int = DEFAULT_WORKERS,
+        **kwargs: Any,
+    ) -> Iterator[TextResult]:
+        """Yield unique results page by page, fetching pages concurrently.
+
+        Page offsets (``b=``) are predictable, so the pages needed for
+        ``max_results`` are requested at once through a ``Paginator``
+        instead of following "Next" links one round trip at a time.
+        """
+        max_pages = max_pages or self.max_pages  # Limit to prevent infinite loops
+        if page > max_pages:
+            return iter(())
+        paginator = Paginator(
+            lambda current_page: self.search_page(
+                query, region, safesearch, timelimit, page=current_page, priority=current_page, **kwargs
+            ),
+            per_page=self.per_page,
+            workers=workers,
+            max_pages=max_pages - page + 1,
+        )
+        return paginator.iter(max_results, first_page=page)
+
     def search_page(
         self,
         query: str,
@@ -230,7 +208,8 @@ class YahooText(YahooSearchEngine[TextResult]):
             **kwargs
         )
 
-        html_text = self.request(self.search_method, self.search_url, params=payload)
+        priority = kwargs.get("priority", 0)
+        html_text = self.request(self.search_method, self.search_url, params=payload, priority=priority)
         if not html_text:
             return None
 
@@ -261,13 +240,35 @@ class YahooText(YahooSearchEngine[TextResult]):
         Returns:
             List of search result dictionaries.
         """
-        results = self.search(
+        return list(self.iter_run(keywords, region, safesearch, timelimit, backend, max_results))
+
+    def iter_run(
+        self,
+        keywords: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        backend: str = "auto",
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Yield text results as dictionaries as each page is parsed.
+
+        Args:
+            keywords: Search query.
+            region: Region code.
+            safesearch: Safe search level.
+            timelimit: Time filter.
+            backend: Backend type (ignored for Yahoo).
+            max_results: Maximum number of results.
+
+        Yields:
+            Search result dictionaries.
+        """
+        for result in self.iter_search(
             query=keywords,
             region=region,
             safesearch=safesearch,
             timelimit=timelimit,
             max_results=max_results,
-        )
-        if results is None:
-            return []
-        return [result.to_dict() for result in results]
+        ):
+            yield result.to_dict()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -23,6 +23,7 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
 
     name = "yahoo"
     category = "videos"
+    max_pages = 5
 
     search_url = "https://video.search.yahoo.com/search/video"
     search_method = "GET"
@@ -223,42 +224,9 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
         Returns:
             List of VideoResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 5)
-
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-
-            if not page_results:
-                break
-
-            results.extend(page_results)
-
-            if max_results and len(results) >= max_results:
-                break
-
-            current_page += 1
-
-        results = self.post_extract_results(results)
-
-        if max_results:
-            results = results[:max_results]
-
+        results = list(self.iter_search(
+            query, region, safesearch, timelimit, page, max_results, kwargs.pop("max_pages", None), **kwargs
+        ))
         return results if results else None
 
     def run(
@@ -287,7 +255,35 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
         Returns:
             List of video result dictionaries.
         """
-        results = self.search(
+        return list(self.iter_run(keywords, region, safesearch, timelimit, resolution, duration, license_videos, max_results))
+
+    def iter_run(
+        self,
+        keywords: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        resolution: str | None = None,
+        duration: str | None = None,
+        license_videos: str | None = None,
+        max_results: int | None = None,
+    ) -> Iterator[dict[str, str]]:
+        """Yield video results as dictionaries as each page is parsed.
+
+        Args:
+            keywords: Search query.
+            region: Region code.
+            safesearch: Safe search level.
+            timelimit: Time filter.
+            resolution: Video resolution filter.
+            duration: Video duration filter.
+            license_videos: License filter.
+            max_results: Maximum number of results.
+
+        Yields:
+            Video result dictionaries.
+        """
+        for result in self.iter_search(
             query=keywords,
             region=region,
             safesearch=safesearch,
@@ -296,7 +292,5 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
             duration=duration,
             license_videos=license_videos,
             max_results=max_results,
-        )
-        if results is None:
-            return []
-        return [result.to_dict() for result in results]
+        ):
+            yield result.to_dict()
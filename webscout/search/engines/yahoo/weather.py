@@ -5,10 +5,11 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from ...base import AsyncRunMixin
 from ...http_client import HttpClient
 
 
-class YahooWeather:
+class YahooWeather(AsyncRunMixin):
     """Yahoo weather search using embedded JSON extraction."""
 
     def __init__(self, proxy: str | None = None, timeout: int | None = None, verify: bool = True):
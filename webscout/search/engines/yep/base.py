@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from curl_cffi.requests import Session
-
 from ....litagent import LitAgent
+from ...base import AsyncRunMixin
+from ...http_client import PooledSession
 
 
-class YepBase:
+class YepBase(AsyncRunMixin):
     """Base class for Yep search engines."""
 
     def __init__(
@@ -17,7 +17,7 @@ class YepBase:
     ):
         self.base_url = "https://api.yep.com/fs/2/search"
         self.timeout = timeout
-        self.session = Session(
+        self.session = PooledSession(
             proxies=proxies,
             verify=verify,
             impersonate=impersonate,
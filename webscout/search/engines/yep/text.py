@@ -58,8 +58,13 @@ class YepSearch(YepBase):
             return formatted_results
 
         results = raw_results[1].get('results', [])
+        seen = set()
 
         for result in results:
+            # Same unique-href semantics as the paginated engines
+            if result.get("url", "") in seen:
+                continue
+            seen.add(result.get("url", ""))
             formatted_result = TextResult(
                 title=self._remove_html_tags(result.get("title", "")),
                 href=result.get("url", ""),
@@ -1,9 +1,21 @@
-"""HTTP client for search engines."""
+"""HTTP client for search engines.
+
+Connections are pooled process-wide: ``SessionPool`` keeps one curl_cffi
+session per (host, proxy, verify, impersonation) and reuses it across
+requests and engine instances, so TLS handshakes and HTTP/2 connections
+survive between searches. Sync sessions are per thread (curl handles are not
+thread-safe); async sessions are per event loop.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import weakref
 from random import choice
 from typing import Any, Literal
+from urllib.parse import urlsplit
 
 try:
     import trio  # type: ignore
@@ -13,20 +25,204 @@ except ImportError:
 import curl_cffi.requests
 
 from ..exceptions import RatelimitE, TimeoutE, WebscoutE
+from .ratelimit import RateLimiter, get_rate_limiter
+
+# curl_cffi supported browser impersonations
+IMPERSONATES = (
+    "chrome99", "chrome100", "chrome101", "chrome104", "chrome107", "chrome110",
+    "chrome116", "chrome119", "chrome120", "chrome123", "chrome124", "chrome131", "chrome133a",
+    "chrome99_android", "chrome131_android",
+    "safari15_3", "safari15_5", "safari17_0", "safari17_2_ios", "safari18_0", "safari18_0_ios",
+    "edge99", "edge101",
+    "firefox133", "firefox135",
+)
+
+# Concurrent transfers allowed on one pooled async session
+POOL_MAX_CLIENTS = int(os.getenv("WEBSCOUT_SEARCH_POOL_CLIENTS", "32"))
+
+_PoolKey = tuple  # (host, proxy, verify, impersonate)
+
+
+class SessionPool:
+    """Process-wide curl_cffi sessions keyed by host, proxy, verify and impersonation."""
+
+    def __init__(self, max_clients: int = POOL_MAX_CLIENTS) -> None:
+        self.max_clients = max_clients
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._async: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_PoolKey, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_sessions: list[weakref.ref] = []
+
+    @staticmethod
+    def _key(url: str, proxy: str | None, verify: bool, impersonate: str | None) -> _PoolKey:
+        return (urlsplit(url).netloc.lower(), proxy, verify, impersonate)
+
+    @staticmethod
+    def _session_kwargs(key: _PoolKey) -> dict[str, Any]:
+        _, proxy, verify, impersonate = key
+        return {
+            "proxies": {"http": proxy, "https": proxy} if proxy else None,
+            "verify": verify,
+            # Unpinned sessions still look like a random browser, chosen once per pooled session
+            "impersonate": impersonate or choice(IMPERSONATES),
+        }
+
+    def session(
+        self, url: str, proxy: str | None = None, verify: bool = True, impersonate: str | None = None
+    ) -> curl_cffi.requests.Session:
+        """Return the calling thread's session for the host of ``url``."""
+        sessions = getattr(self._local, "sessions", None)
+        if sessions is None:
+            sessions = self._local.sessions = {}
+        key = self._key(url, proxy, verify, impersonate)
+        session = sessions.get(key)
+        if session is None:
+            session = sessions[key] = curl_cffi.requests.Session(**self._session_kwargs(key))
+            with self._lock:
+                self._sync_sessions = [r for r in self._sync_sessions if r() is not None]
+                self._sync_sessions.append(weakref.ref(session))
+        return session
+
+    def async_session(
+        self, url: str, proxy: str | None = None, verify: bool = True, impersonate: str | None = None
+    ) -> curl_cffi.requests.AsyncSession:
+        """Return the running event loop's async session for the host of ``url``."""
+        loop = asyncio.get_running_loop()
+        key = self._key(url, proxy, verify, impersonate)
+        with self._lock:
+            sessions = self._async.setdefault(loop, {})
+            session = sessions.get(key)
+            if session is None:
+                session = sessions[key] = curl_cffi.requests.AsyncSession(
+                    max_clients=self.max_clients, **self._session_kwargs(key)
+                )
+        return session
+
+    async def aclose(self) -> None:
+        """Close the async sessions of the running event loop."""
+        with self._lock:
+            sessions = self._async.pop(asyncio.get_running_loop(), {})
+        for session in sessions.values():
+            try:
+                await session.close()
+            except Exception:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """Return the number of live pooled sessions and the hosts they serve."""
+        with self._lock:
+            async_hosts = sorted({key[0] for sessions in self._async.values() for key in sessions})
+            async_count = sum(len(sessions) for sessions in self._async.values())
+            sync_count = sum(1 for r in self._sync_sessions if r() is not None)
+        return {"sync_sessions": sync_count, "async_sessions": async_count, "async_hosts": async_hosts}
+
+
+_pool: SessionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Get or create the process-wide session pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SessionPool()
+    return _pool
+
+
+class PooledSession:
+    """Session-like view over the shared pool with per-instance headers and cookies.
+
+    Drop-in for the subset of ``curl_cffi.requests.Session`` the engines use
+    (``headers``, ``cookies``, ``get``/``post``/``request``), plus async
+    ``arequest``/``aget``/``apost``. Cookies received are kept on this object
+    rather than in the shared session, so engines and requests stay isolated.
+
+    Every request first waits for the per-host rate limiter (the process-wide
+    one unless ``limiter`` is given; ``rate_limit=False`` disables it) and
+    reports the response status back to it. A ``priority`` keyword argument
+    orders queued requests, lower first.
+    """
+
+    def __init__(
+        self,
+        headers: dict[str, str] | None = None,
+        proxies: dict[str, str] | str | None = None,
+        timeout: float | None = None,
+        verify: bool = True,
+        impersonate: str | None = None,
+        rate_limit: bool = True,
+        limiter: RateLimiter | None = None,
+    ) -> None:
+        if isinstance(proxies, dict):
+            proxies = proxies.get("https") or proxies.get("http")
+        self.proxy: str | None = proxies
+        self.headers: dict[str, str] = dict(headers or {})
+        self.cookies: dict[str, str] = {}
+        self.timeout = timeout
+        self.verify = verify
+        self.impersonate = impersonate
+        self.pool = get_session_pool()
+        self.limiter: RateLimiter | None = (limiter or get_rate_limiter()) if rate_limit else None
+
+    def _prepare(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        headers = kwargs.pop("headers", None)
+        cookies = kwargs.pop("cookies", None)
+        kwargs["headers"] = {**self.headers, **headers} if headers else self.headers
+        kwargs["cookies"] = {**self.cookies, **cookies} if cookies else self.cookies
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        kwargs["discard_cookies"] = True
+        return kwargs
+
+    def _keep_cookies(self, response: Any) -> Any:
+        if response.cookies:
+            self.cookies.update(dict(response.cookies.items()))
+        return response
+
+    def request(self, method: str, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        priority = kwargs.pop("priority", 0)
+        if self.limiter is not None:
+            self.limiter.acquire(url, priority)
+        session = self.pool.session(url, self.proxy, self.verify, self.impersonate)
+        response = session.request(method, url, **self._prepare(kwargs))
+        if self.limiter is not None:
+            self.limiter.feedback(url, response.status_code)
+        return self._keep_cookies(response)
+
+    def get(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        priority = kwargs.pop("priority", 0)
+        if self.limiter is not None:
+            await self.limiter.aacquire(url, priority)
+        session = self.pool.async_session(url, self.proxy, self.verify, self.impersonate)
+        response = await session.request(method, url, **self._prepare(kwargs))
+        if self.limiter is not None:
+            self.limiter.feedback(url, response.status_code)
+        return self._keep_cookies(response)
+
+    async def aget(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        return await self.arequest("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """Pooled connections outlive this view; nothing to release."""
 
 
 class HttpClient:
     """HTTP client wrapper for search engines."""
 
-    # curl_cffi supported browser impersonations
-    _impersonates = (
-        "chrome99", "chrome100", "chrome101", "chrome104", "chrome107", "chrome110",
-        "chrome116", "chrome119", "chrome120", "chrome123", "chrome124", "chrome131", "chrome133a",
-        "chrome99_android", "chrome131_android",
-        "safari15_3", "safari15_5", "safari17_0", "safari17_2_ios", "safari18_0", "safari18_0_ios",
-        "edge99", "edge101",
-        "firefox133", "firefox135",
-    )
+    _impersonates = IMPERSONATES
 
     def __init__(
         self,
@@ -47,17 +243,8 @@ class HttpClient:
         self.timeout = timeout
         self.verify = verify
 
-        # Choose random browser to impersonate
-        impersonate_browser = choice(self._impersonates)
-
-        # Initialize curl_cffi session
-        self.client = curl_cffi.requests.Session(
-            headers=headers or {},
-            proxies={'http': self.proxy, 'https': self.proxy} if self.proxy else None,
-            timeout=timeout,
-            impersonate=impersonate_browser,
-            verify=verify,
-        )
+        # Connections come from the shared pool; headers and cookies stay per client
+        self.client = PooledSession(headers=headers, proxies=proxy, timeout=timeout, verify=verify)
 
     def request(
         self,
@@ -92,35 +279,75 @@ class HttpClient:
             RatelimitE: Rate limit exceeded.
             WebscoutE: Other request errors.
         """
+        request_kwargs = self._request_kwargs(params, data, json, headers, cookies, timeout, kwargs)
         try:
-            request_kwargs: dict[str, Any] = {
-                "params": params,
-                "headers": headers,
-                "json": json,
-                "timeout": timeout or self.timeout,
-                **kwargs,
-            }
+            resp = self.client.request(method, url, **request_kwargs)
+        except Exception as ex:
+            raise self._wrap_error(url, ex) from ex
+        return self._check(resp)
 
-            if isinstance(cookies, dict):
-                request_kwargs["cookies"] = cookies
+    async def arequest(
+        self,
+        method: Literal["GET", "POST", "HEAD", "OPTIONS", "DELETE", "PUT", "PATCH"],
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
+        json: Any = None,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        timeout: int | None = None,
+        **kwargs: Any,
+    ) -> curl_cffi.requests.Response:
+        """Make HTTP request on the shared async session pool.
 
-            if data is not None:
-                request_kwargs["data"] = data
+        Same arguments, return value and exceptions as :meth:`request`.
+        """
+        request_kwargs = self._request_kwargs(params, data, json, headers, cookies, timeout, kwargs)
+        try:
+            resp = await self.client.arequest(method, url, **request_kwargs)
+        except Exception as ex:
+            raise self._wrap_error(url, ex) from ex
+        return self._check(resp)
 
-            resp = self.client.request(method, url, **request_kwargs)
+    def _request_kwargs(
+        self,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | bytes | None,
+        json: Any,
+        headers: dict[str, str] | None,
+        cookies: dict[str, str] | None,
+        timeout: int | None,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
+        request_kwargs: dict[str, Any] = {
+            "params": params,
+            "headers": headers,
+            "json": json,
+            "timeout": timeout or self.timeout,
+            **kwargs,
+        }
+        if isinstance(cookies, dict):
+            request_kwargs["cookies"] = cookies
+        if data is not None:
+            request_kwargs["data"] = data
+        return request_kwargs
 
-            # Check response status
-            if resp.status_code == 200:
-                return resp
-            elif resp.status_code in (202, 301, 403, 400, 429, 418):
-                raise RatelimitE(f"{resp.url} {resp.status_code} Rate limit")
-            else:
-                raise WebscoutE(f"{resp.url} returned {resp.status_code}")
+    @staticmethod
+    def _check(resp: curl_cffi.requests.Response) -> curl_cffi.requests.Response:
+        if resp.status_code == 200:
+            return resp
+        elif resp.status_code in (202, 301, 403, 400, 429, 418):
+            raise RatelimitE(f"{resp.url} {resp.status_code} Rate limit")
+        else:
+            raise WebscoutE(f"{resp.url} returned {resp.status_code}")
 
-        except Exception as ex:
-            if "time" in str(ex).lower() or "timeout" in str(ex).lower():
-                raise TimeoutE(f"{url} {type(ex).__name__}: {ex}") from ex
-            raise WebscoutE(f"{url} {type(ex).__name__}: {ex}") from ex
+    @staticmethod
+    def _wrap_error(url: str, ex: Exception) -> Exception:
+        if isinstance(ex, WebscoutE):
+            return ex
+        if "time" in str(ex).lower() or "timeout" in str(ex).lower():
+            return TimeoutE(f"{url} {type(ex).__name__}: {ex}")
+        return WebscoutE(f"{url} {type(ex).__name__}: {ex}")
 
     def get(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
         """Make GET request."""
@@ -130,6 +357,14 @@ class HttpClient:
         """Make POST request."""
         return self.request("POST", url, **kwargs)
 
+    async def aget(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        """Make async GET request."""
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
+        """Make async POST request."""
+        return await self.arequest("POST", url, **kwargs)
+
     def set_cookies(self, url: str, cookies: dict[str, str]) -> None:
         """Set cookies for a domain.
 
@@ -140,9 +375,8 @@ class HttpClient:
         self.client.cookies.update(cookies)
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if hasattr(self.client, 'close'):
-            self.client.close()
+        """Close the HTTP client (pooled connections stay open for reuse)."""
+        self.client.close()
 
     def __enter__(self) -> HttpClient:
         """Context manager entry."""
@@ -0,0 +1,131 @@
+"""Concurrent pagination for engines whose result pages have predictable offsets.
+
+Engines such as Bing (``first=``) and Yahoo (``b=``) address result pages by
+offset, so the pages needed for ``max_results`` can be requested at once
+instead of following "next" links one round trip at a time. ``Paginator``
+keeps up to ``workers`` page requests in flight, merges pages strictly in
+page order (so ranking is preserved), drops repeated hrefs and stops as soon
+as ``max_results`` unique results are collected or a page comes back empty.
+Pages not yet started are cancelled; requests still queue behind the
+per-host rate limiter, with later pages at a lower priority.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 4
+
+_executor = ThreadPoolExecutor(thread_name_prefix="webscout-pages")
+
+
+class Paginator(Generic[T]):
+    """Fetch numbered result pages concurrently and merge them in order.
+
+    Args:
+        fetch: Returns the parsed results of a page number (``first_page``
+            upwards); an empty list or None means there are no more pages.
+        per_page: Expected results per page, used to predict the pages needed.
+        key: Deduplication key of a result (its ``href`` by default); None keeps duplicates.
+        workers: Maximum page requests in flight.
+        max_pages: Upper bound on the number of pages fetched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], list[T] | None],
+        per_page: int = 10,
+        key: Callable[[T], Hashable] | None = lambda result: getattr(result, "href", None),
+        workers: int = DEFAULT_WORKERS,
+        max_pages: int = 10,
+    ):
+        self.fetch = fetch
+        self.per_page = max(1, per_page)
+        self.key = key
+        self.workers = max(1, workers)
+        self.max_pages = max(1, max_pages)
+        self.pages_fetched = 0
+
+    def iter(self, max_results: int | None = None, first_page: int = 1) -> Iterator[T]:
+        """Yield unique results in page order as soon as each page can be merged."""
+        wanted = max_results if max_results else self.per_page
+        last_page = first_page + self.max_pages - 1
+        # Pages predicted to be enough; more are added only if duplicates or short pages fall short
+        target = min(last_page, first_page + math.ceil(wanted / self.per_page) - 1)
+        pending: dict[Future, int] = {}
+        done: dict[int, list[T] | None] = {}
+        next_submit = next_merge = first_page
+        seen: set[Hashable] = set()
+        produced = 0
+        try:
+            while next_merge <= last_page:
+                while next_submit <= target and len(pending) < self.workers:
+                    pending[_executor.submit(self.fetch, next_submit)] = next_submit
+                    next_submit += 1
+                if next_merge not in done:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        done[pending.pop(future)] = future.result()
+                        self.pages_fetched += 1
+                    continue
+                page = done.pop(next_merge)
+                next_merge += 1
+                if not page:
+                    return
+                for result in page:
+                    if self.key is not None:
+                        key = self.key(result)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                    yield result
+                    produced += 1
+                    if max_results and produced >= max_results:
+                        return
+                if next_merge > target:
+                    target = min(last_page, target + 1)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def run(self, max_results: int | None = None, first_page: int = 1) -> list[T]:
+        """Return up to ``max_results`` unique results."""
+        return list(self.iter(max_results, first_page))
+
+
+if __name__ == "__main__":
+    # Benchmark: 50 results from a simulated engine with 100ms pages of 10
+    # results (one repeated), sequential "next" link walking vs the paginator.
+    import time
+
+    from .results import TextResult
+
+    def fetch(page: int) -> list[TextResult]:
+        time.sleep(0.1)
+        return [TextResult(title=f"r{i}", href=f"https://example.com/{i}")
+                for i in range((page - 1) * 9, (page - 1) * 9 + 10)]
+
+    start = time.perf_counter()
+    sequential, seen, page = [], set(), 1
+    while len(sequential) < 50:
+        for result in fetch(page):
+            if result.href not in seen:
+                seen.add(result.href)
+                sequential.append(result)
+        page += 1
+    sequential = sequential[:50]
+    walk = time.perf_counter() - start
+
+    paginator = Paginator(fetch, per_page=10, workers=4)
+    start = time.perf_counter()
+    concurrent = paginator.run(50)
+    parallel = time.perf_counter() - start
+    assert [r.href for r in concurrent] == [r.href for r in sequential]
+
+    print(f"sequential  {walk * 1000:7.1f}ms  {page - 1} pages")
+    print(f"paginator   {parallel * 1000:7.1f}ms  {paginator.pages_fetched} pages, {len(concurrent)} results")
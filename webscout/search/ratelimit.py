@@ -0,0 +1,290 @@
+"""Process-wide, per-host rate limiting for search engine requests.
+
+Every request made through ``PooledSession`` (and therefore ``HttpClient``,
+the DuckDuckGo, Bing and Yep bases and every ``BaseSearchEngine``) first
+takes a token from its host's bucket. When a bucket is empty the request is
+queued by priority (lower first, FIFO within a priority) and a single
+dispatcher thread hands out tokens as they refill, to threads and event loops
+alike. The refill rate adapts with AIMD: every successful response raises it
+by ``increase`` requests per second, and a rate-limit answer (429, or 202 as
+DuckDuckGo sends) halves it, at most once per ``cooldown`` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+DEFAULT_RATE = float(os.getenv("WEBSCOUT_SEARCH_RATE", "2"))
+DEFAULT_BURST = int(os.getenv("WEBSCOUT_SEARCH_BURST", "4"))
+DEFAULT_MAX_RATE = float(os.getenv("WEBSCOUT_SEARCH_MAX_RATE", "10"))
+DEFAULT_MIN_RATE = 0.1
+
+# Status codes that mean "slow down"
+RATE_LIMITED_STATUSES = frozenset({202, 429})
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "enqueued")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None):
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+        self.enqueued = time.monotonic()
+
+
+class _Host:
+    __slots__ = ("rate", "tokens", "updated", "queue", "last_decrease",
+                 "granted", "waited", "limited", "max_wait")
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.queue: list[tuple[float, int, _Waiter]] = []
+        self.last_decrease = 0.0
+        self.granted = 0
+        self.waited = 0.0
+        self.limited = 0
+        self.max_wait = 0.0
+
+
+class RateLimiter:
+    """Per-host token buckets with priority queues and AIMD rate control.
+
+    Args:
+        rate: Initial requests per second per host.
+        burst: Requests a host may receive back to back.
+        min_rate: Lower bound of the adaptive rate.
+        max_rate: Upper bound of the adaptive rate.
+        increase: Requests per second added after each successful response.
+        decrease: Factor applied to the rate after a rate-limit response.
+        cooldown: Minimum seconds between two decreases for one host.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = DEFAULT_MAX_RATE,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.rate = max(min_rate, rate)
+        self.burst = max(1, burst)
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, self.rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._hosts: dict[str, _Host] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._dispatcher: threading.Thread | None = None
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Return the bucket key (``host[:port]``) of ``url``."""
+        return urlsplit(url).netloc.lower()
+
+    def _host(self, host: str) -> _Host:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _Host(self.rate, self.burst)
+        return state
+
+    def _refill(self, state: _Host, now: float) -> None:
+        state.tokens = min(self.burst, state.tokens + (now - state.updated) * state.rate)
+        state.updated = now
+
+    def _try_take(self, host: str) -> bool:
+        state = self._host(host)
+        self._refill(state, time.monotonic())
+        if not state.queue and state.tokens >= 1:
+            state.tokens -= 1
+            state.granted += 1
+            return True
+        return False
+
+    def _enqueue(self, host: str, priority: float, waiter: _Waiter) -> None:
+        heapq.heappush(self._host(host).queue, (priority, next(self._seq), waiter))
+        if self._dispatcher is None or not self._dispatcher.is_alive():
+            self._dispatcher = threading.Thread(target=self._dispatch, name="webscout-search-ratelimit", daemon=True)
+            self._dispatcher.start()
+        self._cond.notify()
+
+    def acquire(self, url: str, priority: float = 0) -> float:
+        """Block until a request to the host of ``url`` may be sent.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        host = self.host_of(url)
+        with self._cond:
+            if self._try_take(host):
+                return 0.0
+            waiter = _Waiter()
+            self._enqueue(host, priority, waiter)
+        waiter.event.wait()
+        return time.monotonic() - waiter.enqueued
+
+    async def aacquire(self, url: str, priority: float = 0) -> float:
+        """Async variant of :meth:`acquire` that waits without blocking the event loop."""
+        host = self.host_of(url)
+        with self._cond:
+            if self._try_take(host):
+                return 0.0
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._enqueue(host, priority, waiter)
+        await waiter.future
+        return time.monotonic() - waiter.enqueued
+
+    def _grant(self, host: str, waiter: _Waiter) -> None:
+        """Wake a waiter; called by the dispatcher with the lock held."""
+        if waiter.event is not None:
+            waiter.event.set()
+            return
+
+        def resolve() -> None:
+            if waiter.future.done():  # cancelled while queued: give the token back
+                with self._cond:
+                    self._host(host).tokens += 1
+                    self._cond.notify()
+            else:
+                waiter.future.set_result(None)
+
+        try:
+            waiter.loop.call_soon_threadsafe(resolve)
+        except RuntimeError:  # the loop is closed
+            self._host(host).tokens += 1
+
+    def _dispatch(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                timeout = None
+                for host, state in self._hosts.items():
+                    if not state.queue:
+                        continue
+                    self._refill(state, now)
+                    while state.queue and state.tokens >= 1:
+                        _, _, waiter = heapq.heappop(state.queue)
+                        if waiter.future is not None and waiter.future.done():
+                            continue
+                        state.tokens -= 1
+                        state.granted += 1
+                        waited = now - waiter.enqueued
+                        state.waited += waited
+                        state.max_wait = max(state.max_wait, waited)
+                        self._grant(host, waiter)
+                    if state.queue:
+                        ready_in = (1 - state.tokens) / state.rate
+                        timeout = ready_in if timeout is None else min(timeout, ready_in)
+                self._cond.wait(timeout)
+
+    def feedback(self, url: str, status_code: int) -> None:
+        """Adapt the rate of the host of ``url`` to a response status."""
+        with self._cond:
+            state = self._host(self.host_of(url))
+            if status_code in RATE_LIMITED_STATUSES:
+                state.limited += 1
+                now = time.monotonic()
+                if now - state.last_decrease >= self.cooldown:
+                    state.last_decrease = now
+                    state.rate = max(self.min_rate, state.rate * self.decrease)
+                    state.tokens = min(state.tokens, 0.0)  # back off before the next request
+            elif status_code < 400:
+                state.rate = min(self.max_rate, state.rate + self.increase)
+
+    def set_rate(self, host: str, rate: float) -> None:
+        """Set the current rate of ``host`` in requests per second."""
+        with self._cond:
+            self._host(host.lower()).rate = min(self.max_rate, max(self.min_rate, rate))
+            self._cond.notify()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-host rate, queue depth, grants and wait times."""
+        with self._cond:
+            return {
+                host: {
+                    "rate": round(state.rate, 3),
+                    "queued": len(state.queue),
+                    "granted": state.granted,
+                    "limited": state.limited,
+                    "wait_seconds": round(state.waited, 6),
+                    "max_wait_seconds": round(state.max_wait, 6),
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get or create the process-wide rate limiter."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+    return _limiter
+
+
+if __name__ == "__main__":
+    # Benchmark: 32 threads hammer a local server that answers 429 above 5
+    # requests per second, once without limiting and once through the limiter.
+    from concurrent.futures import ThreadPoolExecutor
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from webscout.search.http_client import PooledSession
+
+    ALLOWED = 5.0
+    REQUESTS = 60
+    window: list[float] = []
+    window_lock = threading.Lock()
+
+    class Server(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with window_lock:
+                now = time.monotonic()
+                window[:] = [t for t in window if now - t < 1.0]
+                limited = len(window) >= ALLOWED
+                window.append(now)
+            self.send_response(429 if limited else 200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    ThreadingHTTPServer.request_queue_size = 128
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Server)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    def run(limiter: RateLimiter | None) -> None:
+        session = PooledSession(timeout=5, rate_limit=limiter is not None, limiter=limiter)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(32) as pool:
+            codes = list(pool.map(lambda _: session.get(url).status_code, range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+        label = "limited" if limiter else "unlimited"
+        print(f"{label:<10} {codes.count(200):3d} ok  {codes.count(429):3d} x 429  in {elapsed:5.2f}s")
+        if limiter:
+            print(f"           {limiter.stats()}")
+
+    run(None)
+    time.sleep(1.1)
+    run(RateLimiter(rate=8, burst=2))
+    server.shutdown()
@@ -0,0 +1,303 @@
+"""
+Response cache for non-streaming chat completions in the Webscout API.
+
+Requests are keyed by a canonical hash of the resolved provider, model,
+messages and sampling parameters. Two backends are available: an in-memory
+LRU and an on-disk SQLite store. Both expire entries after a TTL and evict
+the least recently used entries once ``max_entries`` is exceeded. The cache
+is opt-in (``WEBSCOUT_RESPONSE_CACHE=memory|sqlite``).
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+import orjson
+
+from webscout.Provider.OPENAI.utils import ChatCompletionChunk, Choice, ChoiceDelta
+from webscout.search.cache import SearchCache
+
+from .config import AppConfig
+from .sse import DONE_FRAME, ChunkEncoder
+
+# Request fields that do not influence the generated answer
+_IGNORED_PARAMS = frozenset({"stream", "user"})
+
+
+class CacheBackend(ABC):
+    """Base class for response cache backends."""
+
+    name = "base"
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for ``key`` or ``None``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store ``value`` under ``key``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for this backend."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache with TTL expiry."""
+
+    name = "memory"
+
+    def __init__(self, ttl: float = 3600, max_entries: int = 1000):
+        super().__init__(ttl, max_entries)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return orjson.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        payload = orjson.dumps(value)
+        with self._lock:
+            self._entries[key] = (time.time(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """On-disk cache backed by SQLite, shared across restarts and workers."""
+
+    name = "sqlite"
+
+    def __init__(self, path: Union[str, Path, None] = None, ttl: float = 3600,
+                 max_entries: int = 10000):
+        super().__init__(ttl, max_entries)
+        self.path = Path(path) if path else Path.home() / ".webscout" / "response-cache.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, stored_at = row
+            if now - stored_at > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return orjson.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        payload = orjson.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, now, now),
+            )
+            excess = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class ResponseCache:
+    """Chat completion cache keyed by a canonical request fingerprint.
+
+    Args:
+        backend: Storage backend.
+        deterministic_only: Only cache requests sent with ``temperature == 0``.
+            Sampling at any other temperature is expected to vary between calls.
+    """
+
+    def __init__(self, backend: CacheBackend, deterministic_only: bool = True):
+        self.backend = backend
+        self.deterministic_only = deterministic_only
+
+    @staticmethod
+    def fingerprint(provider_name: str, params: Dict[str, Any]) -> str:
+        """Return a stable hash for a provider call with ``params``."""
+        canonical = {k: v for k, v in params.items() if k not in _IGNORED_PARAMS and v is not None}
+        canonical["provider"] = provider_name
+        return hashlib.sha256(orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def is_cacheable(self, params: Dict[str, Any]) -> bool:
+        """Check whether a request with ``params`` may be served from the cache."""
+        if not self.deterministic_only:
+            return True
+        return params.get("temperature") == 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.backend.get(key)
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        self.backend.set(key, response)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.backend.stats()
+        stats["deterministic_only"] = self.deterministic_only
+        return stats
+
+
+def replay_as_stream(response: Dict[str, Any]) -> Iterator[bytes]:
+    """Replay a cached ``ChatCompletion`` dict as SSE chunk frames.
+
+    Each choice is sent as a role delta, one content delta and a final delta
+    carrying its ``finish_reason``; usage is attached to the last chunk.
+    """
+    encoder = ChunkEncoder(flush_window=0, collect=False)
+    header = {
+        "id": response.get("id", ""),
+        "created": response.get("created", int(time.time())),
+        "model": response.get("model", ""),
+    }
+    choices = response.get("choices") or []
+    for position, choice in enumerate(choices):
+        index = choice.get("index", position)
+        message = choice.get("message") or {}
+        yield encoder.encode(ChatCompletionChunk(**header, choices=[
+            Choice(index=index, delta=ChoiceDelta(role=message.get("role", "assistant"), content=""))
+        ]))
+        if message.get("content") or message.get("tool_calls"):
+            yield encoder.encode(ChatCompletionChunk(**header, choices=[
+                Choice(index=index, delta=ChoiceDelta(
+                    content=message.get("content"), tool_calls=message.get("tool_calls")
+                ))
+            ]))
+        last = position == len(choices) - 1
+        yield encoder.encode(ChatCompletionChunk(
+            **header,
+            choices=[Choice(index=index, delta=ChoiceDelta(), finish_reason=choice.get("finish_reason") or "stop")],
+            usage=response.get("usage") if last else None,
+        ))
+    yield DONE_FRAME
+
+
+# Global cache instance - lazy initialization
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the configured response cache, or ``None`` when caching is disabled."""
+    global _cache
+    backend_name = (AppConfig.response_cache_backend or "").lower()
+    if backend_name in ("", "off", "none", "false", "0"):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                if backend_name == "sqlite":
+                    backend = SQLiteCacheBackend(
+                        AppConfig.response_cache_path,
+                        ttl=AppConfig.response_cache_ttl,
+                        max_entries=AppConfig.response_cache_max_entries,
+                    )
+                else:
+                    backend = MemoryCacheBackend(
+                        ttl=AppConfig.response_cache_ttl,
+                        max_entries=AppConfig.response_cache_max_entries,
+                    )
+                _cache = ResponseCache(backend, deterministic_only=AppConfig.response_cache_deterministic_only)
+    return _cache
+
+
+_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Return the web search result cache, or ``None`` when it is disabled."""
+    global _search_cache
+    backend_name = (AppConfig.search_cache_backend or "").lower()
+    if backend_name in ("", "off", "none", "false", "0"):
+        return None
+    if _search_cache is None:
+        with _cache_lock:
+            if _search_cache is None:
+                path = None
+                if backend_name == "sqlite":
+                    path = AppConfig.search_cache_path or Path.home() / ".webscout" / "search-cache.sqlite3"
+                _search_cache = SearchCache(path, max_entries=AppConfig.search_cache_max_entries)
+    return _search_cache
@@ -28,6 +28,14 @@ class ServerConfig:
         self.auth_required: bool = False
         self.rate_limit_enabled: bool = False
         self.request_logging_enabled: bool = os.getenv("WEBSCOUT_REQUEST_LOGGING", "true").lower() == "true"  # Enable request logging by default
+        self.response_cache_backend: str = os.getenv("WEBSCOUT_RESPONSE_CACHE", "")  # "memory", "sqlite" or empty to disable
+        self.response_cache_ttl: int = int(os.getenv("WEBSCOUT_RESPONSE_CACHE_TTL", "3600"))
+        self.response_cache_max_entries: int = int(os.getenv("WEBSCOUT_RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+        self.response_cache_path: Optional[str] = os.getenv("WEBSCOUT_RESPONSE_CACHE_PATH")
+        self.response_cache_deterministic_only: bool = os.getenv("WEBSCOUT_RESPONSE_CACHE_DETERMINISTIC_ONLY", "true").lower() == "true"
+        self.search_cache_backend: str = os.getenv("WEBSCOUT_SEARCH_CACHE", "")  # "memory", "sqlite" or empty to disable
+        self.search_cache_max_entries: int = int(os.getenv("WEBSCOUT_SEARCH_CACHE_MAX_ENTRIES", "1000"))
+        self.search_cache_path: Optional[str] = os.getenv("WEBSCOUT_SEARCH_CACHE_PATH")
 
     def update(self, **kwargs) -> None:
         """Update configuration with provided values."""
@@ -58,6 +66,14 @@ class AppConfig:
     auth_required: bool = False
     rate_limit_enabled: bool = False
     request_logging_enabled: bool = os.getenv("WEBSCOUT_REQUEST_LOGGING", "true").lower() == "true"  # Enable request logging by default
+    response_cache_backend: str = os.getenv("WEBSCOUT_RESPONSE_CACHE", "")  # "memory", "sqlite" or empty to disable
+    response_cache_ttl: int = int(os.getenv("WEBSCOUT_RESPONSE_CACHE_TTL", "3600"))
+    response_cache_max_entries: int = int(os.getenv("WEBSCOUT_RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+    response_cache_path: Optional[str] = os.getenv("WEBSCOUT_RESPONSE_CACHE_PATH")
+    response_cache_deterministic_only: bool = os.getenv("WEBSCOUT_RESPONSE_CACHE_DETERMINISTIC_ONLY", "true").lower() == "true"
+    search_cache_backend: str = os.getenv("WEBSCOUT_SEARCH_CACHE", "")  # "memory", "sqlite" or empty to disable
+    search_cache_max_entries: int = int(os.getenv("WEBSCOUT_SEARCH_CACHE_MAX_ENTRIES", "1000"))
+    search_cache_path: Optional[str] = os.getenv("WEBSCOUT_SEARCH_CACHE_PATH")
 
     @classmethod
     def set_config(cls, **data):
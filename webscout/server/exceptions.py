@@ -11,6 +11,9 @@ from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
 
 from .request_models import ErrorDetail, ErrorResponse
 
+# Control characters except \n, \r, \t
+_CONTROL_CHARS_RE = re.compile(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
 
 def clean_text(text):
     """Clean text by removing null bytes and control characters except newlines and tabs."""
@@ -21,8 +24,7 @@ def clean_text(text):
     text = text.replace('\x00', '')
 
     # Keep newlines, tabs, and other printable characters, remove other control chars
-    # This regex matches control characters except \n, \r, \t
-    return re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    return _CONTROL_CHARS_RE.sub('', text)
 
 
 class APIError(Exception):
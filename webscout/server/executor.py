@@ -0,0 +1,234 @@
+"""
+Non-blocking provider execution for the Webscout API.
+
+Providers are synchronous (``provider.chat.completions.create`` returns a
+completion or a plain generator), so calling them directly from an ``async def``
+route blocks the event loop for every other client. This module runs provider
+calls on a bounded thread pool per provider and bridges sync generators to
+async iterators, so one slow upstream only occupies its own worker thread.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from litprinter import ic
+
+# Configuration constants
+DEFAULT_PROVIDER_WORKERS = int(os.getenv("WEBSCOUT_PROVIDER_WORKERS", "128"))
+DEFAULT_STREAM_BUFFER = int(os.getenv("WEBSCOUT_STREAM_BUFFER", "64"))
+
+_END = object()
+
+
+class ProviderExecutor:
+    """Run provider calls off the event loop on per-provider thread pools.
+
+    Each provider gets its own ``ThreadPoolExecutor`` capped at
+    ``max_workers_per_provider`` threads, so a provider that hangs can exhaust
+    only its own pool. A streaming request holds one thread of its provider's
+    pool for the lifetime of the stream.
+    """
+
+    def __init__(self, max_workers_per_provider: int = DEFAULT_PROVIDER_WORKERS,
+                 stream_buffer: int = DEFAULT_STREAM_BUFFER):
+        self.max_workers_per_provider = max(1, max_workers_per_provider)
+        self.stream_buffer = max(1, stream_buffer)
+        self._pools: Dict[str, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get_pool(self, provider_name: str) -> ThreadPoolExecutor:
+        """Return the thread pool dedicated to ``provider_name``."""
+        pool = self._pools.get(provider_name)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(provider_name)
+                if pool is None:
+                    pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers_per_provider,
+                        thread_name_prefix=f"webscout-{provider_name}",
+                    )
+                    self._pools[provider_name] = pool
+        return pool
+
+    async def run(self, provider_name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call ``func`` without blocking the event loop.
+
+        Coroutine functions are awaited directly; everything else runs on the
+        provider's pool. An awaitable returned from the pool is awaited too.
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self.get_pool(provider_name), functools.partial(func, *args, **kwargs)
+        )
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def create_completion(self, provider: Any, params: Dict[str, Any],
+                                provider_name: Optional[str] = None) -> Any:
+        """Call ``provider.chat.completions.create`` off the event loop.
+
+        A native ``acreate`` coroutine is preferred when the provider offers one.
+        """
+        provider_name = provider_name or type(provider).__name__
+        completions = provider.chat.completions
+        acreate = getattr(completions, "acreate", None)
+        if acreate is not None and inspect.iscoroutinefunction(acreate):
+            return await acreate(**params)
+        return await self.run(provider_name, completions.create, **params)
+
+    async def iterate(self, provider_name: str, iterable: Any) -> AsyncIterator[Any]:
+        """Iterate ``iterable`` on the provider's pool and yield items asynchronously.
+
+        Items are handed over through an ``asyncio.Queue``. A semaphore of
+        ``stream_buffer`` slots keeps the producer thread at most that many
+        chunks ahead of the consumer. When the consumer stops early (client
+        disconnect or cancellation) the producer thread stops and closes the
+        underlying generator, which releases the upstream connection.
+        """
+        if hasattr(iterable, "__aiter__"):
+            async for item in iterable:
+                yield item
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(self.stream_buffer)
+        stopped = threading.Event()
+
+        def deliver(item: Any, error: Optional[BaseException] = None) -> bool:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+                return True
+            except RuntimeError:
+                # Event loop already closed, nobody is listening anymore.
+                stopped.set()
+                return False
+
+        def pump() -> None:
+            iterator = None
+            try:
+                iterator = iter(iterable)
+                for item in iterator:
+                    while not slots.acquire(timeout=0.5):
+                        if stopped.is_set():
+                            return
+                    if stopped.is_set() or not deliver(item):
+                        return
+                deliver(_END)
+            except BaseException as e:
+                deliver(_END, e)
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    try:
+                        close()
+                    except Exception as e:
+                        ic.configureOutput(prefix='WARNING| ')
+                        ic(f"Error closing {provider_name} stream: {e}")
+
+        future = loop.run_in_executor(self.get_pool(provider_name), pump)
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is _END:
+                    if error is not None:
+                        raise error
+                    break
+                slots.release()
+                yield item
+        finally:
+            stopped.set()
+            slots.release()
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the configured size and current thread count of every pool."""
+        with self._lock:
+            pools = dict(self._pools)
+        return {
+            name: {"max_workers": self.max_workers_per_provider, "threads": len(pool._threads)}
+            for name, pool in pools.items()
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Shut down all provider pools."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+
+# Global executor instance - lazy initialization
+_executor: Optional[ProviderExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_provider_executor() -> ProviderExecutor:
+    """Get or create the process-wide provider executor."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProviderExecutor()
+    return _executor
+
+
+def shutdown_provider_executor(wait: bool = False) -> None:
+    """Shut down the process-wide provider executor, if it was created."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+if __name__ == "__main__":
+    # Load benchmark: N concurrent streams against a fake provider whose
+    # generator blocks (time.sleep) between chunks, like a slow upstream.
+    import sys
+    import time
+
+    STREAMS = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    CHUNKS = 20
+    DELAY = 0.01
+
+    def fake_stream():
+        for i in range(CHUNKS):
+            time.sleep(DELAY)
+            yield i
+
+    async def inline_stream():
+        # Previous behaviour: iterate the sync generator inside the coroutine.
+        return sum(1 for _ in fake_stream())
+
+    async def pooled_stream(executor: ProviderExecutor):
+        count = 0
+        async for _ in executor.iterate("FakeProvider", fake_stream()):
+            count += 1
+        return count
+
+    async def bench(label: str, make) -> None:
+        start = time.perf_counter()
+        counts = await asyncio.gather(*(make() for _ in range(STREAMS)))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<10} {STREAMS} streams, {sum(counts)} chunks in {elapsed:.2f}s "
+              f"({sum(counts) / elapsed:,.0f} chunks/s)")
+
+    async def main():
+        executor = ProviderExecutor(max_workers_per_provider=STREAMS)
+        await bench("inline", inline_stream)
+        await bench("executor", lambda: pooled_stream(executor))
+        executor.shutdown()
+
+    asyncio.run(main())
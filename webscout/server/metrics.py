@@ -0,0 +1,295 @@
+"""
+Prometheus-style metrics for the Webscout API.
+
+Counters and histograms keep plain Python numbers per label set. All
+recording happens on the event loop thread (route handlers and the streaming
+generator), so updates need no locks; the per-chunk hook only bumps an
+integer on the request's ``RequestMetrics`` and the histograms are touched
+once per request.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Latency buckets in seconds, from sub-millisecond lookups to long generations
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+CHUNK_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+RATE_BUCKETS = (1, 5, 10, 20, 40, 80, 160, 320, 640, 1280)
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        values = self._values
+        values[labels] = values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets and optional labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return int(sum(series[:-1])) if series else 0
+
+    def sum(self, *labels: str) -> float:
+        series = self._series.get(labels)
+        return series[-1] if series else 0.0
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {int(cumulative)}"
+                )
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_str} {int(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Register a callable producing extra exposition lines at scrape time."""
+        self._collectors.append(collector)
+
+    def _register(self, metric):
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            try:
+                lines.extend(collector())
+            except Exception:
+                continue
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUESTS = REGISTRY.counter(
+    "webscout_chat_requests_total", "Chat completion requests by outcome.",
+    ("provider", "model", "stream", "status"),
+)
+ERRORS = REGISTRY.counter(
+    "webscout_chat_errors_total", "Chat completion failures by error code.",
+    ("provider", "model", "code"),
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    "webscout_chat_request_duration_seconds", "Total chat completion latency.",
+    ("provider", "model", "stream"),
+)
+TTFT = REGISTRY.histogram(
+    "webscout_chat_time_to_first_token_seconds", "Time until the first streamed chunk.",
+    ("provider", "model"),
+)
+STREAM_CHUNKS = REGISTRY.histogram(
+    "webscout_chat_stream_chunks", "Chunks per streamed response.",
+    ("provider", "model"), buckets=CHUNK_BUCKETS,
+)
+STREAM_RATE = REGISTRY.histogram(
+    "webscout_chat_stream_chunks_per_second", "Chunk rate after the first token of a stream.",
+    ("provider", "model"), buckets=RATE_BUCKETS,
+)
+RESOLVE_LATENCY = REGISTRY.histogram(
+    "webscout_provider_resolve_duration_seconds", "Time spent in resolve_provider_and_model.",
+    ("outcome",),
+)
+PROVIDER_INIT_LATENCY = REGISTRY.histogram(
+    "webscout_provider_init_duration_seconds", "Time spent in get_provider_instance.",
+    ("provider", "outcome"),
+)
+
+
+class RequestMetrics:
+    """Per-request recorder for latency, time to first token and chunk counts.
+
+    Call ``chunk()`` for every streamed chunk and ``finish()`` exactly once.
+    """
+
+    __slots__ = ("provider", "model", "stream", "started", "first_chunk", "chunks", "finished")
+
+    def __init__(self, provider: Optional[str], model: Optional[str], stream: bool):
+        self.provider = provider or "unknown"
+        self.model = model or "unknown"
+        self.stream = "true" if stream else "false"
+        self.started = time.perf_counter()
+        self.first_chunk = 0.0
+        self.chunks = 0
+        self.finished = False
+
+    def chunk(self) -> None:
+        if not self.chunks:
+            self.first_chunk = time.perf_counter()
+        self.chunks += 1
+
+    def finish(self, status: str = "success", code: Optional[str] = None) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        now = time.perf_counter()
+        provider, model = self.provider, self.model
+        REQUESTS.inc(provider, model, self.stream, status)
+        REQUEST_LATENCY.observe(now - self.started, provider, model, self.stream)
+        if code is not None:
+            ERRORS.inc(provider, model, code)
+        if self.chunks:
+            TTFT.observe(self.first_chunk - self.started, provider, model)
+            STREAM_CHUNKS.observe(self.chunks, provider, model)
+            streaming_time = now - self.first_chunk
+            if self.chunks > 1 and streaming_time > 0:
+                STREAM_RATE.observe((self.chunks - 1) / streaming_time, provider, model)
+
+
+def observe_resolve(seconds: float, outcome: str) -> None:
+    RESOLVE_LATENCY.observe(seconds, outcome)
+
+
+def observe_provider_init(provider: str, seconds: float, outcome: str) -> None:
+    PROVIDER_INIT_LATENCY.observe(seconds, provider, outcome)
+
+
+def _executor_collector() -> List[str]:
+    from .executor import _executor
+
+    lines = [
+        "# HELP webscout_provider_pool_threads Worker threads alive in each provider pool.",
+        "# TYPE webscout_provider_pool_threads gauge",
+    ]
+    if _executor is not None:
+        for provider, stats in sorted(_executor.stats().items()):
+            lines.append(f'webscout_provider_pool_threads{{provider="{_escape(provider)}"}} {stats["threads"]}')
+    return lines
+
+
+REGISTRY.add_collector(_executor_collector)
+
+
+def _search_rate_limit_collector() -> List[str]:
+    from webscout.search.ratelimit import _limiter
+
+    series = (
+        ("webscout_search_rate_limit_queue_depth", "gauge", "Search requests waiting for a host token.", "queued"),
+        ("webscout_search_rate_limit_rate", "gauge", "Current adaptive request rate per host (requests/s).", "rate"),
+        ("webscout_search_rate_limit_wait_seconds_total", "counter", "Time search requests spent queued.", "wait_seconds"),
+        ("webscout_search_rate_limit_max_wait_seconds", "gauge", "Longest time a search request spent queued.", "max_wait_seconds"),
+        ("webscout_search_rate_limit_granted_total", "counter", "Search requests let through per host.", "granted"),
+        ("webscout_search_rate_limit_limited_total", "counter", "Rate-limit responses (429/202) per host.", "limited"),
+    )
+    stats = _limiter.stats() if _limiter is not None else {}
+    lines: List[str] = []
+    for name, kind, documentation, field in series:
+        lines.append(f"# HELP {name} {documentation}")
+        lines.append(f"# TYPE {name} {kind}")
+        for host, values in sorted(stats.items()):
+            lines.append(f'{name}{{host="{_escape(host)}"}} {_format_value(values[field])}')
+    return lines
+
+
+REGISTRY.add_collector(_search_rate_limit_collector)
+
+
+if __name__ == "__main__":
+    # Overhead check: per-chunk hook cost and full request recording cost.
+    N = 1_000_000
+    tracker = RequestMetrics("Bench", "bench-model", stream=True)
+    start = time.perf_counter()
+    for _ in range(N):
+        tracker.chunk()
+    per_chunk = (time.perf_counter() - start) / N
+    tracker.finish()
+
+    start = time.perf_counter()
+    for _ in range(100_000):
+        RequestMetrics("Bench", "bench-model", stream=True).finish()
+    per_request = (time.perf_counter() - start) / 100_000
+
+    print(f"chunk():  {per_chunk * 1e9:,.0f} ns")
+    print(f"request:  {per_request * 1e6:,.2f} us")
+    assert STREAM_CHUNKS.count("Bench", "bench-model") == 1
+    assert REQUESTS.value("Bench", "bench-model", "true", "success") == 100_001
+    print(REGISTRY.render()[:400])
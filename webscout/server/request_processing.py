@@ -2,10 +2,10 @@
 Request processing utilities for the Webscout API.
 """
 
-import json
+import asyncio
 import time
 import uuid
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from fastapi.responses import StreamingResponse
 from litprinter import ic
@@ -17,11 +17,15 @@ from webscout.Provider.OPENAI.utils import (
     Choice,
     CompletionUsage,
 )
+from webscout.routing import get_health_router
 
 # from .simple_logger import log_api_request, get_client_ip, generate_request_id
 from .config import AppConfig
 from .exceptions import APIError, clean_text
+from .executor import get_provider_executor
+from .metrics import RequestMetrics
 from .request_models import ChatCompletionRequest, Message
+from .sse import DONE_FRAME, ChunkEncoder, encode_event
 
 
 def get_client_ip(request) -> str:
@@ -83,6 +87,16 @@ async def log_request(request_id: str, ip_address: str, model_used: str, questio
         # Don't raise exception to avoid breaking the main request flow
 
 
+def record_provider_health(tracker: RequestMetrics, success: bool) -> None:
+    """Feed a request outcome into the health router shared with Client and AUTO."""
+    latency = (tracker.first_chunk or time.perf_counter()) - tracker.started
+    router = get_health_router()
+    if success:
+        router.record_success(tracker.provider, tracker.model, latency)
+    else:
+        router.record_failure(tracker.provider, tracker.model, latency)
+
+
 def process_messages(messages: List[Message]) -> List[Dict[str, Any]]:
     """Process and validate chat messages."""
     processed_messages = []
@@ -139,107 +153,89 @@ def prepare_provider_params(chat_request: ChatCompletionRequest, model_name: str
     return params
 
 
+_FLUSH_DUE = object()  # yielded by ``_with_flush_deadline`` when batched text is due
+
+
+async def _with_flush_deadline(chunks: AsyncIterator[Any], encoder: ChunkEncoder) -> AsyncIterator[Any]:
+    """Yield ``chunks``, or ``_FLUSH_DUE`` whenever the next chunk is later than the
+    encoder's flush window, so a stalled provider cannot hold batched text back."""
+    if encoder.flush_window <= 0:
+        async for chunk in chunks:
+            yield chunk
+        return
+    next_chunk = None
+    try:
+        while True:
+            if next_chunk is None:
+                next_chunk = asyncio.ensure_future(chunks.__anext__())
+            done, _ = await asyncio.wait((next_chunk,), timeout=encoder.flush_delay())
+            if not done:
+                yield _FLUSH_DUE
+                continue
+            task, next_chunk = next_chunk, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                return
+            yield chunk
+    finally:
+        if next_chunk is not None:
+            next_chunk.cancel()
+            await asyncio.wait((next_chunk,))
+        await chunks.aclose()
+
+
 async def handle_streaming_response(provider: Any, params: Dict[str, Any], request_id: str,
                                   ip_address: str, question: str, model_name: str, start_time: float,
                                   provider_name: str = None, request_obj=None) -> StreamingResponse:
     """Handle streaming chat completion response."""
-    collected_content = []
+    encoder = ChunkEncoder()
+    tracker = RequestMetrics(provider_name, model_name, stream=True)
 
     async def streaming():
-        nonlocal collected_content
         try:
             ic.configureOutput(prefix='DEBUG| ')
             ic(f"Starting streaming response for request {request_id}")
-            completion_stream = provider.chat.completions.create(**params)
+            executor = get_provider_executor()
+            executor_key = provider_name or type(provider).__name__
+            completion_stream = await executor.create_completion(provider, params, executor_key)
 
             # Check if it's iterable (generator, iterator, or other iterable types)
-            if hasattr(completion_stream, '__iter__') and not isinstance(completion_stream, (str, bytes, dict)):
+            if (
+                hasattr(completion_stream, '__iter__') or hasattr(completion_stream, '__aiter__')
+            ) and not isinstance(completion_stream, (str, bytes, dict)):
                 try:
-                    for chunk in completion_stream:
-                        # Standardize chunk format before sending
-                        if hasattr(chunk, 'model_dump'):  # Pydantic v2
-                            chunk_data = chunk.model_dump(exclude_none=True)
-                        elif hasattr(chunk, 'dict'):  # Pydantic v1
-                            chunk_data = chunk.dict(exclude_none=True)
-                        elif isinstance(chunk, dict):
-                            chunk_data = chunk
-                        else:  # Fallback for unknown chunk types
-                            chunk_data = chunk
-
-                        # Clean text content in the chunk to remove control characters
-                        if isinstance(chunk_data, dict) and 'choices' in chunk_data:
-                            for choice in chunk_data.get('choices', []):
-                                if isinstance(choice, dict):
-                                    # Handle delta for streaming
-                                    if 'delta' in choice and isinstance(choice['delta'], dict) and 'content' in choice['delta']:
-                                        content = choice['delta']['content']
-                                        if content:
-                                            collected_content.append(content)
-                                        choice['delta']['content'] = clean_text(content)
-                                    # Handle message for non-streaming
-                                    elif 'message' in choice and isinstance(choice['message'], dict) and 'content' in choice['message']:
-                                        content = choice['message']['content']
-                                        if content:
-                                            collected_content.append(content)
-                                        choice['message']['content'] = clean_text(content)
-
-                        yield f"data: {json.dumps(chunk_data, ensure_ascii=False)}\n\n"
+                    chunks = executor.iterate(executor_key, completion_stream)
+                    async for chunk in _with_flush_deadline(chunks, encoder):
+                        if chunk is _FLUSH_DUE:
+                            frame = encoder.flush()
+                        else:
+                            tracker.chunk()
+                            # Standardize, clean and serialize the chunk in one pass
+                            frame = encoder.encode(chunk)
+                        if frame:
+                            yield frame
+                    frame = encoder.flush()
+                    if frame:
+                        yield frame
                 except TypeError as te:
                     ic.configureOutput(prefix='ERROR| ')
                     ic(f"Error iterating over completion_stream: {te}")
                     # Fall back to treating as non-generator response
-                    if hasattr(completion_stream, 'model_dump'):
-                        response_data = completion_stream.model_dump(exclude_none=True)
-                    elif hasattr(completion_stream, 'dict'):
-                        response_data = completion_stream.dict(exclude_none=True)
-                    else:
-                        response_data = completion_stream
-
-                    # Clean text content in the response
-                    if isinstance(response_data, dict) and 'choices' in response_data:
-                        for choice in response_data.get('choices', []):
-                            if isinstance(choice, dict):
-                                if 'delta' in choice and isinstance(choice['delta'], dict) and 'content' in choice['delta']:
-                                    content = choice['delta']['content']
-                                    if content:
-                                        collected_content.append(content)
-                                    choice['delta']['content'] = clean_text(content)
-                                elif 'message' in choice and isinstance(choice['message'], dict) and 'content' in choice['message']:
-                                    content = choice['message']['content']
-                                    if content:
-                                        collected_content.append(content)
-                                    choice['message']['content'] = clean_text(content)
-
-                    yield f"data: {json.dumps(response_data, ensure_ascii=False)}\n\n"
+                    tracker.chunk()
+                    yield encoder.encode(completion_stream)
             else:  # Non-generator response
-                if hasattr(completion_stream, 'model_dump'):
-                    response_data = completion_stream.model_dump(exclude_none=True)
-                elif hasattr(completion_stream, 'dict'):
-                    response_data = completion_stream.dict(exclude_none=True)
-                else:
-                    response_data = completion_stream
-
-                # Clean text content in the response
-                if isinstance(response_data, dict) and 'choices' in response_data:
-                    for choice in response_data.get('choices', []):
-                        if isinstance(choice, dict):
-                            if 'delta' in choice and isinstance(choice['delta'], dict) and 'content' in choice['delta']:
-                                content = choice['delta']['content']
-                                if content:
-                                    collected_content.append(content)
-                                choice['delta']['content'] = clean_text(content)
-                            elif 'message' in choice and isinstance(choice['message'], dict) and 'content' in choice['message']:
-                                content = choice['message']['content']
-                                if content:
-                                    collected_content.append(content)
-                                choice['message']['content'] = clean_text(content)
-
-                yield f"data: {json.dumps(response_data, ensure_ascii=False)}\n\n"
+                tracker.chunk()
+                yield encoder.encode(completion_stream)
+            tracker.finish()
+            record_provider_health(tracker, success=True)
 
         except Exception as e:
             ic.configureOutput(prefix='ERROR| ')
             ic(f"Error in streaming response for request {request_id}: {e}")
             error_message = clean_text(str(e))
+            tracker.finish("error", "streaming_error")
+            record_provider_health(tracker, success=False)
             error_data = {
                 "error": {
                     "message": error_message,
@@ -247,7 +243,7 @@ async def handle_streaming_response(provider: Any, params: Dict[str, Any], reque
                     "code": "streaming_error"
                 }
             }
-            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+            yield encoder.flush() + encode_event(error_data)
 
             # Log error request
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -264,11 +260,13 @@ async def handle_streaming_response(provider: Any, params: Dict[str, Any], reque
                 request_obj=request_obj
             )
         finally:
-            yield "data: [DONE]\n\n"
+            # Client went away before the stream finished
+            tracker.finish("cancelled")
+            yield DONE_FRAME
 
             # Log successful streaming request
-            if collected_content:
-                answer = "".join(collected_content)
+            if encoder.collected:
+                answer = "".join(encoder.collected)
                 response_time_ms = int((time.time() - start_time) * 1000)
                 await log_request(
                     request_id=request_id,
@@ -290,10 +288,11 @@ async def handle_non_streaming_response(provider: Any, params: Dict[str, Any],
                                       question: str, model_name: str, provider_name: str = None,
                                       request_obj=None) -> Dict[str, Any]:
     """Handle non-streaming chat completion response."""
+    tracker = RequestMetrics(provider_name, model_name, stream=False)
     try:
         ic.configureOutput(prefix='DEBUG| ')
         ic(f"Starting non-streaming response for request {request_id}")
-        completion = provider.chat.completions.create(**params)
+        completion = await get_provider_executor().create_completion(provider, params, provider_name)
 
         if completion is None:
             # Return a valid OpenAI-compatible error response
@@ -309,6 +308,9 @@ async def handle_non_streaming_response(provider: Any, params: Dict[str, Any],
                 usage=CompletionUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
             ).model_dump(exclude_none=True)
 
+            tracker.finish("error", "empty_response")
+            record_provider_health(tracker, success=False)
+
             # Log error request
             response_time_ms = int((time.time() - start_time) * 1000)
             await log_request(
@@ -351,6 +353,8 @@ async def handle_non_streaming_response(provider: Any, params: Dict[str, Any],
                             answer = content
                         choice['message']['content'] = clean_text(content)
 
+        tracker.finish()
+        record_provider_health(tracker, success=True)
         elapsed = time.time() - start_time
         response_time_ms = int(elapsed * 1000)
         ic.configureOutput(prefix='INFO| ')
@@ -375,6 +379,8 @@ async def handle_non_streaming_response(provider: Any, params: Dict[str, Any],
         ic.configureOutput(prefix='ERROR| ')
         ic(f"Error in non-streaming response for request {request_id}: {e}")
         error_message = clean_text(str(e))
+        tracker.finish("error", "provider_error")
+        record_provider_health(tracker, success=False)
 
         # Log error request
         response_time_ms = int((time.time() - start_time) * 1000)
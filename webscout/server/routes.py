@@ -2,22 +2,30 @@
 API routes for the Webscout server.
 """
 
+import asyncio
 import time
 import uuid
+from typing import Any, AsyncIterator
 
+import orjson
 from fastapi import Body, FastAPI, Query, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from litprinter import ic
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
+from webscout.routing import get_health_router
+from webscout.search.base import astream_results
+from webscout.search.cache import CachedEngine
 from webscout.search.engines import ENGINES
 
+from .cache import get_response_cache, get_search_cache, replay_as_stream
 from .config import AppConfig
 from .exceptions import APIError
+from .metrics import REGISTRY, RequestMetrics, observe_provider_init, observe_resolve
 from .providers import (
     get_provider_instance,
     get_tti_provider_instance,
@@ -31,6 +39,31 @@ from .request_processing import (
     prepare_provider_params,
     process_messages,
 )
+from .sse import DONE_FRAME
+
+
+def _result_default(obj: Any) -> Any:
+    return getattr(obj, "__dict__", None) or str(obj)
+
+
+async def stream_search(searcher: Any, engine: str, type: str, args: tuple, kwargs: dict,
+                        stream_format: str = "ndjson") -> AsyncIterator[bytes]:
+    """Stream search results as NDJSON lines or SSE frames as each page is parsed.
+
+    A failure mid-stream is sent as a final ``{"error": ...}`` item; SSE streams
+    end with ``data: [DONE]``.
+    """
+    def frame(item: Any) -> bytes:
+        payload = orjson.dumps(item, default=_result_default)
+        return b"data: " + payload + b"\n\n" if stream_format == "sse" else payload + b"\n"
+
+    try:
+        async for result in astream_results(searcher, *args, **kwargs):
+            yield frame(result)
+    except Exception as ex:
+        yield frame({"error": f"Error running {engine}.{type}: {ex}"})
+    if stream_format == "sse":
+        yield DONE_FRAME
 
 
 class Api:
@@ -121,14 +154,33 @@ class Api:
         self._register_model_routes()
         self._register_chat_routes()
         self._register_websearch_routes()
+        self._register_cache_routes()
 
     def _register_health_route(self):
-        """Register health check route."""
+        """Register health check and metrics routes."""
         @self.app.get("/monitor/health", include_in_schema=False)
         async def health_check():
             """Health check endpoint for monitoring."""
             return {"status": "healthy", "service": "webscout-api", "version": "0.2.0"}
 
+        @self.app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """Prometheus scrape endpoint."""
+            return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    def _register_cache_routes(self):
+        """Register response cache routes."""
+        @self.app.get(
+            "/v1/cache/stats",
+            tags=["Chat Completions"],
+            description="Hit, miss and eviction counters of the chat completion response cache."
+        )
+        async def cache_stats():
+            cache = get_response_cache()
+            if cache is None:
+                return {"enabled": False}
+            return {"enabled": True, **cache.stats()}
+
     def _register_model_routes(self):
         """Register model listing routes."""
         @self.app.get(
@@ -226,6 +278,15 @@ class Api:
                 "total_providers": len(providers)
             }
 
+        @self.app.get(
+            "/v1/providers/health",
+            tags=["Chat Completions"],
+            description="Rolling success rate, latency and circuit state per provider and model."
+        )
+        async def providers_health():
+            """Get the health router state shared with the Python client."""
+            return {"providers": get_health_router().snapshot()}
+
         @self.app.get(
             "/v1/TTI/models",
             response_model=ModelListResponse,
@@ -333,14 +394,23 @@ class Api:
                 ic(f"Processing chat completion request {request_id} for model: {chat_request.model}")
 
                 # Resolve provider and model
-                provider_class, model_name = resolve_provider_and_model(chat_request.model)
+                resolve_started = time.perf_counter()
+                try:
+                    provider_class, model_name = resolve_provider_and_model(chat_request.model)
+                except Exception:
+                    observe_resolve(time.perf_counter() - resolve_started, "error")
+                    raise
+                observe_resolve(time.perf_counter() - resolve_started, "success")
 
                 # Initialize provider with caching and error handling
+                init_started = time.perf_counter()
                 try:
                     provider = get_provider_instance(provider_class)
+                    observe_provider_init(provider_class.__name__, time.perf_counter() - init_started, "success")
                     ic.configureOutput(prefix='DEBUG| ')
                     ic(f"Using provider instance: {provider_class.__name__}")
                 except Exception as e:
+                    observe_provider_init(provider_class.__name__, time.perf_counter() - init_started, "error")
                     ic.configureOutput(prefix='ERROR| ')
                     ic(f"Failed to initialize provider {provider_class.__name__}: {e}")
                     raise APIError(
@@ -377,6 +447,29 @@ class Api:
                                     break
                         break
 
+                # Serve repeated deterministic requests from the response cache (opt-in)
+                cache = get_response_cache()
+                cache_key = None
+                cache_control = request.headers.get("cache-control", "").lower()
+                if (
+                    cache is not None
+                    and cache.is_cacheable(params)
+                    and "no-cache" not in cache_control
+                    and "no-store" not in cache_control
+                ):
+                    cache_key = cache.fingerprint(provider_class.__name__, params)
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        ic.configureOutput(prefix='INFO| ')
+                        ic(f"Serving request {request_id} from response cache")
+                        RequestMetrics(provider_class.__name__, model_name, chat_request.stream).finish("cache_hit")
+                        headers = {"X-Webscout-Cache": "HIT", "X-Webscout-Cache-Key": cache_key}
+                        if chat_request.stream:
+                            return StreamingResponse(
+                                replay_as_stream(cached), media_type="text/event-stream", headers=headers
+                            )
+                        return JSONResponse(content=cached, headers=headers)
+
                 # Handle streaming vs non-streaming
                 if chat_request.stream:
                     return await handle_streaming_response(
@@ -384,10 +477,21 @@ class Api:
                         provider_class.__name__, request
                     )
                 else:
-                    return await handle_non_streaming_response(
+                    response_data = await handle_non_streaming_response(
                         provider, params, request_id, start_time, client_ip, question, model_name,
                         provider_class.__name__, request
                     )
+                    if cache_key is None:
+                        return response_data
+                    if all(
+                        choice.get("finish_reason") != "error"
+                        for choice in response_data.get("choices", [])
+                    ):
+                        cache.set(cache_key, response_data)
+                    return JSONResponse(
+                        content=response_data,
+                        headers={"X-Webscout-Cache": "MISS", "X-Webscout-Cache-Key": cache_key},
+                    )
 
             except APIError:
                 # Re-raise API errors as-is
@@ -526,46 +630,64 @@ class Api:
             from_: str = Query(None, description="Source language for translate"),
             to: str = Query("en", description="Target language for translate"),
             language: str = Query("en", description="Language for weather"),
+            stream: bool = Query(False, description="Stream results as each page is parsed"),
+            stream_format: str = Query("ndjson", alias="format", description="Stream format: ndjson or sse"),
         ):
             """Unified web search endpoint."""
             github_footer = "If you believe this is a bug, please pull an issue at https://github.com/pyscout/Webscout."
             try:
-                # Dynamically support all engines in ENGINES
-                found = False
-                for category, engines in ENGINES.items():
-                    if engine in engines:
-                        found = True
-                        engine_cls = engines[engine]
-                        searcher = engine_cls()
-                        # Try to call the appropriate method based on 'type'
-                        if hasattr(searcher, "run"):
-                            method = getattr(searcher, "run")
-                            # Some engines may require different params
-                            try:
-                                if type in ("text", "images", "news", "videos"):
-                                    results = method(keywords=q, region=region, safesearch=safesearch, max_results=max_results)
-                                elif type == "suggestions":
-                                    results = method(q, region=region)
-                                elif type == "answers":
-                                    results = method(keywords=q)
-                                elif type == "maps":
-                                    results = method(keywords=q, place=place, street=street, city=city, county=county, state=state, country=country, postalcode=postalcode, latitude=latitude, longitude=longitude, radius=radius, max_results=max_results)
-                                elif type == "translate":
-                                    results = method(keywords=q, from_=from_, to=to)
-                                elif type == "weather":
-                                    results = method(location=q, language=language)
-                                else:
-                                    return {"error": f"{engine} does not support type '{type}'.", "footer": github_footer}
-                                # Try to serialize results if needed
-                                if isinstance(results, list) and results and hasattr(results[0], "__dict__"):
-                                    results = [r.__dict__ for r in results]
-                                return {"engine": engine, "type": type, "results": results}
-                            except Exception as ex:
-                                return {"error": f"Error running {engine}.{type}: {ex}", "footer": github_footer}
-                        else:
-                            return {"error": f"{engine} does not support type '{type}'.", "footer": github_footer}
-                if not found:
+                # Prefer the engine registered for the requested type, then any category it is in
+                engine_cls = ENGINES.get(type, {}).get(engine)
+                if engine_cls is None:
+                    engine_cls = next((engines[engine] for engines in ENGINES.values() if engine in engines), None)
+                if engine_cls is None:
                     return {"error": f"Unknown engine. Use one of: {', '.join(sorted(set(name for cat in ENGINES.values() for name in cat)))}.", "footer": github_footer}
+
+                if not hasattr(engine_cls, "run"):
+                    return {"error": f"{engine} does not support type '{type}'.", "footer": github_footer}
+                search_cache = get_search_cache()
+                if search_cache is not None:
+                    category = type if ENGINES.get(type, {}).get(engine) is engine_cls else next(
+                        name for name, engines in ENGINES.items() if engines.get(engine) is engine_cls
+                    )
+                    searcher = CachedEngine(engine_cls, engine, category, search_cache)
+                else:
+                    searcher = engine_cls()
+                # Some engines may require different params
+                if type in ("text", "images", "news", "videos"):
+                    call_args, call_kwargs = (), dict(keywords=q, region=region, safesearch=safesearch, max_results=max_results)
+                elif type == "suggestions":
+                    call_args, call_kwargs = (q,), dict(region=region)
+                elif type == "answers":
+                    call_args, call_kwargs = (), dict(keywords=q)
+                elif type == "maps":
+                    call_args, call_kwargs = (), dict(keywords=q, place=place, street=street, city=city, county=county, state=state, country=country, postalcode=postalcode, latitude=latitude, longitude=longitude, radius=radius, max_results=max_results)
+                elif type == "translate":
+                    call_args, call_kwargs = (), dict(keywords=q, from_=from_, to=to)
+                elif type == "weather":
+                    call_args, call_kwargs = (), dict(location=q, language=language)
+                else:
+                    return {"error": f"{engine} does not support type '{type}'.", "footer": github_footer}
+                if stream:
+                    if stream_format not in ("ndjson", "sse"):
+                        return {"error": "format must be 'ndjson' or 'sse'.", "footer": github_footer}
+                    return StreamingResponse(
+                        stream_search(searcher, engine, type, call_args, call_kwargs, stream_format),
+                        media_type="application/x-ndjson" if stream_format == "ndjson" else "text/event-stream",
+                    )
+                # arun awaits the shared connection pool (or a worker thread) instead of blocking the loop
+                method = getattr(searcher, "arun", None)
+                if method is None:
+                    async def method(*args, **kwargs):
+                        return await asyncio.to_thread(searcher.run, *args, **kwargs)
+                try:
+                    results = await method(*call_args, **call_kwargs)
+                    # Try to serialize results if needed
+                    if isinstance(results, list) and results and hasattr(results[0], "__dict__"):
+                        results = [r.__dict__ for r in results]
+                    return {"engine": engine, "type": type, "results": results}
+                except Exception as ex:
+                    return {"error": f"Error running {engine}.{type}: {ex}", "footer": github_footer}
             except Exception as e:
                 # Special handling for rate limit errors
                 msg = str(e)
@@ -16,7 +16,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from starlette.responses import HTMLResponse
 
+from webscout.search.http_client import get_session_pool
+
 from .config import AppConfig, ServerConfig
+from .executor import shutdown_provider_executor
 from .providers import initialize_provider_map, initialize_tti_provider_map
 from .routes import Api
 from .ui_templates import LANDING_PAGE_HTML, SWAGGER_CSS
@@ -94,6 +97,11 @@ def create_app():
         if hasattr(app.state, 'startup_event'):
             await app.state.startup_event()
 
+    @app.on_event("shutdown")
+    async def shutdown():
+        shutdown_provider_executor()
+        await get_session_pool().aclose()
+
     # Initialize API routes
     api = Api(app)
     api.register_validation_exception_handler()
@@ -0,0 +1,262 @@
+"""
+Server-sent event encoding for streaming chat completions.
+
+``ChunkEncoder`` turns ``ChatCompletionChunk`` objects (pydantic or the
+``__slots__`` ``FastChatCompletionChunk``) into ready-to-send
+``data: ...`` frames with orjson. The id/object/created/model prefix is rendered
+once per stream and only the choices are serialized per chunk, so the hot path
+never goes through ``model_dump`` or stdlib ``json``.
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from webscout.Provider.OPENAI.utils import CHUNK_TYPES, ChatCompletionChunk
+
+from .exceptions import clean_text
+
+# Configuration constants
+DEFAULT_FLUSH_WINDOW = float(os.getenv("WEBSCOUT_STREAM_FLUSH_MS", "0")) / 1000
+DEFAULT_MAX_BATCH_CHARS = 2048
+
+DONE_FRAME = b"data: [DONE]\n\n"
+
+
+def encode_event(data: Any) -> bytes:
+    """Encode an arbitrary JSON-serializable payload as one SSE frame."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+def _dump_model(obj: Any) -> Any:
+    """Dump a pydantic model (v2 or v1) without ``None`` fields."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(exclude_none=True)
+    if hasattr(obj, "dict"):
+        return obj.dict(exclude_none=True)
+    return obj
+
+
+def _delta_dict(delta: Any) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    if delta.role is not None:
+        out["role"] = delta.role
+    if delta.content is not None:
+        out["content"] = clean_text(delta.content)
+    if delta.function_call is not None:
+        out["function_call"] = _dump_model(delta.function_call)
+    if delta.tool_calls is not None:
+        out["tool_calls"] = [_dump_model(call) for call in delta.tool_calls]
+    return out
+
+
+class ChunkEncoder:
+    """Encode one chat completion stream into SSE frames.
+
+    Create one encoder per stream. ``encode`` returns the bytes to send for a
+    chunk, which may be empty while small content deltas are being batched;
+    ``flush`` returns whatever is still pending and must be called once the
+    upstream stream ends.
+
+    Args:
+        flush_window: Seconds during which consecutive content-only deltas of
+            the same choice are merged into one frame. ``0`` disables batching.
+            Pending text is released by the first chunk that arrives after the
+            window, by a chunk that cannot be merged, or by ``flush``; a caller
+            waiting on a slow upstream calls ``flush`` once ``flush_delay`` elapses.
+        max_batch_chars: Release a batch early once it holds this many characters.
+        collect: Keep the raw content of every delta in ``collected`` (used for
+            request logging).
+    """
+
+    def __init__(self, flush_window: float = DEFAULT_FLUSH_WINDOW,
+                 max_batch_chars: int = DEFAULT_MAX_BATCH_CHARS, collect: bool = True):
+        self.flush_window = flush_window
+        self.max_batch_chars = max_batch_chars
+        self.collect = collect
+        self.collected: List[str] = []
+        self._header: Optional[tuple] = None
+        self._prefix = b""
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._pending_index = 0
+        self._pending_since = 0.0
+
+    def _prefix_for(self, chunk: ChatCompletionChunk) -> bytes:
+        header = (chunk.id, chunk.created, chunk.model, chunk.object)
+        if header != self._header:
+            self._header = header
+            self._prefix = (
+                b'data: {"id":' + orjson.dumps(chunk.id)
+                + b',"object":' + orjson.dumps(chunk.object)
+                + b',"created":' + orjson.dumps(chunk.created)
+                + b',"model":' + orjson.dumps(chunk.model)
+                + b',"choices":'
+            )
+        return self._prefix
+
+    def _frame(self, prefix: bytes, choices: List[Dict[str, Any]],
+               chunk: Optional[ChatCompletionChunk] = None) -> bytes:
+        tail = b"}\n\n"
+        if chunk is not None:
+            if chunk.system_fingerprint is not None:
+                tail = b',"system_fingerprint":' + orjson.dumps(chunk.system_fingerprint) + tail
+            if chunk.usage is not None:
+                tail = b',"usage":' + orjson.dumps(chunk.usage) + tail
+        return prefix + orjson.dumps(choices) + tail
+
+    def _take_pending(self) -> bytes:
+        if not self._pending:
+            return b""
+        text = "".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        return self._frame(self._prefix, [{"index": self._pending_index, "delta": {"content": text}}])
+
+    def _mergeable_content(self, chunk: ChatCompletionChunk) -> Optional[str]:
+        """Return the delta text if ``chunk`` is a plain single-choice content delta."""
+        if chunk.usage is not None or chunk.system_fingerprint is not None or len(chunk.choices) != 1:
+            return None
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if (
+            delta is None or delta.content is None or choice.finish_reason is not None
+            or choice.message is not None or choice.logprobs is not None
+            or delta.role is not None or delta.tool_calls is not None
+            or delta.function_call is not None
+        ):
+            return None
+        return delta.content
+
+    def _encode_chunk(self, chunk: ChatCompletionChunk) -> bytes:
+        choices = []
+        for choice in chunk.choices:
+            out: Dict[str, Any] = {"index": choice.index}
+            if choice.delta is not None:
+                if self.collect and choice.delta.content:
+                    self.collected.append(choice.delta.content)
+                out["delta"] = _delta_dict(choice.delta)
+            if choice.message is not None:
+                message = _dump_model(choice.message)
+                content = message.get("content")
+                if content is not None:
+                    if self.collect and content:
+                        self.collected.append(content)
+                    message["content"] = clean_text(content)
+                out["message"] = message
+            if choice.finish_reason is not None:
+                out["finish_reason"] = choice.finish_reason
+            if choice.logprobs is not None:
+                out["logprobs"] = choice.logprobs
+            choices.append(out)
+        return self._frame(self._prefix_for(chunk), choices, chunk)
+
+    def _encode_generic(self, chunk: Any) -> bytes:
+        """Slow path for dicts and non-chunk objects, mirroring the legacy handling."""
+        data = _dump_model(chunk)
+        if isinstance(data, dict) and "choices" in data:
+            for choice in data.get("choices") or []:
+                if not isinstance(choice, dict):
+                    continue
+                for field in ("delta", "message"):
+                    part = choice.get(field)
+                    if isinstance(part, dict) and "content" in part:
+                        content = part["content"]
+                        if self.collect and content:
+                            self.collected.append(content)
+                        part["content"] = clean_text(content)
+                        break
+        return encode_event(data)
+
+    def _batch(self, chunk: ChatCompletionChunk, text: str) -> bytes:
+        index = chunk.choices[0].index
+        now = time.monotonic()
+        out = b""
+        if self._pending and (
+            index != self._pending_index
+            or (chunk.id, chunk.created, chunk.model, chunk.object) != self._header
+            or now - self._pending_since >= self.flush_window
+            or self._pending_chars >= self.max_batch_chars
+        ):
+            out = self._take_pending()
+        if not self._pending:
+            self._prefix_for(chunk)
+            self._pending_index = index
+            self._pending_since = now
+        if self.collect and text:
+            self.collected.append(text)
+        self._pending.append(clean_text(text))
+        self._pending_chars += len(text)
+        return out
+
+    def encode(self, chunk: Any) -> bytes:
+        """Return the SSE bytes to emit for ``chunk`` (possibly empty while batching)."""
+        if not isinstance(chunk, CHUNK_TYPES):
+            return self._take_pending() + self._encode_generic(chunk)
+
+        if self.flush_window > 0:
+            text = self._mergeable_content(chunk)
+            if text is not None:
+                return self._batch(chunk, text)
+
+        return self._take_pending() + self._encode_chunk(chunk)
+
+    def flush(self) -> bytes:
+        """Return any batched content that has not been emitted yet."""
+        return self._take_pending()
+
+    def flush_delay(self) -> Optional[float]:
+        """Seconds until batched content is due, or None when nothing is pending."""
+        if not self._pending:
+            return None
+        return max(0.0, self._pending_since + self.flush_window - time.monotonic())
+
+
+if __name__ == "__main__":
+    # Microbenchmark: legacy model_dump + json.dumps path vs ChunkEncoder.
+    import json
+    import sys
+
+    from webscout.Provider.OPENAI.utils import (
+        Choice,
+        ChoiceDelta,
+        FastChatCompletionChunk,
+        FastChoice,
+        FastChoiceDelta,
+    )
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    chunks = [
+        ChatCompletionChunk(
+            id="chatcmpl-bench", created=1700000000, model="bench-model",
+            choices=[Choice(index=0, delta=ChoiceDelta(content=f" token{i % 97}"))],
+        )
+        for i in range(N)
+    ]
+    fast_chunks = [
+        FastChatCompletionChunk(
+            id="chatcmpl-bench", created=1700000000, model="bench-model",
+            choices=[FastChoice(index=0, delta=FastChoiceDelta(content=f" token{i % 97}"))],
+        )
+        for i in range(N)
+    ]
+
+    def legacy(chunk):
+        data = chunk.model_dump(exclude_none=True)
+        for choice in data["choices"]:
+            choice["delta"]["content"] = clean_text(choice["delta"]["content"])
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    def bench(label, fn, items=chunks):
+        start = time.perf_counter()
+        for chunk in items:
+            fn(chunk)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22} {N / elapsed:>12,.0f} chunks/s")
+
+    bench("legacy json.dumps", legacy)
+    bench("ChunkEncoder", ChunkEncoder(collect=False).encode)
+    bench("ChunkEncoder (5ms)", ChunkEncoder(flush_window=0.005, collect=False).encode)
+    bench("ChunkEncoder (fast)", ChunkEncoder(collect=False).encode, fast_chunks)